@@ -7,6 +7,8 @@ Code Quality Agent
 import re
 import ast
 import json
+import hashlib
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
@@ -18,6 +20,28 @@ from app.core.config import settings
 from app.core.gemini_client import get_gemini_llm
 
 
+# 복잡도를 증가시키는 패턴들 (파일마다 다시 컴파일하지 않도록 모듈 로드 시 한 번만 컴파일)
+COMPLEXITY_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"\bif\b",           # if문
+    r"\belif\b",         # elif문
+    r"\belse\b",         # else문
+    r"\bfor\b",          # for 루프
+    r"\bwhile\b",        # while 루프
+    r"\btry\b",          # try-catch
+    r"\bexcept\b",       # except
+    r"\bfinally\b",      # finally
+    r"\bswitch\b",       # switch문
+    r"\bcase\b",         # case문
+    r"&&|\|\|",          # 논리 연산자
+    r"\?\s*.*\s*:",      # 삼항 연산자
+    r"\bthrow\b",        # 예외 발생
+    r"\breturn\b.*\bif\b" # 조건부 return
+))
+
+# 중첩 깊이 계산 시 블록 시작으로 보는 키워드 (부분 문자열 포함 여부를 한 번의 검색으로 확인)
+NESTING_KEYWORD_PATTERN = re.compile(r"if|for|while|try|def|class|with")
+
+
 @dataclass
 class QualityState:
     """코드 품질 분석 상태를 관리하는 데이터 클래스"""
@@ -84,6 +108,16 @@ class CodeQualityAgent:
             ]
         }
         
+        # 패턴 시그니처는 한 번만 컴파일
+        self._compiled_pattern_signatures = {
+            pattern_name: [re.compile(signature, re.IGNORECASE | re.MULTILINE) for signature in signatures]
+            for pattern_name, signatures in self.pattern_signatures.items()
+        }
+        
+        # 코드 내용 해시 -> 패턴 감지 결과 (같은 파일이 반복 분석될 때 재검색 생략, LRU)
+        self.pattern_cache_size = 1024
+        self._pattern_cache: "OrderedDict[bytes, Dict[str, Dict[str, float]]]" = OrderedDict()
+        
         # 코드 스멜 패턴들
         self.code_smell_patterns = {
             "long_method": {
@@ -147,14 +181,20 @@ class CodeQualityAgent:
     
     async def detect_patterns(self, code_content: str) -> Dict[str, Dict[str, float]]:
         """단일 코드에서 디자인 패턴 감지"""
+        cache_key = hashlib.blake2b(code_content.encode("utf-8", errors="surrogatepass"), digest_size=16).digest()
+        cached = self._pattern_cache.get(cache_key)
+        if cached is not None:
+            self._pattern_cache.move_to_end(cache_key)
+            return {name: dict(info) for name, info in cached.items()}
+        
         patterns = {}
         
-        for pattern_name, signatures in self.pattern_signatures.items():
+        for pattern_name, signatures in self._compiled_pattern_signatures.items():
             confidence = 0.0
             matches = 0
             
             for signature in signatures:
-                if re.search(signature, code_content, re.IGNORECASE | re.MULTILINE):
+                if signature.search(code_content):
                     matches += 1
                     confidence += 0.3
             
@@ -170,34 +210,19 @@ class CodeQualityAgent:
                     "matches": matches
                 }
         
+        self._pattern_cache[cache_key] = {name: dict(info) for name, info in patterns.items()}
+        if len(self._pattern_cache) > self.pattern_cache_size:
+            self._pattern_cache.popitem(last=False)
+        
         return patterns
     
     async def calculate_complexity(self, code_content: str) -> float:
         """단일 코드의 순환 복잡도 계산"""
         
-        # 복잡도를 증가시키는 패턴들
-        complexity_patterns = [
-            r"\bif\b",           # if문
-            r"\belif\b",         # elif문  
-            r"\belse\b",         # else문
-            r"\bfor\b",          # for 루프
-            r"\bwhile\b",        # while 루프
-            r"\btry\b",          # try-catch
-            r"\bexcept\b",       # except
-            r"\bfinally\b",      # finally
-            r"\bswitch\b",       # switch문
-            r"\bcase\b",         # case문
-            r"&&|\|\|",          # 논리 연산자
-            r"\?\s*.*\s*:",      # 삼항 연산자
-            r"\bthrow\b",        # 예외 발생
-            r"\breturn\b.*\bif\b" # 조건부 return
-        ]
-        
         complexity = 1  # 기본 복잡도
         
-        for pattern in complexity_patterns:
-            matches = len(re.findall(pattern, code_content, re.IGNORECASE))
-            complexity += matches
+        for pattern in COMPLEXITY_PATTERNS:
+            complexity += sum(1 for _ in pattern.finditer(code_content))
         
         # 중첩 레벨 추가 가중치
         nesting_levels = self._calculate_nesting_depth(code_content)
@@ -374,7 +399,7 @@ class CodeQualityAgent:
             indent = len(line) - len(line.lstrip())
             depth = indent // 4  # 4칸 들여쓰기 기준
             
-            if any(keyword in stripped for keyword in ["if", "for", "while", "try", "def", "class", "with"]):
+            if NESTING_KEYWORD_PATTERN.search(stripped):
                 current_depth = depth + 1
                 max_depth = max(max_depth, current_depth)
         
@@ -9,11 +9,16 @@ Enhanced Question Generator Agent
 """
 
 import asyncio
+import hashlib
+import heapq
 import json
 import re
 import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 try:
     import tiktoken
@@ -26,44 +31,31 @@ from app.services.file_importance_analyzer import SmartFileImportanceAnalyzer
 from app.services.file_content_extractor import FileContentExtractor
 
 
-@dataclass
-class EnhancedQuestionState:
-    """향상된 질문 생성 상태 관리"""
-    repo_url: str
-    analysis_data: Optional[Dict[str, Any]] = None
-    prioritized_files: Optional[List[Dict[str, Any]]] = None
-    file_contents: Optional[Dict[str, Any]] = None
-    questions: Optional[List[Dict[str, Any]]] = None
-    token_budget: Optional[Dict[str, Any]] = None
-    difficulty_level: str = "medium"
-    question_types: Optional[List[str]] = None
-    error: Optional[str] = None
-    warnings: Optional[List[str]] = None
+@lru_cache(maxsize=8)
+def _get_encoding(model_name: str):
+    """모델별 tiktoken 인코딩 (BPE 어휘 로딩은 모델당 한 번만 수행)"""
+    return tiktoken.encoding_for_model(model_name)
 
 
-class EnhancedQuestionGenerator:
-    """4차원 분석 결과 기반 향상된 질문 생성기"""
-    
-    def __init__(self, github_token: Optional[str] = None):
-        # 기존 분석 시스템들과 통합
-        self.file_importance_analyzer = SmartFileImportanceAnalyzer()
-        self.file_content_extractor = FileContentExtractor(github_token=github_token)
-        
-        # 토큰 관리 설정 (Gemini 2.0 Flash의 1M 토큰 컨텍스트 활용)
-        self.max_tokens_per_question = 100000  # 질문당 예산 대폭 확대
-        self.token_safety_margin = 10000  # 안전 마진도 확대
-        
-        # tiktoken 인코딩 (GPT-3.5-turbo 기준)
-        self.encoding = None
-        if TIKTOKEN_AVAILABLE:
-            try:
-                self.encoding = tiktoken.encoding_for_model("gpt-3.5-turbo")
-            except Exception as e:
-                print(f"tiktoken 초기화 실패: {e}")
-        
-        # 파일 유형별 특화 프롬프트 템플릿
-        self.specialized_prompts = {
-            "controller": """
+def _split_into_line_chunks(text: str, chunk_size: int) -> List[str]:
+    """텍스트를 줄 경계 기준으로 약 chunk_size 문자 단위 청크로 분할 (이어 붙이면 원문과 동일)"""
+    chunks = []
+    start = 0
+    length = len(text)
+    while start < length:
+        end = start + chunk_size
+        if end < length:
+            newline = text.rfind('\n', start, end)
+            if newline >= start:
+                end = newline + 1
+        chunks.append(text[start:end])
+        start = end
+    return chunks
+
+
+# 파일 유형별 특화 프롬프트 템플릿 (모듈 로드 시 한 번만 구성, 읽기 전용)
+_SPECIALIZED_PROMPTS = MappingProxyType({
+    "controller": """
 이 파일은 HTTP 요청을 처리하는 컨트롤러입니다. 다음 실제 코드 내용을 분석하여 질문을 생성해주세요:
 
 === 컨트롤러 파일 정보 ===
@@ -88,8 +80,8 @@ class EnhancedQuestionGenerator:
 
 실제 함수명, 클래스명, 변수명을 직접 언급하며 구체적인 질문을 생성해주세요.
 """,
-            
-            "model": """
+    
+    "model": """
 이 파일은 데이터 모델을 정의하는 파일입니다. 다음 실제 코드 내용을 분석하여 질문을 생성해주세요:
 
 === 모델 파일 정보 ===
@@ -114,8 +106,8 @@ class EnhancedQuestionGenerator:
 
 실제 모델명, 필드명, 관계 설정을 직접 언급하며 구체적인 질문을 생성해주세요.
 """,
-            
-            "service": """
+    
+    "service": """
 이 파일은 비즈니스 로직을 처리하는 서비스입니다. 다음 실제 코드 내용을 분석하여 질문을 생성해주세요:
 
 === 서비스 파일 정보 ===
@@ -140,8 +132,8 @@ class EnhancedQuestionGenerator:
 
 실제 서비스 클래스명, 메서드명, 처리 로직을 직접 언급하며 구체적인 질문을 생성해주세요.
 """,
-            
-            "configuration": """
+    
+    "configuration": """
 이 파일은 프로젝트 설정을 관리하는 파일입니다. 다음 실제 내용을 분석하여 질문을 생성해주세요:
 
 === 설정 파일 정보 ===
@@ -165,8 +157,8 @@ class EnhancedQuestionGenerator:
 
 실제 설정값, 환경변수명, 의존성 정보를 직접 언급하며 구체적인 질문을 생성해주세요.
 """,
-            
-            "general": """
+    
+    "general": """
 다음은 프로젝트의 주요 파일입니다. 실제 코드 내용을 분석하여 질문을 생성해주세요:
 
 === 파일 정보 ===
@@ -191,14 +183,88 @@ class EnhancedQuestionGenerator:
 
 실제 함수명, 클래스명, 구현 로직을 직접 언급하며 구체적인 질문을 생성해주세요.
 """
-        }
+})
+
+# 난이도별 지시사항
+_DIFFICULTY_INSTRUCTIONS = MappingProxyType({
+    "easy": "초급 개발자 수준에서 기본 개념과 구현 방법에 대해 질문하세요.",
+    "medium": "중급 개발자 수준에서 설계 선택 이유와 고려사항에 대해 질문하세요.",
+    "hard": "고급 개발자 수준에서 최적화, 확장성, 아키텍처 관점에서 심도 있게 질문하세요."
+})
+
+# (파일 유형, 난이도) -> 난이도 지시사항이 채워진 템플릿
+_RENDERED_PROMPTS = MappingProxyType({
+    (file_type, difficulty): template.replace("{difficulty_instruction}", instruction)
+    for file_type, template in _SPECIALIZED_PROMPTS.items()
+    for difficulty, instruction in _DIFFICULTY_INSTRUCTIONS.items()
+})
+
+# 결과의 usage 집계 키 (제공자 응답 usage와 동일한 이름)
+USAGE_KEYS = ("prompt_tokens", "completion_tokens", "cached_tokens")
+
+
+@dataclass(slots=True)
+class TokenizedFile:
+    """한 번 토큰화한 파일 내용 (예산 계산/트렁케이션에서 재인코딩 없이 공유)"""
+    path: str
+    content: str
+    token_count: int
+    token_ids: Optional[List[int]] = None  # tiktoken 미사용 시 None (근사치만 보유)
+    content_mv: Optional[memoryview] = None  # 원문 UTF-8 버퍼 (트렁케이션 시 바이트 오프셋으로 슬라이스)
+
+
+@dataclass
+class EnhancedQuestionState:
+    """향상된 질문 생성 상태 관리"""
+    repo_url: str
+    analysis_data: Optional[Dict[str, Any]] = None
+    prioritized_files: Optional[List[Dict[str, Any]]] = None
+    file_contents: Optional[Dict[str, Any]] = None
+    tokenized_files: Optional[Dict[str, TokenizedFile]] = None
+    questions: Optional[List[Dict[str, Any]]] = None
+    token_budget: Optional[Dict[str, Any]] = None
+    difficulty_level: str = "medium"
+    question_types: Optional[List[str]] = None
+    error: Optional[str] = None
+    warnings: Optional[List[str]] = None
+    usage: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(USAGE_KEYS, 0))
+
+
+class EnhancedQuestionGenerator:
+    """4차원 분석 결과 기반 향상된 질문 생성기"""
+    
+    def __init__(self, github_token: Optional[str] = None):
+        # 기존 분석 시스템들과 통합
+        self.file_importance_analyzer = SmartFileImportanceAnalyzer()
+        self.file_content_extractor = FileContentExtractor(github_token=github_token)
         
-        # 난이도별 지시사항
-        self.difficulty_instructions = {
-            "easy": "초급 개발자 수준에서 기본 개념과 구현 방법에 대해 질문하세요.",
-            "medium": "중급 개발자 수준에서 설계 선택 이유와 고려사항에 대해 질문하세요.",
-            "hard": "고급 개발자 수준에서 최적화, 확장성, 아키텍처 관점에서 심도 있게 질문하세요."
-        }
+        # 토큰 관리 설정 (Gemini 2.0 Flash의 1M 토큰 컨텍스트 활용)
+        self.max_tokens_per_question = 100000  # 질문당 예산 대폭 확대
+        self.token_safety_margin = 10000  # 안전 마진도 확대
+        
+        # 동시에 보낼 수 있는 AI 질문 생성 요청 수 (API rate limit 보호)
+        self.max_concurrent_llm_calls = 5
+        
+        # tiktoken 인코딩 (GPT-3.5-turbo 기준, 인스턴스 간 공유)
+        self.model_name = "gpt-3.5-turbo"
+        self.encoding = None
+        # 내용 해시 -> 토큰 계산 결과 (같은 파일 본문의 반복 인코딩 방지, LRU)
+        self.token_cache_size = 1024
+        # 긴 텍스트는 줄 단위 청크로 나눠 encode_ordinary_batch로 한 번에 인코딩
+        self.batch_encode_threshold = 32_768
+        self.batch_encode_chunk_size = 8_192
+        # 비율 기반 토큰 추정치의 보수적 여유 배수
+        self.token_estimate_margin = 1.1
+        self._token_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        if TIKTOKEN_AVAILABLE:
+            try:
+                self.encoding = _get_encoding(self.model_name)
+            except Exception as e:
+                print(f"tiktoken 초기화 실패: {e}")
+        
+        # 파일 유형별 특화 프롬프트 템플릿 / 난이도별 지시사항 (모듈 상수 공유)
+        self.specialized_prompts = _SPECIALIZED_PROMPTS
+        self.difficulty_instructions = _DIFFICULTY_INSTRUCTIONS
         
         # Gemini 특화 설정
         self.gemini_context_window = 1000000  # 1M 토큰
@@ -210,8 +276,29 @@ class EnhancedQuestionGenerator:
         print(f"  - Gemini 컨텍스트 윈도우: {self.gemini_context_window:,}")
         print(f"  - 파일 크기 제한: 1MB")
     
-    def integrate_smart_file_analysis(self, analysis_data: Dict[str, Any], session_id: Optional[str] = None) -> Dict[str, Any]:
-        """스마트 파일 분석 결과 통합"""
+    async def __aenter__(self):
+        """비동기 컨텍스트 매니저 시작"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """비동기 컨텍스트 매니저 종료 (파일 내용 추출기의 공유 HTTP 세션 정리)"""
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """리소스 정리 (FileContentExtractor의 공유 세션/Redis 연결 닫기)"""
+        await self.file_content_extractor.close()
+    
+    def integrate_smart_file_analysis(
+        self, 
+        analysis_data: Dict[str, Any], 
+        session_id: Optional[str] = None, 
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        스마트 파일 분석 결과 통합
+        
+        limit이 주어지면 상위 limit개 파일만 선택한다 (전체 정렬 대신 heapq.nlargest).
+        """
         
         result = {
             "prioritized_files": [],
@@ -233,7 +320,11 @@ class EnhancedQuestionGenerator:
             f for f in critical_files 
             if not self.file_importance_analyzer.is_excluded_file(f.get("file_path", ""))
         ]
-        sorted_files = sorted(filtered_files, key=lambda x: x.get("importance_score", 0), reverse=True)
+        importance_key = lambda x: x.get("importance_score", 0)
+        if limit is not None:
+            sorted_files = heapq.nlargest(limit, filtered_files, key=importance_key)
+        else:
+            sorted_files = sorted(filtered_files, key=importance_key, reverse=True)
         
         # 우선순위 파일 목록 생성
         for file_info in sorted_files:
@@ -259,8 +350,53 @@ class EnhancedQuestionGenerator:
         
         return result
     
-    def calculate_token_budget(self, files_content: Dict[str, str], max_tokens: int) -> Dict[str, Any]:
-        """토큰 예산 계산"""
+    def _encode_text(self, text: str) -> List[int]:
+        """
+        tiktoken 인코딩 (긴 텍스트는 청크 배치 인코딩)
+        
+        batch 인코딩은 Rust 쪽에서 병렬 처리되어 Python↔Rust 호출 오버헤드가 줄어든다.
+        """
+        if len(text) > self.batch_encode_threshold and hasattr(self.encoding, "encode_ordinary_batch"):
+            chunks = _split_into_line_chunks(text, self.batch_encode_chunk_size)
+            token_ids = []
+            for chunk_ids in self.encoding.encode_ordinary_batch(chunks):
+                token_ids.extend(chunk_ids)
+            return token_ids
+        return self.encoding.encode(text)
+    
+    def tokenize_files(self, files_content: Dict[str, str]) -> Dict[str, TokenizedFile]:
+        """파일별 내용을 한 번만 토큰화 (tiktoken 없으면 토큰 수 근사치만 계산)"""
+        
+        tokenized = {}
+        for file_path, content in files_content.items():
+            if not content:
+                continue
+            token_ids = None
+            content_mv = None
+            if TIKTOKEN_AVAILABLE and self.encoding:
+                try:
+                    token_ids = self._encode_text(content)
+                    content_mv = memoryview(content.encode("utf-8"))
+                except Exception:
+                    token_ids = None
+            token_count = len(token_ids) if token_ids is not None else self.calculate_tokens(content)["token_count"]
+            tokenized[file_path] = TokenizedFile(file_path, content, token_count, token_ids, content_mv)
+        
+        return tokenized
+    
+    def calculate_token_budget(
+        self, 
+        files_content: Dict[str, str], 
+        max_tokens: int, 
+        tokenized_files: Optional[Dict[str, TokenizedFile]] = None
+    ) -> Dict[str, Any]:
+        """
+        토큰 예산 계산
+        
+        tokenized_files가 주어지면 이미 계산된 토큰 수를 재사용한다.
+        그 외 파일은 보정 샘플 1회 인코딩으로 구한 토큰/문자 비율로 보수적으로 추정하고,
+        추정 합계가 예산의 90%를 넘을 때만 경계 부근 파일을 정확히 인코딩한다.
+        """
         
         budget = {
             "total_content_tokens": 0,
@@ -270,21 +406,45 @@ class EnhancedQuestionGenerator:
             "budget_exceeded": False
         }
         
-        # 각 파일의 토큰 수 계산
-        file_tokens = {}
-        total_tokens = 0
+        available_tokens = max_tokens - self.token_safety_margin
         
+        # 각 파일의 토큰 수 계산 (사전 토큰화 결과가 없으면 추정)
+        file_tokens = {}
+        pending_files = []
         for file_path, content in files_content.items():
             if content:
-                token_info = self.calculate_tokens(content)
-                file_tokens[file_path] = token_info["token_count"]
-                total_tokens += token_info["token_count"]
+                if tokenized_files and file_path in tokenized_files:
+                    file_tokens[file_path] = tokenized_files[file_path].token_count
+                else:
+                    pending_files.append(file_path)
+        
+        estimated_files = set(pending_files)
+        if pending_files:
+            ratio = self._calibrate_tokens_per_char(files_content[path] for path in pending_files)
+            for file_path in pending_files:
+                content = files_content[file_path]
+                file_tokens[file_path] = int(len(content) * ratio * self.token_estimate_margin) + 1
+        
+        estimate_limit = available_tokens * 0.9
+        if estimated_files and sum(file_tokens.values()) > estimate_limit:
+            # 예산 경계를 넘는 파일부터는 정확한 토큰 수로 보정 (적은 것부터 누적)
+            running_tokens = 0
+            for file_path, tokens in sorted(file_tokens.items(), key=lambda x: x[1]):
+                if file_path in estimated_files and running_tokens + tokens > estimate_limit:
+                    tokens = self.calculate_tokens(files_content[file_path])["token_count"]
+                    file_tokens[file_path] = tokens
+                    estimated_files.discard(file_path)
+                    if running_tokens + tokens > available_tokens:
+                        break
+                running_tokens += tokens
+        
+        total_tokens = sum(file_tokens.values())
         
         budget["total_content_tokens"] = total_tokens
         budget["token_per_file"] = file_tokens
+        budget["estimated_files"] = sorted(estimated_files)
         
         # 토큰 제한 초과 여부 확인
-        available_tokens = max_tokens - self.token_safety_margin
         budget["available_tokens"] = available_tokens
         
         if total_tokens <= available_tokens:
@@ -356,7 +516,11 @@ class EnhancedQuestionGenerator:
                 total_chars = sum(len(content) for content in content_dict.values())
                 print(f"[QUESTION_GEN] 파일 내용: 전체 {total_files}개, 성공 {success_files}개, 총 {total_chars:,}문자")
                 
-                state.token_budget = self.calculate_token_budget(content_dict, self.max_tokens_per_question)
+                # 파일 내용은 여기서 한 번만 토큰화하고 이후 단계에서 재사용
+                state.tokenized_files = self.tokenize_files(content_dict)
+                state.token_budget = self.calculate_token_budget(
+                    content_dict, self.max_tokens_per_question, state.tokenized_files
+                )
                 print(f"[QUESTION_GEN] 토큰 예산: 총 {state.token_budget.get('total_budget', 0):,} 토큰")
             else:
                 state.warnings.append("파일 내용을 사용할 수 없습니다.")
@@ -397,7 +561,8 @@ class EnhancedQuestionGenerator:
                 "questions": state.questions,
                 "token_budget_info": state.token_budget,
                 "files_analyzed": len(state.prioritized_files) if state.prioritized_files else 0,
-                "warnings": state.warnings
+                "warnings": state.warnings,
+                "usage": state.usage
             }
             
         except Exception as e:
@@ -416,7 +581,8 @@ class EnhancedQuestionGenerator:
                 "error": state.error,
                 "repo_url": state.repo_url,
                 "questions": [],
-                "warnings": state.warnings or []
+                "warnings": state.warnings or [],
+                "usage": state.usage
             }
     
     async def _generate_content_based_questions(
@@ -451,7 +617,8 @@ class EnhancedQuestionGenerator:
         files_to_process = min(question_count, len(valid_files))
         selected_files = valid_files[:files_to_process]
         
-        # 각 파일에 대해 질문 생성
+        # 각 파일의 프롬프트를 먼저 준비 (CPU 작업)
+        prepared = []
         for i, file_info in enumerate(selected_files):
             try:
                 file_path = file_info["file_path"]
@@ -459,10 +626,12 @@ class EnhancedQuestionGenerator:
                 file_content = file_content_info["content"]
                 
                 # 토큰 제한에 맞게 내용 트렁케이션 (Gemini의 긴 컨텍스트 활용)
+                tokenized_file = (state.tokenized_files or {}).get(file_path)
                 truncated_content = self.truncate_content_by_tokens(
                     content=file_content,
                     max_tokens=50000,  # 파일 전체 내용 포함을 위해 대폭 확대
-                    preserve_important_sections=True
+                    preserve_important_sections=True,
+                    tokenized_file=tokenized_file
                 )
                 
                 # 다차원 컨텍스트 생성
@@ -482,8 +651,36 @@ class EnhancedQuestionGenerator:
                     include_metrics=True
                 )
                 
-                # AI 질문 생성
-                ai_response = await self._generate_ai_question(prompt)
+                prepared.append((i, file_info, truncated_content, context, prompt))
+                
+            except Exception as e:
+                state.warnings.append(f"질문 생성 실패 ({file_info.get('file_path')}): {str(e)}")
+                continue
+        
+        # AI 질문 생성 요청은 동시에 보내되, 동시 호출 수는 세마포어로 제한
+        semaphore = asyncio.Semaphore(self.max_concurrent_llm_calls)
+        
+        async def generate_with_limit(prompt: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self._generate_ai_question(prompt)
+        
+        ai_responses = await asyncio.gather(
+            *(generate_with_limit(prompt) for _, _, _, _, prompt in prepared),
+            return_exceptions=True
+        )
+        
+        # 응답을 파일 순서대로 질문으로 변환
+        for (i, file_info, truncated_content, context, prompt), ai_response in zip(prepared, ai_responses):
+            file_path = file_info["file_path"]
+            try:
+                if isinstance(ai_response, Exception):
+                    raise ai_response
+                
+                # 실제 제공자 응답의 토큰 사용량 누적 (품질 필터와 무관하게 소비된 토큰)
+                if ai_response:
+                    response_usage = ai_response.get("usage") or {}
+                    for key in USAGE_KEYS:
+                        state.usage[key] += int(response_usage.get(key) or 0)
                 
                 if ai_response and "question" in ai_response:
                     question = {
@@ -529,10 +726,15 @@ class EnhancedQuestionGenerator:
     ) -> str:
         """파일 유형별 특화 프롬프트 템플릿 반환"""
         
-        template = self.specialized_prompts.get(file_type, self.specialized_prompts["general"])
-        difficulty_instruction = self.difficulty_instructions.get(difficulty, "")
+        if file_type not in self.specialized_prompts:
+            file_type = "general"
+        rendered = _RENDERED_PROMPTS.get((file_type, difficulty))
+        if rendered is not None:
+            return rendered
         
-        # 플레이스홀더를 포함한 템플릿 반환
+        # 알 수 없는 난이도는 지시사항 없이 플레이스홀더를 포함한 템플릿 반환
+        template = self.specialized_prompts[file_type]
+        difficulty_instruction = self.difficulty_instructions.get(difficulty, "")
         return template.replace("{difficulty_instruction}", difficulty_instruction)
     
     def calculate_tokens(self, text: str) -> Dict[str, Any]:
@@ -541,10 +743,16 @@ class EnhancedQuestionGenerator:
         if not text:
             return {"token_count": 0, "text_length": 0, "tokens_per_char_ratio": 0}
         
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cached = self._token_cache.get(key)
+        if cached is not None:
+            self._token_cache.move_to_end(key)
+            return dict(cached)
+        
         token_count = 0
         if TIKTOKEN_AVAILABLE and self.encoding:
             try:
-                tokens = self.encoding.encode(text)
+                tokens = self._encode_text(text)
                 token_count = len(tokens)
             except Exception:
                 # tiktoken 실패 시 근사치 계산 (1 token ≈ 4 characters)
@@ -553,23 +761,50 @@ class EnhancedQuestionGenerator:
             # tiktoken 없을 시 근사치 계산
             token_count = len(text) // 4 + 1
         
-        return {
+        token_info = {
             "token_count": token_count,
             "text_length": len(text),
             "tokens_per_char_ratio": token_count / len(text) if len(text) > 0 else 0
         }
+        
+        self._token_cache[key] = token_info
+        if len(self._token_cache) > self.token_cache_size:
+            self._token_cache.popitem(last=False)
+        
+        return dict(token_info)
     
     def truncate_content_by_tokens(
         self, 
         content: str, 
         max_tokens: int, 
-        preserve_important_sections: bool = True
+        preserve_important_sections: bool = True,
+        tokenized_file: Optional[TokenizedFile] = None
     ) -> str:
-        """토큰 제한에 맞게 내용 트렁케이션"""
+        """
+        토큰 제한에 맞게 내용 트렁케이션
+        
+        같은 내용의 tokenized_file이 주어지면 토큰 수/토큰 ID/UTF-8 버퍼를 재사용한다.
+        """
         
         if not content:
             return content
         
+        if tokenized_file is not None and tokenized_file.content != content:
+            tokenized_file = None
+        if tokenized_file is not None and tokenized_file.token_count <= max_tokens:
+            return content
+        
+        # tiktoken 사용 가능 시 전체를 한 번만 인코딩하고 토큰 배열을 잘라 디코딩
+        if TIKTOKEN_AVAILABLE and self.encoding:
+            try:
+                token_ids = tokenized_file.token_ids if tokenized_file is not None else None
+                content_mv = tokenized_file.content_mv if tokenized_file is not None else None
+                return self._truncate_by_token_ids(
+                    content, max_tokens, preserve_important_sections, token_ids, content_mv
+                )
+            except Exception:
+                pass  # 인코딩 실패 시 줄 단위 트렁케이션으로 대체
+        
         # 현재 토큰 수 확인
         current_tokens = self.calculate_tokens(content)["token_count"]
         if current_tokens <= max_tokens:
@@ -615,6 +850,81 @@ class EnhancedQuestionGenerator:
         
         return result
     
+    def _truncate_by_token_ids(
+        self, 
+        content: str, 
+        max_tokens: int, 
+        preserve_head_and_tail: bool,
+        token_ids: Optional[List[int]] = None,
+        content_mv: Optional[memoryview] = None
+    ) -> str:
+        """
+        토큰 ID 배열 기반 트렁케이션 (인코딩 1회 + 디코딩 최대 2회)
+        
+        preserve_head_and_tail이면 앞부분(import/선언)과 뒷부분(진입점)을 함께 남긴다.
+        잘린 경계는 줄 단위로 정리한다. 토큰화 시 저장한 UTF-8 버퍼(content_mv)가 있으면
+        토큰 경계의 바이트 오프셋으로 원문을 직접 자른다.
+        """
+        if token_ids is None:
+            token_ids = self._encode_text(content)
+        if len(token_ids) <= max_tokens:
+            return content
+        
+        marker = "\n... (content truncated for token limit) ...\n"
+        budget = max_tokens - self.calculate_tokens(marker)["token_count"]
+        if budget <= 0:
+            return marker.strip()
+        
+        tail_budget = budget // 5 if preserve_head_and_tail else 0
+        head_budget = budget - tail_budget
+        
+        if content_mv is not None and hasattr(self.encoding, "decode_bytes"):
+            head, tail = self._slice_content_by_token_bytes(content_mv, token_ids, head_budget, tail_budget)
+            return head + marker + tail
+        
+        head = self.encoding.decode(token_ids[:head_budget])
+        if '\n' in head:
+            head = head[:head.rfind('\n')]
+        
+        tail = ""
+        if tail_budget:
+            tail = self.encoding.decode(token_ids[-tail_budget:])
+            if '\n' in tail:
+                tail = tail[tail.find('\n') + 1:]
+        
+        return head + marker + tail
+    
+    def _slice_content_by_token_bytes(
+        self, 
+        view: memoryview, 
+        token_ids: List[int], 
+        head_budget: int, 
+        tail_budget: int
+    ) -> Tuple[str, str]:
+        """
+        토큰 경계의 바이트 오프셋으로 원문 UTF-8 버퍼를 잘라 앞/뒤 부분 반환
+        
+        토큰을 텍스트로 재조립하지 않고 memoryview 슬라이스에서 바로 디코딩하므로
+        원문과 동일한 문자열을 얻고, 멀티바이트 문자가 잘리면 해당 바이트만 버린다.
+        """
+        raw = view.obj
+        
+        head_end = len(self.encoding.decode_bytes(token_ids[:head_budget]))
+        newline = raw.rfind(b"\n", 0, head_end)
+        if newline >= 0:
+            head_end = newline
+        head = str(view[:head_end], "utf-8", "ignore")
+        
+        tail = ""
+        if tail_budget:
+            tail_start = len(raw) - len(self.encoding.decode_bytes(token_ids[-tail_budget:]))
+            newline = raw.find(b"\n", tail_start)
+            if newline >= 0:
+                tail_start = newline + 1
+            tail = str(view[tail_start:], "utf-8", "ignore")
+        
+        return head, tail
+    
     def prioritize_questions_by_importance(
         self, 
         analysis_data: Dict[str, Any], 
@@ -622,11 +932,9 @@ class EnhancedQuestionGenerator:
     ) -> List[Dict[str, Any]]:
         """중요도 기반 질문 우선순위 결정"""
         
-        integration_result = self.integrate_smart_file_analysis(analysis_data)
-        prioritized_files = integration_result["prioritized_files"]
-        
         # 상위 중요도 파일들 선택
-        selected_files = prioritized_files[:max_questions]
+        integration_result = self.integrate_smart_file_analysis(analysis_data, limit=max_questions)
+        selected_files = integration_result["prioritized_files"]
         
         result = []
         for file_info in selected_files:
@@ -878,6 +1186,17 @@ class EnhancedQuestionGenerator:
         else:
             return "general"
     
+    def _calibrate_tokens_per_char(self, contents, sample_chars: int = 512, max_samples: int = 8) -> float:
+        """파일 앞부분 샘플을 한 번 인코딩하여 토큰/문자 비율 추정"""
+        samples = []
+        for content in contents:
+            samples.append(content[:sample_chars])
+            if len(samples) >= max_samples:
+                break
+        
+        ratio = self.calculate_tokens("".join(samples))["tokens_per_char_ratio"]
+        return ratio if ratio > 0 else 0.25  # 1 token ≈ 4 characters
+    
     def _select_files_within_budget(
         self, 
         file_tokens: Dict[str, int], 
@@ -1058,7 +1377,8 @@ class EnhancedQuestionGenerator:
             if response and "content" in response:
                 return {
                     "question": response["content"].strip(),
-                    "type": "code_analysis"
+                    "type": "code_analysis",
+                    "usage": response.get("usage") or {}
                 }
             
         except Exception as e:
@@ -308,11 +308,16 @@ class RepositoryAnalyzer:
         
         print(f"[DEBUG] 중요도 스코어 상위 {min(target_count, len(sorted_files))}개 파일:")
         
-        for i, (file_path, score) in enumerate(sorted_files[:target_count]):
-            file_info = file_tree_dict.get(file_path)
-            if not file_info:
-                continue
-            
+        candidates = [
+            (file_path, score, file_tree_dict[file_path])
+            for file_path, score in sorted_files[:target_count]
+            if file_path in file_tree_dict
+        ]
+        
+        # 후보 파일 내용을 동시에 수집
+        contents = await client.get_files_content(repo_url, [file_path for file_path, _, _ in candidates])
+        
+        for i, ((file_path, score, file_info), content) in enumerate(zip(candidates, contents)):
             # 중요도 레벨 결정
             if score >= 0.4:
                 importance_level = "critical"
@@ -325,9 +330,6 @@ class RepositoryAnalyzer:
             
             print(f"[DEBUG]   {i+1}. {file_info['name']} (점수: {score:.3f}, 레벨: {importance_level})")
             
-            # 파일 내용 수집
-            content = await client.get_file_content(repo_url, file_path)
-            
             # 내용이 있는 경우 코드 밀도 분석으로 재검증
             if content and self.smart_file_analyzer._is_low_code_density_file(content):
                 print(f"[DEBUG]   {file_info['name']} - 코드 밀도 낮음으로 제외")
@@ -379,15 +381,44 @@ class RepositoryAnalyzer:
             "main.py", "app.py", "index.js", "index.ts", "server.js"
         ]
         
-        # 우선순위 파일들 먼저 수집
-        for file_info in file_tree:
-            if file_info["type"] == "file" and file_info["name"] in priority_files:
-                content = await client.get_file_content(repo_url, file_info["path"])
-                
+        # 우선순위 파일들 먼저 수집 (내용은 동시에 조회)
+        priority_infos = [
+            file_info for file_info in file_tree
+            if file_info["type"] == "file" and file_info["name"] in priority_files
+        ]
+        priority_contents = await client.get_files_content(repo_url, [f["path"] for f in priority_infos])
+        
+        for file_info, content in zip(priority_infos, priority_contents):
+            file_entry = {
+                **file_info,
+                "importance": "important",
+                "selection_reason": "priority_file_fallback"
+            }
+            
+            if content:
+                file_entry["content"] = content
+            else:
+                file_entry["content"] = "# File content not available"
+                file_entry["content_unavailable_reason"] = "api_error_or_binary"
+            
+            important_files.append(file_entry)
+        
+        # 목표 개수에 미달하면 크기 기준으로 소스 파일 추가
+        if len(important_files) < target_count:
+            source_files = [f for f in file_tree if f["type"] == "file" and self._is_source_file(f["name"])]
+            source_files.sort(key=lambda x: x.get("size", 0), reverse=True)
+            
+            existing_paths = {f["path"] for f in important_files}
+            needed_count = target_count - len(important_files)
+            
+            source_infos = [f for f in source_files[:needed_count] if f["path"] not in existing_paths]
+            source_contents = await client.get_files_content(repo_url, [f["path"] for f in source_infos])
+            
+            for file_info, content in zip(source_infos, source_contents):
                 file_entry = {
                     **file_info,
-                    "importance": "important",
-                    "selection_reason": "priority_file_fallback"
+                    "importance": "moderate",
+                    "selection_reason": "size_based_fallback"
                 }
                 
                 if content:
@@ -398,32 +429,6 @@ class RepositoryAnalyzer:
                 
                 important_files.append(file_entry)
         
-        # 목표 개수에 미달하면 크기 기준으로 소스 파일 추가
-        if len(important_files) < target_count:
-            source_files = [f for f in file_tree if f["type"] == "file" and self._is_source_file(f["name"])]
-            source_files.sort(key=lambda x: x.get("size", 0), reverse=True)
-            
-            existing_paths = {f["path"] for f in important_files}
-            needed_count = target_count - len(important_files)
-            
-            for file_info in source_files[:needed_count]:
-                if file_info["path"] not in existing_paths:
-                    content = await client.get_file_content(repo_url, file_info["path"])
-                    
-                    file_entry = {
-                        **file_info,
-                        "importance": "moderate",
-                        "selection_reason": "size_based_fallback"
-                    }
-                    
-                    if content:
-                        file_entry["content"] = content
-                    else:
-                        file_entry["content"] = "# File content not available"
-                        file_entry["content_unavailable_reason"] = "api_error_or_binary"
-                    
-                    important_files.append(file_entry)
-        
         return important_files
     
     def _is_source_file(self, filename: str) -> bool:
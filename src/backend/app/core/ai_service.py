@@ -370,6 +370,8 @@ class AIService:
                     "usage": {
                         "prompt_tokens": usage.get("prompt_tokens", len(prompt.split())),
                         "completion_tokens": usage.get("completion_tokens", len(content.split())),
+                        # OpenAI 호환 응답: 프롬프트 캐시 적중 토큰
+                        "cached_tokens": (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0),
                     },
                 }
     
@@ -391,13 +393,19 @@ class AIService:
             model = genai.GenerativeModel('gemini-2.0-flash')
             response = model.generate_content(prompt)
             
+            # 제공자가 보고한 토큰 수 사용 (메타데이터가 없을 때만 단어 수로 추정)
+            usage_metadata = getattr(response, "usage_metadata", None)
+            prompt_tokens = getattr(usage_metadata, "prompt_token_count", None)
+            completion_tokens = getattr(usage_metadata, "candidates_token_count", None)
+            
             return {
                 "provider": AIProvider.GEMINI_FLASH.value,
                 "model": "gemini-2.0-flash",
                 "content": response.text,
                 "usage": {
-                    "prompt_tokens": len(prompt.split()),
-                    "completion_tokens": len(response.text.split())
+                    "prompt_tokens": prompt_tokens if prompt_tokens is not None else len(prompt.split()),
+                    "completion_tokens": completion_tokens if completion_tokens is not None else len(response.text.split()),
+                    "cached_tokens": getattr(usage_metadata, "cached_content_token_count", 0) or 0
                 }
             }
         except Exception as e:
@@ -0,0 +1,64 @@
+"""
+CSR 배열 기반 중앙성 커널
+
+NetworkX 그래프 객체(dict-of-dict) 대신 CSR 인접 배열(indptr, indices)을 직접 순회하여
+Brandes Betweenness를 계산한다. 큐와 거리/경로 수는 모두 평탄한 리스트로 관리한다.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+
+def betweenness_csr(indptr: Sequence[int], indices: Sequence[int], n: int) -> np.ndarray:
+    """
+    비가중 그래프의 비정규화 Betweenness Centrality (Brandes 알고리즘)
+
+    Args:
+        indptr: CSR 행 포인터 (길이 n + 1)
+        indices: CSR 열 인덱스 (행 v의 이웃은 indices[indptr[v]:indptr[v + 1]])
+        n: 노드 수
+
+    Returns:
+        np.ndarray: 노드별 비정규화 Betweenness. 무방향 그래프(대칭 CSR)는 각 쌍이 두 번 집계된다.
+    """
+    indptr = np.asarray(indptr).tolist()
+    indices = np.asarray(indices).tolist()
+    betweenness = [0.0] * n
+
+    for source in range(n):
+        sigma = [0.0] * n
+        distance = [-1] * n
+        sigma[source] = 1.0
+        distance[source] = 0
+
+        # BFS: order 리스트 자체를 큐로 사용하면 방문 순서(거리 오름차순)가 그대로 남는다
+        order = [source]
+        head = 0
+        while head < len(order):
+            v = order[head]
+            head += 1
+            next_distance = distance[v] + 1
+            sigma_v = sigma[v]
+            for j in range(indptr[v], indptr[v + 1]):
+                w = indices[j]
+                if distance[w] < 0:
+                    distance[w] = next_distance
+                    order.append(w)
+                if distance[w] == next_distance:
+                    sigma[w] += sigma_v
+
+        # 역전파: 선행자 리스트 대신 후속 노드(거리 + 1)를 다시 훑어 의존도를 누적
+        delta = [0.0] * n
+        for w in reversed(order):
+            next_distance = distance[w] + 1
+            accumulated = 0.0
+            for j in range(indptr[w], indptr[w + 1]):
+                v = indices[j]
+                if distance[v] == next_distance:
+                    accumulated += (1.0 + delta[v]) / sigma[v]
+            delta[w] = sigma[w] * accumulated
+            if w != source:
+                betweenness[w] += delta[w]
+
+    return np.array(betweenness)
@@ -5,18 +5,54 @@ NetworkX 라이브러리를 활용한 의존성 그래프 분석 시스템
 package.json, requirements.txt, pom.xml 등 파일 파싱하여 의존성 트리 구성
 """
 
+import hashlib
 import json
 import re
 import xml.etree.ElementTree as ET
 import ast
+import asyncio
 import os
+from concurrent.futures import ProcessPoolExecutor
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set, Tuple
 import networkx as nx
+import numpy as np
+import scipy.sparse
+import scipy.sparse.csgraph
 
+from ._centrality import betweenness_csr
 
-@dataclass
+try:
+    from lxml import etree as lxml_etree
+    XML_ITERPARSE = lxml_etree.iterparse
+    XML_PARSE_ERRORS = (lxml_etree.XMLSyntaxError, ET.ParseError)
+except ImportError:
+    XML_ITERPARSE = ET.iterparse
+    XML_PARSE_ERRORS = (ET.ParseError,)
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# requirements.txt 한 줄: 패키지명(+extras)과 나머지 버전 지정자
+REQUIREMENT_LINE_PATTERN = re.compile(r'^(?P<name>[A-Za-z0-9_.\-]+(?:\[[^\]]*\])?)(?P<spec>.*)')
+
+
+def _betweenness_for_sources(graph: nx.DiGraph, sources: List[str]) -> Dict[str, float]:
+    """주어진 소스 노드들에 대한 비정규화 부분 Betweenness (프로세스 풀 워커용)"""
+    return nx.betweenness_centrality_subset(
+        graph,
+        sources=sources,
+        targets=list(graph.nodes()),
+        normalized=False
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class DependencyNode:
     """의존성 노드 정보"""
     name: str
@@ -25,7 +61,7 @@ class DependencyNode:
     file_source: str  # 어떤 파일에서 발견되었는지
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CentralityMetrics:
     """중앙성 지표"""
     betweenness: Dict[str, float]
@@ -34,10 +70,72 @@ class CentralityMetrics:
     weighted_importance: Dict[str, float]
 
 
-@dataclass
+class DependencyTable(Mapping):
+    """
+    의존성 목록의 SoA(struct-of-arrays) 저장소
+    
+    이름/버전/출처는 리스트로, 의존성 타입은 int8 범주 코드 배열로 보관하고
+    조회 시에만 DependencyNode를 생성하는 읽기 전용 Mapping
+    """
+    
+    __slots__ = ('names', 'versions', 'sources', 'types', 'type_categories', '_index')
+    
+    def __init__(self, names: List[str], versions: List[str],
+                 dependency_types: List[str], sources: List[str]):
+        self.names = names
+        self.versions = versions
+        self.sources = sources
+        self.type_categories: List[str] = []
+        codes = {}
+        for dependency_type in dependency_types:
+            if dependency_type not in codes:
+                codes[dependency_type] = len(self.type_categories)
+                self.type_categories.append(dependency_type)
+        self.types = np.fromiter(
+            (codes[t] for t in dependency_types), dtype=np.int8, count=len(dependency_types)
+        )
+        self._index = {name: i for i, name in enumerate(names)}
+    
+    @classmethod
+    def from_graph(cls, graph: nx.DiGraph) -> 'DependencyTable':
+        """NetworkX 노드 속성으로부터 테이블 구성"""
+        names, versions, types, sources = [], [], [], []
+        for name, attrs in graph.nodes(data=True):
+            names.append(name)
+            versions.append(attrs.get('version', 'unknown'))
+            types.append(attrs.get('type', 'production'))
+            sources.append(attrs.get('source', 'unknown'))
+        return cls(names, versions, types, sources)
+    
+    def count_type(self, dependency_type: str) -> int:
+        """특정 의존성 타입의 개수"""
+        if dependency_type not in self.type_categories:
+            return 0
+        return int(np.count_nonzero(self.types == self.type_categories.index(dependency_type)))
+    
+    def __getitem__(self, name: str) -> DependencyNode:
+        i = self._index[name]
+        return DependencyNode(
+            name=name,
+            version=self.versions[i],
+            dependency_type=self.type_categories[self.types[i]],
+            file_source=self.sources[i]
+        )
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+    
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+@dataclass(slots=True, frozen=True)
 class DependencyGraph:
     """의존성 그래프 결과"""
-    dependencies: Dict[str, DependencyNode]
+    dependencies: Mapping[str, DependencyNode]
     centrality_metrics: CentralityMetrics
     total_dependencies: int
     production_count: int
@@ -48,8 +146,29 @@ class DependencyGraph:
 class DependencyAnalyzer:
     """의존성 그래프 분석기"""
     
-    def __init__(self):
-        """초기화"""
+    # 그래프 구조별 중앙성 계산 결과 캐시 최대 개수
+    CENTRALITY_CACHE_SIZE = 32
+    # 이 크기 미만의 방향 그래프는 NetworkX 대신 밀집 행렬로 Betweenness 계산
+    SMALL_GRAPH_NODE_LIMIT = 8
+    # 이 크기 이상의 그래프만 CSR 배열 Brandes 커널로 Betweenness 계산 (그 미만은 NetworkX 기본 경로)
+    CSR_BETWEENNESS_NODE_LIMIT = 500
+    
+    def __init__(self, chunk_size: Optional[int] = None, n_jobs: Optional[int] = None):
+        """
+        초기화
+        
+        Args:
+            chunk_size: Betweenness 계산 시 한 번에 처리할 소스 노드 수.
+                None이면 NetworkX 기본 경로로 전체를 한 번에 계산
+            n_jobs: Betweenness 소스 청크를 병렬로 처리할 프로세스 수.
+                None 또는 1이면 단일 프로세스로 계산
+        """
+        self.chunk_size = chunk_size
+        self.n_jobs = n_jobs
+        # 절대 경로 -> (mtime_ns, size, sha1, 파싱 결과)
+        self._manifest_cache: Dict[str, Tuple[int, int, str, Dict[str, Dict[str, str]]]] = {}
+        # 그래프 구조 해시 -> 중앙성 지표
+        self._centrality_cache: Dict[bytes, Dict[str, Dict[str, float]]] = {}
         self.supported_files = {
             "package.json": self._parse_package_json,
             "requirements.txt": self._parse_requirements_txt,
@@ -58,6 +177,15 @@ class DependencyAnalyzer:
             "go.mod": self._parse_go_mod
         }
     
+    def reset(self) -> None:
+        """
+        매니페스트/중앙성 캐시를 비워 새로 생성한 인스턴스와 같은 상태로 복원
+        
+        인스턴스를 여러 분석(또는 테스트) 간에 재사용할 때 호출한다.
+        """
+        self._manifest_cache.clear()
+        self._centrality_cache.clear()
+    
     async def analyze_dependencies(self, repo_path: str) -> DependencyGraph:
         """
         저장소의 의존성을 분석하여 그래프 구성
@@ -69,7 +197,7 @@ class DependencyAnalyzer:
             DependencyGraph: 의존성 분석 결과
         """
         # 1. 의존성 파일 탐색 및 파싱
-        all_dependencies = self._find_dependency_files(repo_path)
+        all_dependencies = await self._find_dependency_files(repo_path)
         
         if not all_dependencies:
             return DependencyGraph(
@@ -80,33 +208,24 @@ class DependencyAnalyzer:
                 development_count=0
             )
         
-        # 2. NetworkX 그래프 구성
+        # 2. NetworkX 그래프 구성 (구조 해시는 중앙성/깊이 가중치 계산에서 공유)
         graph = self._build_dependency_graph(all_dependencies)
+        graph_key = self._graph_structure_key(graph)
         
         # 3. 중앙성 지표 계산
-        centrality_metrics = self._calculate_centrality_metrics(graph)
+        centrality_metrics = self._calculate_centrality_metrics(graph, graph_key)
         
         # 4. 깊이별 가중치 적용
-        weighted_metrics = self._apply_depth_weights(graph)
+        weighted_metrics = self._apply_depth_weights(graph, graph_key)
         centrality_metrics.update(weighted_metrics)
         
-        # 5. DependencyNode 객체들 생성
-        dependency_nodes = {}
-        for name, attrs in graph.nodes(data=True):
-            dependency_nodes[name] = DependencyNode(
-                name=name,
-                version=attrs.get('version', 'unknown'),
-                dependency_type=attrs.get('type', 'production'),
-                file_source=attrs.get('source', 'unknown')
-            )
+        # 5. 의존성 테이블 구성 (DependencyNode는 조회 시 생성)
+        dependency_nodes = DependencyTable.from_graph(graph)
         
         # 6. 통계 계산
-        production_count = sum(1 for node in dependency_nodes.values() 
-                             if node.dependency_type == 'production')
-        development_count = sum(1 for node in dependency_nodes.values() 
-                              if node.dependency_type == 'development')
-        test_count = sum(1 for node in dependency_nodes.values() 
-                        if node.dependency_type == 'test')
+        production_count = dependency_nodes.count_type('production')
+        development_count = dependency_nodes.count_type('development')
+        test_count = dependency_nodes.count_type('test')
         
         return DependencyGraph(
             dependencies=dependency_nodes,
@@ -122,29 +241,79 @@ class DependencyAnalyzer:
             test_count=test_count
         )
     
-    def _find_dependency_files(self, repo_path: str) -> Dict[str, Any]:
-        """저장소에서 의존성 파일들을 찾아 파싱"""
+    async def _find_dependency_files(self, repo_path: str) -> Dict[str, Any]:
+        """
+        저장소에서 의존성 파일들을 찾아 파싱
+        
+        각 매니페스트는 스레드에서 동시에 읽고 파싱하며,
+        결과는 supported_files 순서대로 병합한다.
+        """
         all_dependencies = {}
-        repo_path = Path(repo_path)
-        
-        for filename, parser in self.supported_files.items():
-            file_path = repo_path / filename
-            if file_path.exists():
-                try:
-                    dependencies = parser(str(file_path))
-                    all_dependencies.update(dependencies)
-                except Exception as e:
-                    print(f"Error parsing {filename}: {e}")
-                    continue
+        
+        # 파일마다 exists()로 stat하는 대신 루트 디렉토리를 한 번만 스캔
+        try:
+            with os.scandir(repo_path) as entries:
+                found = {entry.name: entry.path for entry in entries
+                         if entry.name in self.supported_files and entry.is_file()}
+        except OSError:
+            return all_dependencies
+        
+        targets = [
+            (filename, parser, found[filename])
+            for filename, parser in self.supported_files.items()
+            if filename in found
+        ]
+        
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._parse_with_cache, file_path, parser)
+              for _, parser, file_path in targets),
+            return_exceptions=True
+        )
+        
+        for (filename, _, _), dependencies in zip(targets, results):
+            if isinstance(dependencies, Exception):
+                print(f"Error parsing {filename}: {dependencies}")
+                continue
+            all_dependencies.update(dependencies)
         
         return all_dependencies
     
+    def _parse_with_cache(self, file_path: str, parser) -> Dict[str, Dict[str, str]]:
+        """
+        매니페스트 파싱 결과를 경로 + mtime + 내용 해시로 캐시
+        
+        mtime/크기가 같으면 바로 반환하고, 달라졌더라도 내용 해시가 같으면 재파싱하지 않는다.
+        """
+        abs_path = os.path.abspath(file_path)
+        try:
+            stat = os.stat(abs_path)
+        except OSError:
+            return parser(file_path)
+        
+        cached = self._manifest_cache.get(abs_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return dict(cached[3])
+        
+        with open(abs_path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        
+        if cached and cached[2] == digest:
+            parsed = cached[3]
+        else:
+            parsed = parser(file_path)
+        
+        self._manifest_cache[abs_path] = (stat.st_mtime_ns, stat.st_size, digest, parsed)
+        return dict(parsed)
+    
     def _parse_package_json(self, file_path: str) -> Dict[str, Dict[str, str]]:
         """package.json 파일 파싱"""
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        
+        # orjson.JSONDecodeError와 json.JSONDecodeError 모두 ValueError의 하위 클래스
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except json.JSONDecodeError:
+            data = json_loads(raw)
+        except ValueError:
             raise ValueError("Invalid JSON format in package.json")
         
         dependencies = {}
@@ -172,77 +341,66 @@ class DependencyAnalyzer:
         dependencies = {}
         
         with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                # 버전 정보 파싱 (name==version, name>=version 등)
-                match = re.match(r'^([a-zA-Z0-9_-]+(?:\[[^\]]*\])?)(.*)', line)
-                if match:
-                    name = match.group(1)
-                    version_part = match.group(2).strip()
-                    
-                    # 버전 정보가 있으면 전체 유지, 없으면 'latest'
-                    version = version_part if version_part else 'latest'
-                    
-                    dependencies[name] = {
-                        'version': version,
-                        'type': 'production',
-                        'source': 'requirements.txt'
-                    }
+            lines = f.read().splitlines()
+        
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            # 버전 정보 파싱 (name==version, name>=version 등)
+            match = REQUIREMENT_LINE_PATTERN.match(line)
+            if match:
+                # 버전 정보가 있으면 전체 유지, 없으면 'latest'
+                dependencies[match.group('name')] = {
+                    'version': match.group('spec').strip() or 'latest',
+                    'type': 'production',
+                    'source': 'requirements.txt'
+                }
         
         return dependencies
     
     def _parse_pom_xml(self, file_path: str) -> Dict[str, Dict[str, str]]:
-        """pom.xml 파일 파싱"""
+        """
+        pom.xml 파일 파싱
+        
+        iterparse로 스트리밍하며 처리가 끝난 <dependency> 요소는 바로 비워
+        대형 멀티 모듈 pom에서도 메모리 사용량을 일정하게 유지한다.
+        lxml이 설치되어 있으면 lxml, 없으면 xml.etree를 사용한다.
+        """
         dependencies = {}
+        # 현재 열려 있는 요소들의 로컬 태그명 (네임스페이스 제거)
+        path = []
         
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            # XML 네임스페이스 처리
-            namespace = {'maven': 'http://maven.apache.org/POM/4.0.0'}
-            if root.tag.startswith('{'):
-                namespace_uri = root.tag.split('}')[0][1:]
-                namespace = {'maven': namespace_uri}
-            
-            # dependencies 섹션 찾기
-            deps_section = root.find('.//maven:dependencies', namespace)
-            if deps_section is None:
-                deps_section = root.find('.//dependencies')  # 네임스페이스 없이 시도
-            
-            if deps_section is not None:
-                for dep in deps_section.findall('.//maven:dependency', namespace):
-                    if dep is None:
-                        dep = deps_section.find('.//dependency')  # 네임스페이스 없이 시도
+            with open(file_path, 'rb') as f:
+                for event, elem in XML_ITERPARSE(f, events=('start', 'end')):
+                    tag = elem.tag.rsplit('}', 1)[-1] if isinstance(elem.tag, str) else ''
                     
-                    artifact_id = dep.find('.//maven:artifactId', namespace)
-                    version = dep.find('.//maven:version', namespace)
-                    scope = dep.find('.//maven:scope', namespace)
+                    if event == 'start':
+                        path.append(tag)
+                        continue
                     
-                    if artifact_id is None:
-                        artifact_id = dep.find('.//artifactId')
-                    if version is None:
-                        version = dep.find('.//version')
-                    if scope is None:
-                        scope = dep.find('.//scope')
+                    path.pop()
+                    # 빌드 플러그인의 의존성은 프로젝트 의존성이 아니므로 제외
+                    if tag != 'dependency' or not path or path[-1] != 'dependencies' or 'plugin' in path:
+                        continue
                     
-                    if artifact_id is not None:
-                        name = artifact_id.text
-                        version_text = version.text if version is not None else 'unknown'
-                        scope_text = scope.text if scope is not None else 'compile'
-                        
-                        dep_type = 'test' if scope_text == 'test' else 'production'
-                        
+                    fields = {}
+                    for child in elem:
+                        if isinstance(child.tag, str):
+                            fields[child.tag.rsplit('}', 1)[-1]] = (child.text or '').strip()
+                    elem.clear()
+                    
+                    name = fields.get('artifactId')
+                    if name:
+                        scope_text = fields.get('scope') or 'compile'
                         dependencies[name] = {
-                            'version': version_text,
-                            'type': dep_type,
+                            'version': fields.get('version') or 'unknown',
+                            'type': 'test' if scope_text == 'test' else 'production',
                             'source': 'pom.xml'
                         }
-            
-        except ET.ParseError:
+        except XML_PARSE_ERRORS:
             raise ValueError("Invalid XML format in pom.xml")
         
         return dependencies
@@ -322,8 +480,36 @@ class DependencyAnalyzer:
         
         return graph
     
-    def _calculate_centrality_metrics(self, graph: nx.DiGraph) -> Dict[str, Dict[str, float]]:
-        """중앙성 지표 계산"""
+    def _get_csr_adjacency(
+        self, graph: nx.DiGraph, graph_key: Optional[bytes] = None
+    ) -> Tuple[scipy.sparse.csr_array, List[str]]:
+        """
+        그래프의 CSR 인접 행렬과 노드 순서를 반환 (graph.graph에 캐시)
+        
+        캐시는 구조 해시(_graph_structure_key)로 검증하므로 노드/엣지 수가 같더라도
+        엣지가 바뀌면 다시 구성한다. 이미 계산한 해시가 있으면 graph_key로 전달한다.
+        """
+        if graph_key is None:
+            graph_key = self._graph_structure_key(graph)
+        
+        cached = graph.graph.get('csr_adjacency')
+        if cached is not None and cached[0] == graph_key:
+            return cached[1], cached[2]
+        
+        nodelist = list(graph.nodes())
+        adjacency = nx.to_scipy_sparse_array(graph, nodelist=nodelist, weight=None, dtype=float, format='csr')
+        graph.graph['csr_adjacency'] = (graph_key, adjacency, nodelist)
+        return adjacency, nodelist
+    
+    def _calculate_centrality_metrics(
+        self, graph: nx.DiGraph, graph_key: Optional[bytes] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        중앙성 지표 계산
+        
+        같은 구조(노드/엣지 집합)의 그래프는 이전 계산 결과를 재사용한다.
+        구조 해시는 한 번만 계산하여 각 지표의 CSR 인접 행렬 조회에 전달한다.
+        """
         metrics = {}
         
         if graph.number_of_nodes() == 0:
@@ -333,25 +519,42 @@ class DependencyAnalyzer:
                 'pagerank': {}
             }
         
+        # 엣지가 없으면 모든 경로 기반 지표가 0이고 PageRank는 균등 분배
+        if graph.number_of_edges() == 0:
+            uniform = 1.0 / graph.number_of_nodes()
+            return {
+                'betweenness': dict.fromkeys(graph.nodes(), 0.0),
+                'closeness': dict.fromkeys(graph.nodes(), 0.0),
+                'pagerank': dict.fromkeys(graph.nodes(), uniform)
+            }
+        
+        if graph_key is None:
+            graph_key = self._graph_structure_key(graph)
+        cached = self._centrality_cache.get(graph_key)
+        if cached is not None:
+            return {name: dict(values) for name, values in cached.items()}
+        
         try:
             # Betweenness Centrality (중개 중앙성)
-            metrics['betweenness'] = nx.betweenness_centrality(graph)
+            if graph.is_directed() and graph.number_of_nodes() < self.SMALL_GRAPH_NODE_LIMIT:
+                metrics['betweenness'] = self._dense_betweenness_centrality(graph, graph_key)
+            elif self.n_jobs and self.n_jobs > 1:
+                metrics['betweenness'] = self._parallel_betweenness_centrality(graph, self.n_jobs)
+            elif self.chunk_size:
+                metrics['betweenness'] = self._chunked_betweenness_centrality(graph, self.chunk_size)
+            elif graph.number_of_nodes() >= self.CSR_BETWEENNESS_NODE_LIMIT:
+                metrics['betweenness'] = self._csr_betweenness_centrality(graph, graph_key)
+            else:
+                metrics['betweenness'] = nx.betweenness_centrality(graph)
             
             # Closeness Centrality (근접 중앙성)
-            if nx.is_strongly_connected(graph) or graph.number_of_nodes() == 1:
-                metrics['closeness'] = nx.closeness_centrality(graph)
-            else:
-                # 강하게 연결되지 않은 그래프의 경우 각 연결 컴포넌트별로 계산
-                metrics['closeness'] = {}
-                for node in graph.nodes():
-                    try:
-                        metrics['closeness'][node] = nx.closeness_centrality(graph, node)
-                    except:
-                        metrics['closeness'][node] = 0.0
+            metrics['closeness'] = self._sparse_closeness_centrality(graph, graph_key)
             
             # PageRank (페이지랭크)
             if graph.number_of_edges() > 0:
-                metrics['pagerank'] = nx.pagerank(graph, alpha=0.85, max_iter=100, tol=1e-6)
+                metrics['pagerank'] = self._sparse_pagerank(
+                    graph, alpha=0.85, max_iter=100, tol=1e-6, graph_key=graph_key
+                )
             else:
                 # 엣지가 없는 경우 균등 분배
                 metrics['pagerank'] = {node: 1.0 / graph.number_of_nodes() 
@@ -366,10 +569,201 @@ class DependencyAnalyzer:
                 'closeness': {node: default_value for node in graph.nodes()},
                 'pagerank': {node: default_value for node in graph.nodes()}
             }
+            return metrics
+        
+        # 호출자가 결과 딕셔너리를 수정해도 캐시가 오염되지 않도록 복사본 저장
+        if len(self._centrality_cache) >= self.CENTRALITY_CACHE_SIZE:
+            self._centrality_cache.pop(next(iter(self._centrality_cache)))
+        self._centrality_cache[graph_key] = {name: dict(values) for name, values in metrics.items()}
         
         return metrics
     
-    def _apply_depth_weights(self, graph: nx.DiGraph) -> Dict[str, Dict[str, float]]:
+    def _graph_structure_key(self, graph: nx.DiGraph) -> bytes:
+        """노드/엣지 집합으로부터 그래프 구조 해시 생성 (삽입 순서 무관)"""
+        structure = (
+            graph.is_directed(),
+            sorted(map(repr, graph.nodes())),
+            sorted(map(repr, graph.edges()))
+        )
+        return hashlib.blake2b(repr(structure).encode('utf-8'), digest_size=16).digest()
+    
+    def _dense_betweenness_centrality(
+        self, graph: nx.DiGraph, graph_key: Optional[bytes] = None
+    ) -> Dict[str, float]:
+        """
+        작은 방향 그래프용 밀집 행렬 Betweenness Centrality
+        
+        인접 행렬 거듭제곱으로 최단 거리와 최단 경로 수를 구한 뒤,
+        v를 지나는 (s, t) 쌍마다 sigma(s,v)·sigma(v,t)/sigma(s,t)를 합산한다.
+        """
+        adjacency, nodelist = self._get_csr_adjacency(graph, graph_key)
+        n = len(nodelist)
+        dense = (adjacency.toarray() > 0).astype(float)
+        np.fill_diagonal(dense, 0.0)
+        
+        distance = np.full((n, n), np.inf)
+        np.fill_diagonal(distance, 0.0)
+        sigma = np.eye(n)
+        walks = np.eye(n)
+        for depth in range(1, n):
+            walks = walks @ dense
+            reached = (walks > 0) & np.isinf(distance)
+            if not reached.any():
+                break
+            distance[reached] = depth
+            sigma[reached] = walks[reached]
+        
+        reachable = np.isfinite(distance)
+        betweenness = {}
+        for v, node in enumerate(nodelist):
+            on_path = (
+                reachable[:, [v]] & reachable[[v], :] & reachable &
+                (distance[:, [v]] + distance[[v], :] == distance)
+            )
+            on_path[v, :] = False
+            on_path[:, v] = False
+            np.fill_diagonal(on_path, False)
+            pair_paths = np.outer(sigma[:, v], sigma[v, :])
+            betweenness[node] = float((pair_paths[on_path] / sigma[on_path]).sum())
+        
+        return self._normalize_betweenness(graph, betweenness)
+    
+    def _chunked_betweenness_centrality(self, graph: nx.DiGraph, chunk_size: int) -> Dict[str, float]:
+        """
+        소스 노드를 chunk_size 단위로 나누어 Betweenness Centrality 계산
+        
+        청크별 부분 결과(비정규화)를 합산한 뒤 한 번에 정규화하므로
+        nx.betweenness_centrality와 동일한 값을 얻으면서 최대 메모리를 O(chunk·V)로 제한한다.
+        """
+        nodes = list(graph.nodes())
+        betweenness = dict.fromkeys(nodes, 0.0)
+        
+        for start in range(0, len(nodes), chunk_size):
+            partial = _betweenness_for_sources(graph, nodes[start:start + chunk_size])
+            for node, value in partial.items():
+                betweenness[node] += value
+        
+        return self._normalize_betweenness(graph, betweenness)
+    
+    def _parallel_betweenness_centrality(self, graph: nx.DiGraph, n_jobs: int) -> Dict[str, float]:
+        """
+        소스 노드 청크를 여러 프로세스에서 병렬로 처리하는 Betweenness Centrality 계산
+        
+        Brandes 알고리즘은 소스 노드별로 독립적이므로 청크별 부분 결과를 합산하면 된다.
+        NetworkX BFS는 순수 Python이라 GIL을 놓지 않으므로 스레드 대신 프로세스를 사용한다.
+        """
+        nodes = list(graph.nodes())
+        chunk_size = self.chunk_size or max(1, -(-len(nodes) // n_jobs))
+        chunks = [nodes[start:start + chunk_size] for start in range(0, len(nodes), chunk_size)]
+        
+        if len(chunks) <= 1:
+            return self._chunked_betweenness_centrality(graph, chunk_size)
+        
+        betweenness = dict.fromkeys(nodes, 0.0)
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(chunks))) as executor:
+            for partial in executor.map(_betweenness_for_sources, [graph] * len(chunks), chunks):
+                for node, value in partial.items():
+                    betweenness[node] += value
+        
+        return self._normalize_betweenness(graph, betweenness)
+    
+    def _csr_betweenness_centrality(
+        self, graph: nx.DiGraph, graph_key: Optional[bytes] = None
+    ) -> Dict[str, float]:
+        """
+        캐시된 CSR 인접 배열 위에서 Brandes 커널로 Betweenness Centrality 계산
+        
+        NetworkX의 dict 기반 BFS 대신 평탄한 배열을 순회하며, 결과는
+        nx.betweenness_centrality(normalized=True)와 동일하다.
+        """
+        adjacency, nodelist = self._get_csr_adjacency(graph, graph_key)
+        raw = betweenness_csr(adjacency.indptr, adjacency.indices, len(nodelist))
+        if not graph.is_directed():
+            # 대칭 CSR에서는 각 (s, t) 쌍이 양방향으로 두 번 집계됨
+            raw = raw / 2.0
+        return self._normalize_betweenness(graph, dict(zip(nodelist, raw.tolist())))
+    
+    def _normalize_betweenness(self, graph: nx.DiGraph, betweenness: Dict[str, float]) -> Dict[str, float]:
+        """비정규화 Betweenness를 nx.betweenness_centrality(normalized=True) 기준으로 정규화"""
+        n = graph.number_of_nodes()
+        if n <= 2:
+            return betweenness
+        
+        scale = 1.0 / ((n - 1) * (n - 2))
+        if not graph.is_directed():
+            scale *= 2.0
+        return {node: value * scale for node, value in betweenness.items()}
+    
+    def _sparse_pagerank(self, graph: nx.DiGraph, alpha: float = 0.85,
+                         max_iter: int = 100, tol: float = 1e-6,
+                         graph_key: Optional[bytes] = None) -> Dict[str, float]:
+        """
+        SciPy CSR 행렬 기반 PageRank (희소 행렬 거듭제곱법)
+        
+        dangling 노드는 균등 분배하며 수렴 기준은 nx.pagerank와 동일하다.
+        """
+        adjacency, nodelist = self._get_csr_adjacency(graph, graph_key)
+        n = len(nodelist)
+        if n == 0:
+            return {}
+        
+        out_degree = np.asarray(adjacency.sum(axis=1)).ravel()
+        is_dangling = out_degree == 0
+        inverse_degree = np.divide(1.0, out_degree, out=np.zeros(n), where=~is_dangling)
+        transition = scipy.sparse.diags_array(inverse_degree) @ adjacency
+        
+        uniform = np.full(n, 1.0 / n)
+        x = uniform.copy()
+        for _ in range(max_iter):
+            previous = x
+            x = alpha * (x @ transition + x[is_dangling].sum() * uniform) + (1 - alpha) * uniform
+            if np.abs(x - previous).sum() < n * tol:
+                return dict(zip(nodelist, map(float, x)))
+        
+        raise nx.PowerIterationFailedConvergence(max_iter)
+    
+    def _sparse_closeness_centrality(
+        self, graph: nx.DiGraph, graph_key: Optional[bytes] = None
+    ) -> Dict[str, float]:
+        """
+        CSR 행렬 기반 Closeness Centrality
+        
+        nx.closeness_centrality(wf_improved=True)와 동일하게 각 노드로 들어오는 거리를 사용하며,
+        강하게 연결되지 않은 그래프에서는 도달 가능한 노드 비율로 보정한다.
+        거리 행렬은 소스 청크 단위로 계산해 O(V²) 메모리를 피한다.
+        """
+        adjacency, nodelist = self._get_csr_adjacency(graph, graph_key)
+        n = len(nodelist)
+        if n <= 1:
+            return dict.fromkeys(nodelist, 0.0)
+        
+        # 방향 그래프는 역방향 그래프에서의 거리 = 해당 노드로 들어오는 거리
+        reverse = adjacency.T.tocsr() if graph.is_directed() else adjacency
+        chunk_size = self.chunk_size or 256
+        closeness = {}
+        
+        for start in range(0, n, chunk_size):
+            indices = np.arange(start, min(start + chunk_size, n))
+            distances = scipy.sparse.csgraph.shortest_path(
+                reverse, method='D', directed=True, unweighted=True, indices=indices
+            )
+            reachable = np.isfinite(distances)
+            total_distance = np.where(reachable, distances, 0.0).sum(axis=1)
+            reachable_count = reachable.sum(axis=1) - 1
+            
+            for row, index in enumerate(indices):
+                if total_distance[row] > 0:
+                    value = reachable_count[row] / total_distance[row]
+                    value *= reachable_count[row] / (n - 1)
+                else:
+                    value = 0.0
+                closeness[nodelist[index]] = float(value)
+        
+        return closeness
+    
+    def _apply_depth_weights(
+        self, graph: nx.DiGraph, graph_key: Optional[bytes] = None
+    ) -> Dict[str, Dict[str, float]]:
         """의존성 깊이별 가중치 적용"""
         weighted_importance = {}
         
@@ -378,35 +772,27 @@ class DependencyAnalyzer:
         
         # 각 노드의 깊이 계산 (루트에서의 거리)
         # 여러 루트가 있을 수 있으므로 in-degree가 0인 노드들을 루트로 간주
-        roots = [node for node in graph.nodes() if graph.in_degree(node) == 0]
+        adjacency, nodelist = self._get_csr_adjacency(graph, graph_key)
+        in_degree = np.diff(adjacency.tocsc().indptr)
+        roots = np.flatnonzero(in_degree == 0)
         
-        if not roots:
+        if roots.size == 0:
             # 순환 의존성이 있는 경우 모든 노드를 동등하게 처리
             base_weight = 1.0
-            for node in graph.nodes():
+            for node in nodelist:
                 weighted_importance[node] = base_weight
         else:
-            # 루트에서의 최단 거리 기반 가중치 계산
-            for node in graph.nodes():
-                min_depth = float('inf')
-                
-                for root in roots:
-                    try:
-                        if nx.has_path(graph, root, node):
-                            depth = nx.shortest_path_length(graph, root, node)
-                            min_depth = min(min_depth, depth)
-                        elif root == node:
-                            min_depth = 0
-                    except nx.NetworkXNoPath:
-                        continue
-                
-                if min_depth == float('inf'):
-                    min_depth = 0  # 연결되지 않은 노드는 깊이 0으로 처리
-                
-                # 깊이별 가중치: 깊이가 깊을수록 낮은 가중치
-                # weight = 1 / (1 + depth * 0.5)
-                weight = 1.0 / (1.0 + min_depth * 0.5)
-                weighted_importance[node] = weight
+            # 모든 루트에서 동시에 출발하는 다중 소스 BFS로 최소 깊이 계산
+            depths = scipy.sparse.csgraph.dijkstra(
+                adjacency, directed=True, unweighted=True, indices=roots, min_only=True
+            )
+            # 연결되지 않은 노드는 깊이 0으로 처리
+            depths[~np.isfinite(depths)] = 0
+            
+            # 깊이별 가중치: 깊이가 깊을수록 낮은 가중치
+            # weight = 1 / (1 + depth * 0.5)
+            weights = 1.0 / (1.0 + depths * 0.5)
+            weighted_importance = dict(zip(nodelist, map(float, weights)))
         
         return {'weighted_importance': weighted_importance}
     
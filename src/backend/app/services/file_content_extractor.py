@@ -13,12 +13,17 @@ import asyncio
 import aiohttp
 import base64
 import hashlib
+import heapq
 import json
+import os
+import random
 import re
 import time
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict
+from typing import Dict, List, Any, Optional, Tuple, Union
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 import chardet
 
 try:
@@ -27,6 +32,138 @@ try:
 except ImportError:
     REDIS_AVAILABLE = False
 
+try:
+    import cchardet
+    CCHARDET_AVAILABLE = True
+except ImportError:
+    CCHARDET_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+# SIMD(libbase64) 디코더가 있으면 사용하고, 없으면 표준 라이브러리로 폴백
+_b64decode = pybase64.b64decode if PYBASE64_AVAILABLE else base64.b64decode
+
+# Redis 캐시 항목 압축 (소스 코드는 반복 토큰이 많아 레벨 3에서도 수 배 압축됨)
+_ZSTD_LEVEL = 3
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_zstd_compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL) if ZSTD_AVAILABLE else None
+_zstd_decompressor = zstandard.ZstdDecompressor() if ZSTD_AVAILABLE else None
+
+# GraphQL 일괄 조회: 별칭(f0, f1, ...)마다 "HEAD:경로" Blob을 요청
+_GRAPHQL_URL = "https://api.github.com/graphql"
+_GRAPHQL_BLOB_FIELDS = "... on Blob { text byteSize isBinary isTruncated }"
+
+# 인코딩 감지기 (libuchardet 기반 cchardet 우선, 없으면 순수 파이썬 chardet)와 감지에 사용할 앞부분 크기
+_detect_encoding = cchardet.detect if CCHARDET_AVAILABLE else chardet.detect
+_CHARSET_SAMPLE_SIZE = 4096
+
+# contents API에 원본 바이트를 요청하는 헤더 (Base64 인코딩/디코딩 생략)
+_RAW_CONTENT_HEADERS = {"Accept": "application/vnd.github.raw+json"}
+
+# 큰 콘텐츠 디코딩 파이프라인용 워커 풀 (모든 추출기 인스턴스가 공유, 스레드는 필요할 때 생성)
+_DECODE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="file-decode")
+
+# 텍스트 판별 시 검사할 앞부분 기본 크기와, 비인쇄 문자 계산에서 제외할(=정상) 바이트
+# (탭/개행/CR과 0x20 이상 바이트. 0x80 이상은 UTF-8 한글 등 멀티바이트 문자이므로 정상으로 취급)
+_TEXT_SAMPLE_SIZE = 8192
+_PRINTABLE_BYTES = bytes(b for b in range(256) if b >= 32 or b in (9, 10, 13))
+
+# 텍스트 파일 확장자
+_TEXT_EXTENSIONS = frozenset({
+    '.py', '.js', '.jsx', '.ts', '.tsx', '.html', '.htm', '.css', '.scss', '.sass',
+    '.json', '.xml', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf',
+    '.md', '.txt', '.rst', '.tex', '.sql', '.sh', '.bash', '.zsh', '.fish',
+    '.java', '.c', '.cpp', '.cc', '.cxx', '.h', '.hpp', '.cs', '.go', '.rs',
+    '.rb', '.php', '.perl', '.pl', '.r', '.swift', '.kt', '.scala', '.clj',
+    '.dockerfile', '.makefile', '.cmake', '.gradle', '.pom'
+})
+
+# 바이너리 파일 확장자
+_BINARY_EXTENSIONS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.svg', '.webp',
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.zip', '.tar', '.gz', '.rar', '.7z', '.bz2', '.xz',
+    '.exe', '.dll', '.so', '.dylib', '.bin', '.deb', '.rpm',
+    '.mp3', '.wav', '.mp4', '.avi', '.mkv', '.mov', '.wmv',
+    '.ttf', '.otf', '.woff', '.woff2', '.eot'
+})
+
+# 확장자 없이도 텍스트인 특수 파일명 (소문자)
+_TEXT_BASENAMES = frozenset({
+    'dockerfile', 'makefile', 'rakefile', 'gemfile', 'procfile',
+    '.gitignore', '.gitattributes', '.dockerignore', '.eslintrc',
+    '.babelrc', '.prettierrc', 'license', 'readme', 'changelog',
+    'authors', 'contributors', 'copying', 'install', 'news'
+})
+
+# JavaScript/TypeScript 함수/클래스 시작 줄 (줄마다 두 번 검색하던 패턴을 하나로 합쳐 미리 컴파일)
+_JS_SECTION_START_RE = re.compile(
+    r'\b(?:function|class|const.*=.*function|let.*=.*function|var.*=.*function'
+    r'|async\s+function|export\s+function|export\s+class)'
+)
+
+# 중요 코드 섹션 최대 개수
+_MAX_IMPORTANT_SECTIONS = 10
+
+# 캐시 항목 내부 메타데이터 (추출 결과로 반환하지 않음)
+_CACHE_METADATA_KEYS = frozenset({"etag", "fresh_until"})
+
+# extract_file_content의 cached_entry 기본값: 호출자가 캐시를 아직 조회하지 않았음 (None은 "조회했지만 없음")
+_CACHE_NOT_LOOKED_UP = object()
+
+
+def _strip_cache_metadata(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """캐시 항목에서 내부 메타데이터를 제거한 추출 결과 반환"""
+    return {key: value for key, value in entry.items() if key not in _CACHE_METADATA_KEYS}
+
+
+def _is_fresh_cache_entry(entry: Optional[Dict[str, Any]]) -> bool:
+    """신선 기간 내 캐시 항목 여부 (fresh_until 없는 이전 항목은 Redis TTL로만 만료)"""
+    return bool(entry) and time.time() < entry.get("fresh_until", float("inf"))
+
+
+def _pack_cache_entry(entry: Dict[str, Any]) -> bytes:
+    """캐시 항목 직렬화 (msgpack이 있으면 바이너리, 없으면 JSON. zstandard가 있으면 zstd 프레임으로 압축)"""
+    if MSGPACK_AVAILABLE:
+        packed = msgpack.packb(entry, use_bin_type=True)
+    else:
+        packed = json.dumps(entry, ensure_ascii=False).encode('utf-8')
+    if ZSTD_AVAILABLE:
+        return _zstd_compressor.compress(packed)
+    return packed
+
+
+def _unpack_cache_entry(raw: Union[bytes, str]) -> Dict[str, Any]:
+    """캐시 항목 역직렬화 (압축 이전 항목과 msgpack 이전에 JSON으로 저장된 항목도 읽음)"""
+    if ZSTD_AVAILABLE and isinstance(raw, bytes) and raw.startswith(_ZSTD_MAGIC):
+        raw = _zstd_decompressor.decompress(raw)
+    if MSGPACK_AVAILABLE and isinstance(raw, bytes):
+        try:
+            entry = msgpack.unpackb(raw, raw=False)
+            if isinstance(entry, dict):
+                return entry
+        except ValueError:
+            pass
+    if isinstance(raw, bytes):
+        raw = raw.decode('utf-8')
+    return json.loads(raw)
+
 
 class FileContentExtractor:
     """GitHub 파일 내용 추출 및 캐싱 시스템"""
@@ -35,6 +172,34 @@ class FileContentExtractor:
         self.github_token = github_token
         self.size_limit = 1024 * 1024  # 1MB (Gemini의 긴 컨텍스트 활용)
         self.max_lines = 50000  # 최대 라인 수 대폭 확대
+        # 이 크기 이상의 Base64 콘텐츠는 디코딩 파이프라인을 모듈 공유 워커 풀에서 수행하여 이벤트 루프 점유를 막음
+        self.offload_threshold = 64 * 1024
+        self._decode_pool = _DECODE_POOL
+        
+        # 텍스트/바이너리 판별에 검사할 앞부분 크기 (memchr/translate C 루프라 64KB 이상으로 늘려도 저렴)
+        self.text_sample_size = _TEXT_SAMPLE_SIZE
+        
+        # GraphQL 일괄 조회 시 요청 하나에 담을 파일 수 (0이면 사용 안 함, 토큰 필요)
+        self.graphql_batch_size = 50
+        
+        # ETag가 있는 캐시 항목을 신선 기간 이후에도 재검증용으로 보관하는 시간
+        self.etag_retention = 7 * 24 * 60 * 60
+        
+        # Redis 앞단의 프로세스 내 L1 캐시 (캐시 키 -> (만료 시각, 캐시 항목), LRU 순서)
+        self.l1_cache_size = 512
+        self.l1_cache_ttl = 300
+        self._l1_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        
+        # 일괄 추출 시 동시 GitHub 요청 수
+        self.max_concurrency = 10
+        
+        # Rate Limit(403/429) 응답 시 재시도 횟수와 최대 대기 시간(초). 리셋까지 더 오래 걸리면 즉시 실패
+        self.rate_limit_retries = 2
+        self.max_rate_limit_wait = 60
+        
+        # GitHub API용 공유 HTTP 세션 (연결/TLS 핸드셰이크를 파일 간에 재사용)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Redis 설정
         self.redis_client = None
@@ -46,37 +211,70 @@ class FileContentExtractor:
             "total_requests": 0,
             "cache_hits": 0,
             "cache_misses": 0,
+            "revalidations": 0,
             "errors": 0,
             "total_response_time": 0.0
         }
         
-        # 텍스트 파일 확장자
-        self.text_extensions = {
-            '.py', '.js', '.jsx', '.ts', '.tsx', '.html', '.htm', '.css', '.scss', '.sass',
-            '.json', '.xml', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf',
-            '.md', '.txt', '.rst', '.tex', '.sql', '.sh', '.bash', '.zsh', '.fish',
-            '.java', '.c', '.cpp', '.cc', '.cxx', '.h', '.hpp', '.cs', '.go', '.rs',
-            '.rb', '.php', '.perl', '.pl', '.r', '.swift', '.kt', '.scala', '.clj',
-            '.dockerfile', '.makefile', '.cmake', '.gradle', '.pom'
-        }
-        
-        # 바이너리 파일 확장자
-        self.binary_extensions = {
-            '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.svg', '.webp',
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-            '.zip', '.tar', '.gz', '.rar', '.7z', '.bz2', '.xz',
-            '.exe', '.dll', '.so', '.dylib', '.bin', '.deb', '.rpm',
-            '.mp3', '.wav', '.mp4', '.avi', '.mkv', '.mov', '.wmv',
-            '.ttf', '.otf', '.woff', '.woff2', '.eot'
-        }
+        # 확장자 집합 (모듈 상수 공유)
+        self.text_extensions = _TEXT_EXTENSIONS
+        self.binary_extensions = _BINARY_EXTENSIONS
+    
+    async def __aenter__(self):
+        """비동기 컨텍스트 매니저 시작 (공유 HTTP 세션 생성)"""
+        self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """비동기 컨텍스트 매니저 종료"""
+        await self.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """공유 세션 반환 (없거나 닫혔으면 생성)
+        
+        세션은 생성한 이벤트 루프에 묶이므로 추출기 인스턴스는 한 루프에서만 사용해야 한다.
+        다른 루프에서 연 세션이 열려 있으면 RuntimeError를 발생시킨다
+        (다른 루프로 옮기려면 먼저 원래 루프에서 close() 호출).
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._session_loop is not loop:
+            raise RuntimeError(
+                "FileContentExtractor session is bound to another event loop; call close() on that loop first"
+            )
+        if self._session is None or self._session.closed:
+            headers = {
+                "Accept": "application/vnd.github.v3+json",
+                "User-Agent": "TechGiterview/1.0"
+            }
+            if self.github_token:
+                headers["Authorization"] = f"token {self.github_token}"
+            
+            self._session = aiohttp.ClientSession(
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(limit=20, limit_per_host=20, ttl_dns_cache=300)
+            )
+            self._session_loop = loop
+        return self._session
     
     async def extract_file_content(
         self, 
         owner: str, 
         repo: str, 
-        file_path: str
+        file_path: str,
+        fetch_semaphore: Optional[asyncio.Semaphore] = None,
+        known_size: Optional[int] = None,
+        prefetched: Optional[Dict[str, Any]] = None,
+        cached_entry: Any = _CACHE_NOT_LOOKED_UP
     ) -> Dict[str, Any]:
-        """단일 파일 내용 추출"""
+        """단일 파일 내용 추출
+        
+        fetch_semaphore가 주어지면 캐시 조회/GitHub 요청 구간에만 적용하여,
+        디코딩 중인 파일이 네트워크 슬롯을 점유하지 않고 다음 파일 요청과 겹쳐 실행되게 한다.
+        known_size(트리 조회 등으로 이미 알고 있는 파일 크기)가 제한을 넘으면 요청 없이 바로 제외한다.
+        prefetched는 GraphQL 일괄 조회로 미리 받은 응답으로, 있으면 개별 REST 요청을 생략한다.
+        cached_entry는 호출자가 이미 조회한 캐시 항목(없으면 None)으로, 주어지면 캐시를 다시 조회하지 않는다.
+        """
         
         start_time = time.time()
         self.metrics["total_requests"] += 1
@@ -91,17 +289,38 @@ class FileContentExtractor:
                     "size": 0
                 }
             
-            # 캐시 확인
-            repo_id = f"{owner}/{repo}"
-            cached_content = await self._get_cached_content(repo_id, file_path)
-            if cached_content:
-                self.metrics["cache_hits"] += 1
-                return cached_content
+            # 이미 알고 있는 크기로 사전 필터링 (전송/디코딩 0바이트)
+            if known_size is not None and known_size > self.size_limit:
+                return self._size_limit_error(file_path, known_size)
             
-            self.metrics["cache_misses"] += 1
+            repo_id = f"{owner}/{repo}"
+            async with fetch_semaphore or nullcontext():
+                # 캐시 확인 (신선 기간이 지난 항목은 ETag로 재검증)
+                if cached_entry is _CACHE_NOT_LOOKED_UP:
+                    cached_content = await self._get_cached_content(repo_id, file_path)
+                else:
+                    cached_content = cached_entry
+                if _is_fresh_cache_entry(cached_content):
+                    self.metrics["cache_hits"] += 1
+                    return _strip_cache_metadata(cached_content)
+                
+                self.metrics["cache_misses"] += 1
+                cached_etag = cached_content.get("etag") if cached_content else None
+                
+                # GitHub API에서 파일 내용 가져오기
+                if prefetched is not None:
+                    github_response = prefetched
+                else:
+                    github_response = await self._fetch_github_content(
+                        owner, repo, file_path, etag=cached_etag
+                    )
             
-            # GitHub API에서 파일 내용 가져오기
-            github_response = await self._fetch_github_content(owner, repo, file_path)
+            # 304 Not Modified: 본문 전송/디코딩 없이 캐시 내용을 재사용하고 신선 기간만 갱신
+            if github_response and github_response.get("not_modified") and cached_content:
+                self.metrics["revalidations"] += 1
+                result = _strip_cache_metadata(cached_content)
+                await self._cache_content(repo_id, file_path, result, etag=cached_etag)
+                return result
             
             if not github_response:
                 return {
@@ -114,16 +333,12 @@ class FileContentExtractor:
             # 파일 크기 확인
             file_size = github_response.get("size", 0)
             if file_size > self.size_limit:
-                return {
-                    "success": False,
-                    "file_path": file_path,
-                    "error": f"File size ({file_size} bytes) exceeds limit ({self.size_limit} bytes)",
-                    "size": file_size
-                }
+                return self._size_limit_error(file_path, file_size)
             
-            # Base64 디코딩
-            encoded_content = github_response.get("content", "")
-            if not encoded_content:
+            # raw 응답은 이미 원본 바이트, JSON 응답은 Base64 문자열
+            is_raw = github_response.get("encoding") == "raw"
+            payload = github_response.get("content_bytes" if is_raw else "content", b"" if is_raw else "")
+            if not payload:
                 return {
                     "success": False,
                     "file_path": file_path,
@@ -131,45 +346,32 @@ class FileContentExtractor:
                     "size": 0
                 }
             
-            try:
-                decoded_bytes = base64.b64decode(encoded_content)
-            except Exception as e:
-                return {
-                    "success": False,
-                    "file_path": file_path,
-                    "error": f"Base64 decoding failed: {str(e)}",
-                    "size": 0
-                }
+            # (Base64 디코딩) → 바이너리 확인 → 텍스트 디코딩 (큰 파일은 스레드 풀로 오프로드)
+            if len(payload) >= self.offload_threshold:
+                loop = asyncio.get_running_loop()
+                decoded = await loop.run_in_executor(self._decode_pool, self._decode_pipeline, payload, is_raw)
+            else:
+                decoded = self._decode_pipeline(payload, is_raw)
             
-            # 바이너리 콘텐츠 확인
-            if not self._is_text_content(decoded_bytes):
+            if "error" in decoded:
                 return {
                     "success": False,
                     "file_path": file_path,
-                    "error": "Binary file detected in content",
-                    "size": len(decoded_bytes)
+                    "error": decoded["error"],
+                    "size": decoded["size"]
                 }
             
-            # 텍스트 디코딩
-            decode_result = self._decode_content(decoded_bytes)
-            content = decode_result["content"]
-            encoding = decode_result["encoding"]
-            
-            # 내용 트렁케이션 (필요시)
-            if len(content.split('\n')) > self.max_lines:
-                content = self._truncate_content(content, self.max_lines)
-            
             result = {
                 "success": True,
                 "file_path": file_path,
-                "content": content,
-                "size": len(decoded_bytes),
-                "encoding": encoding,
+                "content": decoded["content"],
+                "size": decoded["size"],
+                "encoding": decoded["encoding"],
                 "extracted_at": datetime.now(timezone.utc).isoformat()
             }
             
-            # 캐시에 저장
-            await self._cache_content(repo_id, file_path, result)
+            # 캐시에 저장 (ETag는 만료 후 조건부 요청에 사용)
+            await self._cache_content(repo_id, file_path, result, etag=github_response.get("etag"))
             
             return result
             
@@ -203,51 +405,74 @@ class FileContentExtractor:
         repo: str, 
         important_files: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """여러 파일의 내용 일괄 추출"""
+        """여러 파일의 내용 일괄 추출 (동시 요청 수 제한)"""
         
-        tasks = []
+        file_paths = []
+        file_sizes = {}
         for file_info in important_files:
             file_path = file_info.get("path") or file_info.get("file_path")
             if file_path:
-                task = self.extract_file_content(owner, repo, file_path)
-                tasks.append(task)
+                file_paths.append(file_path)
+                if isinstance(file_info.get("size"), int):
+                    file_sizes[file_path] = file_info["size"]
         
-        if not tasks:
+        if not file_paths:
             return []
         
-        # 병렬 처리
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # 예외 처리
-        processed_results = []
-        for result in results:
-            if isinstance(result, Exception):
-                processed_results.append({
-                    "success": False,
-                    "error": str(result),
-                    "file_path": "unknown"
-                })
-            else:
-                processed_results.append(result)
-        
-        return processed_results
+        # 병렬 처리: 세마포어로 동시 요청 수를 제한하고 실패 결과에도 파일 경로를 유지
+        return await self.extract_files_content_parallel(
+            owner, repo, file_paths, max_concurrent=self.max_concurrency, file_sizes=file_sizes
+        )
     
     async def extract_files_content_parallel(
         self, 
         owner: str, 
         repo: str, 
         file_paths: List[str],
-        max_concurrent: int = 10
+        max_concurrent: int = 10,
+        file_sizes: Optional[Dict[str, int]] = None
     ) -> List[Dict[str, Any]]:
-        """병렬 처리로 파일 내용 추출 (동시 요청 수 제한)"""
+        """병렬 처리로 파일 내용 추출 (동시 요청 수 제한, file_sizes가 있으면 크기 초과 파일은 요청하지 않음)"""
         
+        # 세마포어는 네트워크 구간에만 적용: 요청 단계와 디코딩(스레드 풀) 단계가 파이프라인으로 겹침
         semaphore = asyncio.Semaphore(max_concurrent)
+        file_sizes = file_sizes or {}
         
-        async def extract_with_semaphore(file_path: str):
-            async with semaphore:
-                return await self.extract_file_content(owner, repo, file_path)
-        
-        tasks = [extract_with_semaphore(file_path) for file_path in file_paths]
+        # 캐시에 없는 텍스트 파일은 GraphQL로 한 번에 받아 파일별 REST 왕복을 줄임
+        # (조회한 캐시 항목은 파일별 추출에 넘겨 같은 키를 다시 읽지 않음)
+        prefetched = {}
+        cached_entries = {}
+        if self.github_token and self.graphql_batch_size > 0 and len(file_paths) > 1:
+            repo_id = f"{owner}/{repo}"
+            candidates = [
+                file_path for file_path in file_paths
+                if self._is_text_file(file_path) and file_sizes.get(file_path, 0) <= self.size_limit
+            ]
+            
+            async def lookup_cache(file_path: str) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    return await self._get_cached_content(repo_id, file_path)
+            
+            cached_entries = dict(zip(
+                candidates, await asyncio.gather(*(lookup_cache(file_path) for file_path in candidates))
+            ))
+            candidates = [
+                file_path for file_path in candidates
+                if not _is_fresh_cache_entry(cached_entries[file_path])
+            ]
+            if len(candidates) > 1:
+                prefetched = await self._prefetch_contents_graphql(owner, repo, candidates)
+        
+        tasks = [
+            self.extract_file_content(
+                owner, repo, file_path,
+                fetch_semaphore=semaphore,
+                known_size=file_sizes.get(file_path),
+                prefetched=prefetched.get(file_path),
+                cached_entry=cached_entries.get(file_path, _CACHE_NOT_LOOKED_UP)
+            )
+            for file_path in file_paths
+        ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # 예외 처리
@@ -268,69 +493,189 @@ class FileContentExtractor:
         self, 
         owner: str, 
         repo: str, 
-        file_path: str
+        file_path: str,
+        etag: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
-        """GitHub API로 파일 내용 가져오기"""
+        """GitHub API로 파일 내용 가져오기
         
-        url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}"
-        headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "TechGiterview/1.0"
-        }
+        raw 미디어 타입을 요청하여 파일은 Base64 JSON 대신 원본 바이트로 받는다
+        (디렉터리 등 raw로 줄 수 없는 경로는 GitHub가 JSON으로 응답).
+        etag가 주어지면 조건부 요청을 보내며, 변경이 없으면 {"not_modified": True}를 반환한다
+        (304 응답은 본문이 없고 기본 rate limit을 소모하지 않음).
+        """
         
-        if self.github_token:
-            headers["Authorization"] = f"token {self.github_token}"
+        url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}"
+        session = self._get_session()
+        headers = {**_RAW_CONTENT_HEADERS, "If-None-Match": etag} if etag else _RAW_CONTENT_HEADERS
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=30) as response:
-                    if response.status == 200:
-                        return await response.json()
+            for attempt in range(self.rate_limit_retries + 1):
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        return {"not_modified": True}
+                    elif response.status == 200:
+                        response_etag = response.headers.get("ETag")
+                        if response.content_type == "application/json":
+                            data = await response.json()
+                            if isinstance(data, dict):
+                                data["etag"] = response_etag
+                            return data
+                        
+                        # 크기 제한 초과 파일은 본문을 읽지 않고 연결을 끊어 전송을 중단한 뒤 크기만 반환
+                        if response.content_length is not None and response.content_length > self.size_limit:
+                            response.close()
+                            return {"content_bytes": b"", "size": response.content_length, "encoding": "raw"}
+                        
+                        content_bytes = await response.read()
+                        return {
+                            "content_bytes": content_bytes,
+                            "size": len(content_bytes),
+                            "encoding": "raw",
+                            "etag": response_etag
+                        }
                     elif response.status == 404:
                         raise Exception("404: File not found")
-                    elif response.status == 403:
-                        raise Exception("403: GitHub API rate limit exceeded")
+                    elif response.status in (403, 429):
+                        delay = self._rate_limit_delay(response.headers)
+                        if (
+                            delay is None
+                            or delay > self.max_rate_limit_wait
+                            or attempt >= self.rate_limit_retries
+                        ):
+                            raise Exception("403: GitHub API rate limit exceeded")
                     else:
                         raise Exception(f"GitHub API error: {response.status}")
+                
+                # 연결을 반납한 뒤 리셋 시각까지 대기 (지터로 동시 재시도 분산)
+                await asyncio.sleep(max(1.0, delay) + random.uniform(0, 1))
         
         except asyncio.TimeoutError:
             raise Exception("Request timeout")
         except Exception as e:
             raise e
     
-    def _is_text_file(self, file_path: str) -> bool:
-        """파일 확장자로 텍스트 파일 여부 판단"""
+    @staticmethod
+    def _rate_limit_delay(headers) -> Optional[float]:
+        """Rate Limit 응답 헤더로 재시도까지 기다릴 시간(초) 계산
+        
+        Retry-After(초)를 우선하고, 없으면 X-RateLimit-Remaining이 0일 때 X-RateLimit-Reset(epoch)까지 남은 시간.
+        Rate Limit 정보가 없는 403(권한 없음 등)은 None
+        """
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                return None
         
-        # 확장자 추출
-        file_path_lower = file_path.lower()
+        reset = headers.get("X-RateLimit-Reset")
+        if headers.get("X-RateLimit-Remaining") == "0" and reset is not None:
+            try:
+                return max(float(reset) - time.time(), 0.0)
+            except ValueError:
+                return None
+        return None
+    
+    async def _prefetch_contents_graphql(
+        self,
+        owner: str,
+        repo: str,
+        file_paths: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """GraphQL 별칭 쿼리로 여러 파일 내용을 일괄 조회
+        
+        graphql_batch_size개씩 묶어 요청하며, 결과는 _fetch_github_content의 raw 응답과 같은 형태다.
+        텍스트를 받지 못한 파일(바이너리, 잘린 대용량 Blob, 존재하지 않는 경로, 요청 실패)은
+        결과에서 빠지므로 호출자가 REST로 개별 조회한다.
+        """
+        
+        batches = [
+            file_paths[start:start + self.graphql_batch_size]
+            for start in range(0, len(file_paths), self.graphql_batch_size)
+        ]
+        results = await asyncio.gather(
+            *(self._fetch_graphql_blob_batch(owner, repo, batch) for batch in batches)
+        )
+        
+        prefetched = {}
+        for batch_result in results:
+            prefetched.update(batch_result)
+        return prefetched
+    
+    async def _fetch_graphql_blob_batch(
+        self,
+        owner: str,
+        repo: str,
+        file_paths: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """GraphQL 요청 한 번으로 file_paths의 Blob 텍스트 조회"""
+        
+        variables = {"owner": owner, "name": repo}
+        params = []
+        fields = []
+        for i, file_path in enumerate(file_paths):
+            variables[f"e{i}"] = f"HEAD:{file_path}"
+            params.append(f", $e{i}: String!")
+            fields.append(f"f{i}: object(expression: $e{i}) {{ {_GRAPHQL_BLOB_FIELDS} }}")
+        query = (
+            f"query($owner: String!, $name: String!{''.join(params)}) "
+            f"{{ repository(owner: $owner, name: $name) {{ {' '.join(fields)} }} }}"
+        )
         
-        # 특수 파일명 처리
-        special_files = {
-            'dockerfile', 'makefile', 'rakefile', 'gemfile', 'procfile',
-            '.gitignore', '.gitattributes', '.dockerignore', '.eslintrc',
-            '.babelrc', '.prettierrc', 'license', 'readme', 'changelog',
-            'authors', 'contributors', 'copying', 'install', 'news'
+        try:
+            session = self._get_session()
+            async with session.post(_GRAPHQL_URL, json={"query": query, "variables": variables}) as response:
+                if response.status != 200:
+                    return {}
+                data = await response.json()
+        except Exception as e:
+            print(f"GraphQL prefetch error: {e}")
+            return {}
+        
+        repository = (data.get("data") or {}).get("repository") or {}
+        prefetched = {}
+        for i, file_path in enumerate(file_paths):
+            blob = repository.get(f"f{i}")
+            if not blob:
+                continue
+            
+            byte_size = blob.get("byteSize") or 0
+            if byte_size > self.size_limit:
+                prefetched[file_path] = {"content_bytes": b"", "size": byte_size, "encoding": "raw"}
+            elif (
+                blob.get("text") is not None and not blob.get("isBinary") and not blob.get("isTruncated")
+                # Blob.text는 UTF-8로만 디코딩되므로 대체 문자가 있으면 REST 원본 바이트로 인코딩 감지
+                and "\ufffd" not in blob["text"]
+            ):
+                content_bytes = blob["text"].encode("utf-8")
+                prefetched[file_path] = {"content_bytes": content_bytes, "size": len(content_bytes), "encoding": "raw"}
+        
+        return prefetched
+    
+    def _size_limit_error(self, file_path: str, file_size: int) -> Dict[str, Any]:
+        """크기 제한 초과 결과"""
+        return {
+            "success": False,
+            "file_path": file_path,
+            "error": f"File size ({file_size} bytes) exceeds limit ({self.size_limit} bytes)",
+            "size": file_size
         }
+    
+    def _is_text_file(self, file_path: str) -> bool:
+        """파일 확장자로 텍스트 파일 여부 판단"""
         
-        filename = file_path_lower.split('/')[-1]
-        if filename in special_files or filename.startswith('.env'):
+        # 특수 파일명 처리
+        filename = file_path.rsplit('/', 1)[-1].lower()
+        if filename in _TEXT_BASENAMES or filename.startswith('.env'):
             return True
         
-        # 확장자 확인
-        for ext in self.text_extensions:
-            if file_path_lower.endswith(ext):
-                return True
-        
-        # 바이너리 확장자 확인
-        for ext in self.binary_extensions:
-            if file_path_lower.endswith(ext):
-                return False
-        
-        # 확장자가 없는 경우 텍스트로 가정
-        if '.' not in filename:
+        # 확장자 확인 (해시 조회)
+        ext = os.path.splitext(filename)[1]
+        if ext in self.text_extensions:
             return True
         
-        return True  # 기본적으로 텍스트 파일로 처리
+        # 바이너리 확장자가 아니면 (확장자 없음 포함) 기본적으로 텍스트 파일로 처리
+        return ext not in self.binary_extensions
     
     def _is_text_content(self, content_bytes: bytes) -> bool:
         """파일 내용으로 텍스트 파일 여부 판단"""
@@ -338,19 +683,57 @@ class FileContentExtractor:
         if not content_bytes:
             return True
         
-        # NULL 바이트 확인
-        if b'\x00' in content_bytes[:1024]:  # 첫 1KB 확인
+        sample = content_bytes[:self.text_sample_size]
+        
+        # NULL 바이트 확인 (memchr 기반 C 루프)
+        if sample.find(b'\x00') != -1:
             return False
         
-        # 비인쇄 문자 비율 확인
-        sample = content_bytes[:1024]
-        non_printable = sum(1 for byte in sample if byte < 32 and byte not in (9, 10, 13))
+        # 비인쇄 문자 비율 확인: 정상 바이트를 모두 지우고 남은 길이 = 비인쇄 문자 수
+        non_printable = len(sample.translate(None, _PRINTABLE_BYTES))
         
-        if len(sample) > 0 and non_printable / len(sample) > 0.3:
+        if non_printable / len(sample) > 0.3:
             return False
         
         return True
     
+    def _decode_pipeline(self, payload: Union[str, bytes], is_raw: bool = False) -> Dict[str, Any]:
+        """Base64 디코딩(raw 응답은 생략), 바이너리 검사, 텍스트 디코딩을 한 번에 수행 (동기 CPU 작업)"""
+        
+        if is_raw:
+            decoded_bytes = payload
+        else:
+            try:
+                decoded_bytes = _b64decode(payload)
+            except Exception as e:
+                return {"error": f"Base64 decoding failed: {str(e)}", "size": 0}
+        
+        # 바이너리 콘텐츠 확인
+        if not self._is_text_content(decoded_bytes):
+            return {"error": "Binary file detected in content", "size": len(decoded_bytes)}
+        
+        # 빠른 경로: 바이트 수가 최대 라인 수보다 작으면 트렁케이션이 불가능하므로
+        # UTF-8 디코딩에 성공하면 인코딩 감지와 라인 수 계산 없이 바로 반환 (대부분의 소스 파일)
+        if len(decoded_bytes) < self.max_lines:
+            try:
+                return {"content": decoded_bytes.decode('utf-8'), "encoding": "utf-8", "size": len(decoded_bytes)}
+            except UnicodeDecodeError:
+                pass
+        
+        content, encoding = self._decode_and_truncate(decoded_bytes)
+        return {"content": content, "encoding": encoding, "size": len(decoded_bytes)}
+    
+    def _decode_and_truncate(self, content_bytes: bytes) -> Tuple[str, str]:
+        """디코딩 후 최대 라인 수를 넘으면 트렁케이션 (동기 CPU 작업)"""
+        
+        decode_result = self._decode_content(content_bytes)
+        content = decode_result["content"]
+        
+        if content.count('\n') + 1 > self.max_lines:
+            content = self._truncate_content(content, self.max_lines)
+        
+        return content, decode_result["encoding"]
+    
     def _decode_content(self, content_bytes: bytes) -> Dict[str, str]:
         """파일 내용 디코딩"""
         
@@ -361,13 +744,13 @@ class FileContentExtractor:
         except UnicodeDecodeError:
             pass
         
-        # chardet로 인코딩 감지
+        # 앞부분만으로 인코딩 감지 (파일 크기와 무관한 비용), 뒷부분의 어긋난 바이트는 대체 문자로 처리
         try:
-            detected = chardet.detect(content_bytes)
-            if detected['encoding'] and detected['confidence'] > 0.7:
-                content = content_bytes.decode(detected['encoding'])
+            detected = _detect_encoding(content_bytes[:_CHARSET_SAMPLE_SIZE])
+            if detected['encoding'] and (detected['confidence'] or 0) > 0.7:
+                content = content_bytes.decode(detected['encoding'], errors='replace')
                 return {"content": content, "encoding": detected['encoding']}
-        except:
+        except Exception:
             pass
         
         # Latin-1 (거의 모든 바이트 시퀀스 처리 가능)
@@ -384,35 +767,30 @@ class FileContentExtractor:
     def _truncate_content(self, content: str, max_lines: int) -> str:
         """긴 파일 내용 트렁케이션"""
         
-        lines = content.split('\n')
-        if len(lines) <= max_lines:
+        # 줄 수는 줄바꿈 개수로 먼저 확인 (제한 이내면 줄 리스트를 만들지 않음)
+        if content.count('\n') < max_lines:
             return content
         
-        # 중요 섹션 우선 포함
-        important_lines = []
-        regular_lines = []
+        lines = content.split('\n')
+        
+        # 중요 라인 우선 포함, 남은 공간에 일반 라인 (50라인은 truncation 메시지 등을 위해 예약)
+        budget = max(max_lines - 50, 0)
+        important_indices = []
+        regular_indices = []
         
         for i, line in enumerate(lines):
             if self._is_important_line(line):
-                important_lines.append((i, line))
-            else:
-                regular_lines.append((i, line))
+                if len(important_indices) >= budget:
+                    # 중요 라인만으로 예산이 찼으면 일반 라인이 들어갈 자리가 없으므로 더 볼 필요 없음
+                    break
+                important_indices.append(i)
+            elif len(regular_indices) < budget:
+                regular_indices.append(i)
         
-        # 중요 라인 우선 포함
-        selected_lines = []
-        remaining_slots = max_lines - 50  # 50라인은 truncation 메시지 등을 위해 예약
+        regular_indices = regular_indices[:budget - len(important_indices)]
         
-        # 중요 라인 추가
-        for i, line in important_lines[:remaining_slots]:
-            selected_lines.append((i, line))
-        
-        # 남은 공간에 일반 라인 추가
-        remaining_slots = max_lines - 50 - len(selected_lines)
-        for i, line in regular_lines[:remaining_slots]:
-            selected_lines.append((i, line))
-        
-        # 라인 번호순 정렬
-        selected_lines.sort(key=lambda x: x[0])
+        # 라인 번호순 정렬 (각 목록은 이미 정렬되어 있으므로 병합)
+        selected_lines = [(i, lines[i]) for i in heapq.merge(important_indices, regular_indices)]
         
         # 결과 생성
         result_lines = []
@@ -468,6 +846,9 @@ class FileContentExtractor:
             in_function_or_class = False
             
             for line in lines:
+                if len(sections) >= _MAX_IMPORTANT_SECTIONS:
+                    break
+                
                 stripped = line.strip()
                 
                 if stripped.startswith(('class ', 'def ', 'async def ')):
@@ -508,10 +889,12 @@ class FileContentExtractor:
             in_function_or_class = False
             
             for line in lines:
+                if len(sections) >= _MAX_IMPORTANT_SECTIONS:
+                    break
+                
                 stripped = line.strip()
                 
-                if (re.search(r'\b(function|class|const.*=.*function|let.*=.*function|var.*=.*function)', stripped) or
-                    re.search(r'\b(async\s+function|export\s+function|export\s+class)', stripped)):
+                if _JS_SECTION_START_RE.search(stripped):
                     
                     if current_section and not in_function_or_class:
                         sections.append('\n'.join(current_section))
@@ -529,7 +912,7 @@ class FileContentExtractor:
                         current_section = []
                         in_function_or_class = False
         
-        return sections[:10]  # 최대 10개 섹션만 반환
+        return sections[:_MAX_IMPORTANT_SECTIONS]  # 최대 10개 섹션만 반환
     
     async def _get_cached_content(self, repo_id: str, file_path: str) -> Optional[Dict[str, Any]]:
         """캐시에서 파일 내용 조회"""
@@ -537,40 +920,86 @@ class FileContentExtractor:
         if not self.redis_client:
             return None
         
+        cache_key = self._generate_cache_key(repo_id, file_path)
+        
+        # L1 히트면 Redis 왕복/역직렬화 생략
+        cached_entry = self._l1_get(cache_key)
+        if cached_entry is not None:
+            return cached_entry
+        
         try:
-            cache_key = self._generate_cache_key(repo_id, file_path)
             cached_data = await self.redis_client.get(cache_key)
             
             if cached_data:
-                return json.loads(cached_data.decode('utf-8'))
+                cached_entry = _unpack_cache_entry(cached_data)
+                self._l1_put(cache_key, cached_entry)
+                return cached_entry
         
         except Exception as e:
             print(f"Cache get error: {e}")
         
         return None
     
-    async def _cache_content(self, repo_id: str, file_path: str, content_data: Dict[str, Any]) -> None:
-        """파일 내용을 캐시에 저장"""
+    async def _cache_content(
+        self,
+        repo_id: str,
+        file_path: str,
+        content_data: Dict[str, Any],
+        etag: Optional[str] = None
+    ) -> None:
+        """파일 내용을 캐시에 저장
+        
+        TTL 동안은 그대로 사용하고, ETag가 있으면 etag_retention 동안 더 보관하여
+        만료 후에는 조건부 요청(If-None-Match)으로 재검증한다.
+        """
         
         if not self.redis_client:
             return
         
         try:
             cache_key = self._generate_cache_key(repo_id, file_path)
-            cache_data = json.dumps(content_data, ensure_ascii=False)
             ttl = self._get_cache_ttl()
+            entry = {**content_data, "fresh_until": time.time() + ttl}
+            if etag:
+                entry["etag"] = etag
+                ttl += self.etag_retention
+            cache_data = _pack_cache_entry(entry)
             
             await self.redis_client.setex(cache_key, ttl, cache_data)
+            self._l1_put(cache_key, entry)
         
         except Exception as e:
             print(f"Cache set error: {e}")
     
+    def _l1_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """L1 캐시 조회 (만료 항목은 제거)"""
+        
+        item = self._l1_cache.get(cache_key)
+        if item is None:
+            return None
+        
+        expires_at, entry = item
+        if time.monotonic() >= expires_at:
+            del self._l1_cache[cache_key]
+            return None
+        
+        self._l1_cache.move_to_end(cache_key)
+        return entry
+    
+    def _l1_put(self, cache_key: str, entry: Dict[str, Any]) -> None:
+        """L1 캐시 저장 (용량 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        
+        self._l1_cache[cache_key] = (time.monotonic() + self.l1_cache_ttl, entry)
+        self._l1_cache.move_to_end(cache_key)
+        if len(self._l1_cache) > self.l1_cache_size:
+            self._l1_cache.popitem(last=False)
+    
     def _generate_cache_key(self, repo_id: str, file_path: str) -> str:
         """캐시 키 생성"""
         
-        # 저장소와 파일 경로를 해시로 변환
+        # 저장소와 파일 경로를 해시로 변환 (암호학적 강도 불필요: 빠른 BLAKE2b 128비트 다이제스트)
         key_data = f"{repo_id}:{file_path}"
-        file_hash = hashlib.sha256(key_data.encode()).hexdigest()
+        file_hash = hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
         
         return f"file_content:{repo_id.replace('/', '_')}:{file_hash}"
     
@@ -584,15 +1013,18 @@ class FileContentExtractor:
         if not self.redis_client:
             return
         
+        cache_key = self._generate_cache_key(repo_id, file_path)
+        self._l1_cache.pop(cache_key, None)
+        
         try:
-            cache_key = self._generate_cache_key(repo_id, file_path)
             await self.redis_client.delete(cache_key)
         except Exception as e:
             print(f"Cache invalidation error: {e}")
     
     async def get_cached_file_content(self, repo_id: str, file_path: str) -> Optional[Dict[str, Any]]:
         """캐시된 파일 내용 직접 조회"""
-        return await self._get_cached_content(repo_id, file_path)
+        cached_content = await self._get_cached_content(repo_id, file_path)
+        return _strip_cache_metadata(cached_content) if cached_content else None
     
     def get_performance_metrics(self) -> Dict[str, Any]:
         """성능 메트릭 반환"""
@@ -610,6 +1042,7 @@ class FileContentExtractor:
             "average_response_time": total_time / max(total_requests, 1),
             "cache_hits": cache_hits,
             "cache_misses": cache_misses,
+            "revalidations": self.metrics["revalidations"],
             "errors": errors
         }
     
@@ -619,11 +1052,17 @@ class FileContentExtractor:
             "total_requests": 0,
             "cache_hits": 0,
             "cache_misses": 0,
+            "revalidations": 0,
             "errors": 0,
             "total_response_time": 0.0
         }
     
     async def close(self) -> None:
         """리소스 정리"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+        
         if self.redis_client:
             await self.redis_client.close()
\ No newline at end of file
@@ -13,17 +13,156 @@
 import re
 import asyncio
 import statistics
+import sys
 import math
-import random
-from typing import Dict, List, Any, Optional, Tuple
+import os
+import hashlib
+import heapq
+import json
+from typing import Dict, List, Any, Optional, Tuple, Union
 from collections import defaultdict
+from itertools import chain
 from dataclasses import dataclass
+from functools import lru_cache
+from contextlib import contextmanager
 from pathlib import Path
+import numpy as np
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 from .git_analyzer import GitAnalyzer
 from .complexity_analyzer import RuleBasedComplexityAnalyzer
 from .dependency_analyzer import DependencyAnalyzer
 
 
+# 더미/샘플/테스트 데이터 및 기타 제외 대상 파일 경로 패턴
+EXCLUDED_FILE_PATTERNS = (
+    # 테스트 디렉토리 및 파일 (가장 먼저 체크)
+    r'(test|tests|__tests__|spec)/',
+    r'\.(test|spec)\.(js|ts|py|java)$',
+    r'test_.*\.py$',
+    r'.*_test\.(go|rs|py|js|ts)$',
+    r'.*Test\.(java|kt|cs)$',
+    # 더미/샘플 디렉토리
+    r'(dummy|sample|mock|fake|stub)/',
+    r'(example|examples|demo|demos)/',
+    r'(seed|seeds|fixtures?|factory)/',
+    r'(initial|init)_?data/',
+    r'(placeholder|template)s?/',
+    # 더미 파일명 패턴
+    r'.*\.(sample|example|dummy|mock|template)\.',
+    r'(sample|example|dummy|mock|template).*\.(json|yml|yaml|xml|csv|sql)$',
+    r'bootstrap.*\.(js|ts|py)$',
+    r'(data/)?(dummy|sample|mock|test).*\.(csv|json|sql|xml)$',
+    # 마이그레이션/시드 파일
+    r'migration.*\.(sql|js|ts|py)$',
+    r'seed.*\.(sql|js|ts|py)$',
+    r'schema.*\.(sql|json)$',
+    # 초기화 스크립트
+    r'init.*\.(sh|bat|py|js)$',
+    r'setup.*\.(sh|bat|py|js)$',
+    # 템플릿 파일
+    r'.*\.template\.',
+    r'.*\.tmpl$',
+    # 로그 및 임시 파일
+    r'.*\.log$',
+    r'.*\.tmp$',
+    r'temp.*\.',
+    # 백업 및 시스템 파일
+    r'.*\.bak$',
+    r'.*\.backup$',
+    r'.*~$',
+    # IDE 및 에디터 설정
+    r'\.(vscode|idea|eclipse|settings)/',
+    r'.*\.(orig|rej)$',
+    # Dot 파일 제외 패턴 (루트 및 하위 디렉토리)
+    r'^\.[^/]*$',          # 루트의 dot 파일들 (.env, .gitignore 등)
+    r'/\.[^/]*$',          # 하위 디렉토리의 dot 파일들
+    r'(^|/)\.[a-zA-Z]'     # 더 포괄적인 dot 파일 패턴
+)
+
+# 모든 제외 패턴을 하나의 정규식으로 미리 컴파일 (경로당 1회 검색)
+EXCLUDED_FILE_REGEX = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in EXCLUDED_FILE_PATTERNS),
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=8192)
+def _is_excluded_path(normalized_path: str) -> bool:
+    """정규화된 경로가 제외 대상인지 판단 (경로 기반 결과는 캐시)"""
+    if EXCLUDED_FILE_REGEX.search(normalized_path):
+        return True
+    
+    # 추가 제외 조건 (패턴에서 다루지 않은 나머지)
+    exclude_conditions = [
+        # 빈 파일 또는 매우 작은 파일
+        len(normalized_path.strip()) == 0,
+        # 캐시 파일
+        '/cache/' in normalized_path or '.cache' in normalized_path
+    ]
+    
+    return any(exclude_conditions)
+
+
+# 종합 점수 파이프라인의 배열 자료형: 반환값이 파이썬 float로 노출되므로 float64로 계산하여
+# 스칼라 공식과 같은 값을 유지한다 (float32 중간값은 0.7588000893592834 같은 잡음을 남김)
+SCORE_DTYPE = np.float64
+
+
+# 확장자별 중요도 매핑 (호출마다 딕셔너리를 다시 만들지 않도록 모듈 상수로 유지)
+EXTENSION_WEIGHTS = {
+    # 소스 코드 (높음)
+    '.py': 0.9, '.js': 0.9, '.ts': 0.9, '.tsx': 0.9, '.jsx': 0.9,
+    '.java': 0.8, '.go': 0.8, '.rs': 0.8, '.cpp': 0.8, '.c': 0.8,
+    '.php': 0.7, '.rb': 0.7, '.cs': 0.7, '.kt': 0.7,
+    
+    # 설정 파일 (매우 높음)
+    '.json': 0.95, '.yaml': 0.9, '.yml': 0.9, '.toml': 0.9,
+    '.ini': 0.8, '.conf': 0.8, '.config': 0.8,
+    
+    # 웹 파일
+    '.html': 0.7, '.css': 0.6, '.scss': 0.6, '.less': 0.6,
+    '.vue': 0.8, '.svelte': 0.8,
+    
+    # 문서
+    '.md': 0.6, '.rst': 0.5, '.txt': 0.3,
+    
+    # 기타
+    '.xml': 0.7, '.sql': 0.7, '.sh': 0.8, '.bat': 0.6,
+    '.dockerfile': 0.9, '.gitignore': 0.6
+}
+
+
+def _combine_scores(
+    structural: np.ndarray,
+    dependency: np.ndarray,
+    churn: np.ndarray,
+    complexity: np.ndarray,
+    multipliers: np.ndarray,
+    w_structural: float,
+    w_dependency: float,
+    w_churn: float,
+    w_complexity: float,
+    out: np.ndarray,
+    features: Optional[np.ndarray] = None
+) -> None:
+    """4차원 점수 가중합에 경로 배수를 곱하고 1.0으로 상한을 둔 결과를 out에 기록
+    
+    가중합(SAW)은 (N, 4) 지표 행렬과 가중치 벡터의 곱이므로 BLAS GEMV 한 번으로 계산한다.
+    features로 (N, 4) 작업 행렬을 넘기면 지표 행렬과 중간 결과를 새로 할당하지 않는다.
+    """
+    features = np.stack((structural, dependency, churn, complexity), axis=1, out=features)
+    weights = np.array((w_structural, w_dependency, w_churn, w_complexity), dtype=features.dtype)
+    np.matmul(features, weights, out=out)
+    np.multiply(out, multipliers, out=out)
+    np.minimum(out, 1.0, out=out)
+
+
 class SmartFileImportanceAnalyzer:
     """스마트 파일 중요도 분석기"""
     
@@ -182,6 +321,25 @@ class SmartFileImportanceAnalyzer:
             }
         }
         
+        # 카테고리별 패턴을 하나의 정규식으로 미리 컴파일하고 가중치 내림차순 정렬
+        # (경로당 카테고리별 1회 검색, 첫 매칭 카테고리가 곧 최대 중요도)
+        self._structural_regexes = sorted(
+            (
+                (info['weight'], re.compile('|'.join(f'(?:{pattern})' for pattern in info['patterns']), re.IGNORECASE))
+                for info in self.structural_patterns.values()
+            ),
+            key=lambda item: item[0],
+            reverse=True
+        )
+        
+        # 구조적 중요도는 경로만의 함수이므로 인스턴스별로 메모이제이션
+        # (종합 점수/분류/분포 계산이 같은 파일 집합을 반복 분류함)
+        self._structural_importance_cached = lru_cache(maxsize=16384)(self._match_structural_importance)
+        
+        # 종합 점수 파이프라인용 작업 버퍼 풀 (배열 모양별, 반복 호출 시 재할당 방지)
+        self._scratch: Dict[Union[int, Tuple[int, int]], List[np.ndarray]] = defaultdict(list)
+        self.scratch_pool_lengths = 16  # 모양 종류 상한 (파일 수별 1차원 버퍼와 (N, 4) 지표 행렬)
+        
         # 중요도 계산 가중치 (기획서 요구사항에 따른 정확한 비율)
         # 기본 가중치 - 동적 변동에서 사용
         self.base_importance_weights = {
@@ -237,32 +395,53 @@ class SmartFileImportanceAnalyzer:
             'moderate': 0.15,  # 0.3 → 0.15로 대폭 낮춤  
             'low': 0.0
         }
+        
+        # 메트릭 기반 선정 이유 규칙: (메트릭 키, [(임계값, 이유), ...]) - 임계값 내림차순, 메트릭당 첫 충족 구간만 사용
+        self.metric_reason_rules = [
+            ('dependency_centrality', [
+                (0.7, "다른 파일들이 많이 참조하는 핵심 의존성"),
+                (0.5, "중요한 모듈 간 연결점 역할")
+            ]),
+            ('churn_risk', [
+                (0.7, "활발하게 개발되고 있는 핵심 기능"),
+                (0.5, "지속적으로 개선되고 있는 중요 모듈")
+            ]),
+            ('complexity_score', [
+                (0.6, "높은 복잡도로 인한 주의 필요 파일"),
+                (0.4, "적절한 복잡도의 핵심 로직 포함")
+            ])
+        ]
     
     def generate_dynamic_weights(self, seed: Optional[str] = None) -> Dict[str, float]:
         """동적 가중치 생성 - 질문 생성 시마다 미세하게 변동"""
         
         # 시드 설정 (재현 가능한 랜덤성)
+        # hash()는 프로세스마다 달라지므로 blake2b 다이제스트로 시드를 유도
         if seed:
-            random.seed(hash(seed) % (2**32))
+            seed_value = int.from_bytes(hashlib.blake2b(seed.encode('utf-8'), digest_size=8).digest(), 'little')
+            rng = np.random.Generator(np.random.PCG64(seed_value))
+        else:
+            rng = np.random.default_rng()
         
         # 기본 가중치에서 미세한 변동 적용 (±5%)
         variation_range = 0.05
-        dynamic_weights = {}
+        keys = list(self.base_importance_weights)
+        base_weights = np.array([self.base_importance_weights[key] for key in keys])
+        
+        # 가중 평균이 0이 되도록 변동을 중심화하면 총합이 1.0으로 유지되어
+        # 정규화 후에도 각 가중치가 ±5% 범위를 벗어나지 않음
+        variations = rng.uniform(-variation_range, variation_range, size=len(keys))
+        variations -= np.dot(base_weights, variations) / base_weights.sum()
+        max_variation = np.abs(variations).max()
+        if max_variation > variation_range:
+            variations *= variation_range / max_variation
         
-        total_variation = 0.0
-        for key, base_weight in self.base_importance_weights.items():
-            # -5% ~ +5% 범위내에서 랜덤 변동
-            variation = random.uniform(-variation_range, variation_range)
-            new_weight = base_weight + (base_weight * variation)
-            dynamic_weights[key] = max(0.01, new_weight)  # 최소 1% 보장
-            total_variation += new_weight - base_weight
+        new_weights = np.maximum(0.01, base_weights * (1.0 + variations))  # 최소 1% 보장
         
         # 총합이 1.0이 되도록 정규화
-        total_weight = sum(dynamic_weights.values())
-        for key in dynamic_weights:
-            dynamic_weights[key] = dynamic_weights[key] / total_weight
+        new_weights /= new_weights.sum()
         
-        return dynamic_weights
+        return {key: float(weight) for key, weight in zip(keys, new_weights)}
     
     def update_weights_for_session(self, session_id: Optional[str] = None) -> None:
         """세션에 맞춰 가중치 업데이트"""
@@ -283,67 +462,7 @@ class SmartFileImportanceAnalyzer:
             if self._is_low_code_density_file(file_content):
                 return True
         
-        normalized_path = file_path.replace('\\', '/')
-        
-        # 더미/샘플 데이터 패턴 확인
-        dummy_patterns = [
-            # 테스트 디렉토리 및 파일 (가장 먼저 체크)
-            r'(test|tests|__tests__|spec)/',
-            r'\.(test|spec)\.(js|ts|py|java)$',
-            r'test_.*\.py$',
-            r'.*_test\.(go|rs|py|js|ts)$',
-            r'.*Test\.(java|kt|cs)$',
-            # 더미/샘플 디렉토리
-            r'(dummy|sample|mock|fake|stub)/',
-            r'(example|examples|demo|demos)/',
-            r'(seed|seeds|fixtures?|factory)/',
-            r'(initial|init)_?data/',
-            r'(placeholder|template)s?/',
-            # 더미 파일명 패턴
-            r'.*\.(sample|example|dummy|mock|template)\.',
-            r'(sample|example|dummy|mock|template).*\.(json|yml|yaml|xml|csv|sql)$',
-            r'bootstrap.*\.(js|ts|py)$',
-            r'(data/)?(dummy|sample|mock|test).*\.(csv|json|sql|xml)$',
-            # 마이그레이션/시드 파일
-            r'migration.*\.(sql|js|ts|py)$',
-            r'seed.*\.(sql|js|ts|py)$',
-            r'schema.*\.(sql|json)$',
-            # 초기화 스크립트
-            r'init.*\.(sh|bat|py|js)$',
-            r'setup.*\.(sh|bat|py|js)$',
-            # 템플릿 파일
-            r'.*\.template\.',
-            r'.*\.tmpl$',
-            # 로그 및 임시 파일
-            r'.*\.log$',
-            r'.*\.tmp$',
-            r'temp.*\.',
-            # 백업 및 시스템 파일
-            r'.*\.bak$',
-            r'.*\.backup$',
-            r'.*~$',
-            # IDE 및 에디터 설정
-            r'\.(vscode|idea|eclipse|settings)/',
-            r'.*\.(orig|rej)$',
-            # Dot 파일 제외 패턴 (루트 및 하위 디렉토리)
-            r'^\.[^/]*$',          # 루트의 dot 파일들 (.env, .gitignore 등)
-            r'/\.[^/]*$',          # 하위 디렉토리의 dot 파일들
-            r'(^|/)\.[a-zA-Z]'     # 더 포괄적인 dot 파일 패턴
-        ]
-        
-        for pattern in dummy_patterns:
-            if re.search(pattern, normalized_path, re.IGNORECASE):
-                return True
-        
-        # 추가 제외 조건 (패턴에서 다루지 않은 나머지)
-        exclude_conditions = [
-            # 빈 파일 또는 매우 작은 파일
-            len(normalized_path.strip()) == 0,
-            # 캐시 파일
-            '/cache/' in normalized_path or '.cache' in normalized_path
-        ]
-        
-        return any(exclude_conditions)
+        return _is_excluded_path(file_path.replace('\\', '/'))
     
     def _is_low_code_density_file(self, file_content: str) -> bool:
         """코드 밀도가 낮은 파일인지 판단 (주석 비율, 공백 라인 비율 체크)"""
@@ -487,21 +606,17 @@ class SmartFileImportanceAnalyzer:
             return 0.0
         
         # 정규화된 경로 (OS 독립적)
-        normalized_path = file_path.replace('\\', '/')
-        
-        max_importance = 0.0
+        return self._structural_importance_cached(file_path.replace('\\', '/'))
+    
+    def _match_structural_importance(self, normalized_path: str) -> float:
+        """정규화된 경로의 구조적 중요도 (패턴 매칭 본체, 결과는 캐시됨)"""
         
-        # 각 패턴 카테고리별로 매칭 확인
-        for category, info in self.structural_patterns.items():
-            patterns = info['patterns']
-            weight = info['weight']
-            
-            for pattern in patterns:
-                if re.search(pattern, normalized_path, re.IGNORECASE):
-                    max_importance = max(max_importance, weight)
-                    break  # 카테고리 내에서 첫 번째 매칭으로 충분
+        # 가중치가 높은 카테고리부터 확인하여 첫 매칭에서 종료
+        for weight, regex in self._structural_regexes:
+            if regex.search(normalized_path):
+                return weight
         
-        return max_importance
+        return 0.0
     
     def _calculate_path_multiplier(self, file_path: str) -> float:
         """경로 기반 보너스/디스카운트 계산"""
@@ -555,47 +670,43 @@ class SmartFileImportanceAnalyzer:
         if not all_files:
             return {}
         
-        importance_scores = {}
+        # 더미/샘플/테스트 데이터는 점수 배열을 만들기 전에 제외
+        files = sorted(f for f in all_files if not self.is_excluded_file(f))
+        if not files:
+            return {}
         
-        for file_path in all_files:
-            # 더미/샘플/테스트 데이터 제외
-            if self.is_excluded_file(file_path):
-                continue
-                
-            # 각 차원의 점수 가져오기 (없으면 0.0)
-            meta_score = metadata_scores.get(file_path, 0.0)
-            dep_score = dependency_centrality.get(file_path, 0.0)
-            churn_score = churn_scores.get(file_path, 0.0)
-            comp_score = complexity_scores.get(file_path, 0.0)
-            
-            # 기획서 공식 적용: 0.4*meta + 0.3*centrality + 0.2*churn + 0.1*complexity
-            base_score = (
-                self.importance_weights['metadata'] * meta_score +
-                self.importance_weights['dependency'] * dep_score +
-                self.importance_weights['churn'] * churn_score +
-                self.importance_weights['complexity'] * comp_score
-            )
-            
-            # 파일 크기 페널티 적용 (50KB 이상 시)
-            size_penalty = 1.0
-            if file_sizes and file_path in file_sizes:
-                file_size = file_sizes[file_path]
-                if file_size > self.size_threshold:
-                    # 지수적 페널티 적용
-                    excess_ratio = file_size / self.size_threshold
-                    size_penalty = math.exp(-0.1 * (excess_ratio - 1))
-                    size_penalty = max(0.3, size_penalty)  # 최소 30% 유지
-            
-            # 경로 기반 보너스/디스카운트 적용
-            path_multiplier = self._calculate_path_multiplier(file_path)
-            
-            # 최종 점수 계산
-            final_score = base_score * path_multiplier * size_penalty
-            final_score = max(0.0, min(1.0, final_score))  # 0-1 범위로 클램핑
-            
-            importance_scores[file_path] = final_score
+        # 파일 순서를 고정하고 각 차원 점수를 연속 배열로 구성 (없으면 0.0)
+        count = len(files)
+        meta_scores = np.fromiter((metadata_scores.get(f, 0.0) for f in files), dtype=np.float64, count=count)
+        dep_scores = np.fromiter((dependency_centrality.get(f, 0.0) for f in files), dtype=np.float64, count=count)
+        churn = np.fromiter((churn_scores.get(f, 0.0) for f in files), dtype=np.float64, count=count)
+        comp_scores = np.fromiter((complexity_scores.get(f, 0.0) for f in files), dtype=np.float64, count=count)
+        
+        # 기획서 공식 적용: 0.4*meta + 0.3*centrality + 0.2*churn + 0.1*complexity
+        base_scores = (
+            self.importance_weights['metadata'] * meta_scores +
+            self.importance_weights['dependency'] * dep_scores +
+            self.importance_weights['churn'] * churn +
+            self.importance_weights['complexity'] * comp_scores
+        )
+        
+        # 파일 크기 페널티 적용 (50KB 이상 시 지수적 페널티, 최소 30% 유지)
+        size_penalties = np.ones(count)
+        if file_sizes:
+            sizes = np.fromiter((file_sizes.get(f, 0) for f in files), dtype=np.float64, count=count)
+            oversized = sizes > self.size_threshold
+            excess_ratio = sizes[oversized] / self.size_threshold
+            size_penalties[oversized] = np.maximum(0.3, np.exp(-0.1 * (excess_ratio - 1)))
+        
+        # 경로 기반 보너스/디스카운트 적용
+        path_multipliers = np.fromiter(
+            (self._calculate_path_multiplier(f) for f in files), dtype=np.float64, count=count
+        )
         
-        return importance_scores
+        # 최종 점수 계산 후 0-1 범위로 클램핑
+        final_scores = np.clip(base_scores * path_multipliers * size_penalties, 0.0, 1.0)
+        
+        return dict(zip(files, final_scores.tolist()))
 
     def calculate_comprehensive_importance_scores(
         self,
@@ -605,48 +716,172 @@ class SmartFileImportanceAnalyzer:
     ) -> Dict[str, float]:
         """종합적인 파일 중요도 점수 계산"""
         
-        # 모든 파일 경로 수집
-        all_files = set()
-        all_files.update(dependency_centrality.keys())
-        all_files.update(churn_metrics.keys())
-        all_files.update(complexity_metrics.keys())
-        
-        if not all_files:
+        # 입력이 모두 비어 있으면 경로 수집 없이 바로 반환
+        if not dependency_centrality and not churn_metrics and not complexity_metrics:
             return {}
         
-        importance_scores = {}
+        # 모든 파일 경로를 한 번의 해시 테이블 구성으로 수집한 뒤 순서를 고정하여 차원별 점수를 연속 배열로 구성
+        # (경로는 인턴하여 이후 메트릭/캐시 딕셔너리 조회와 결과 키 비교를 포인터 비교로 끝냄)
+        all_files = dict.fromkeys(chain(dependency_centrality, churn_metrics, complexity_metrics))
+        files = sorted(map(sys.intern, all_files))
+        count = len(files)
         
-        for file_path in all_files:
-            # 1. 구조적 중요도
-            structural_score = self.calculate_structural_importance(file_path)
-            
-            # 2. 의존성 중심성 (정규화됨)
-            dependency_score = dependency_centrality.get(file_path, 0.0)
-            
-            # 3. 변경 이력 위험도
-            churn_data = churn_metrics.get(file_path, {})
-            churn_score = self._calculate_churn_importance_score(churn_data)
-            
-            # 4. 복잡도 점수
-            complexity_data = complexity_metrics.get(file_path, {})
-            complexity_score = self._calculate_complexity_importance_score(complexity_data)
-            
-            # 기획서 요구사항에 따른 4차원 스코어링 공식 적용
-            # importance_score = 0.4*meta_score + 0.3*centrality_score + 0.2*churn_score + 0.1*complexity_score
-            comprehensive_score = (
-                structural_score * self.importance_weights['metadata'] +
-                dependency_score * self.importance_weights['dependency'] +
-                churn_score * self.importance_weights['churn'] +
-                complexity_score * self.importance_weights['complexity']
+        # 1. 구조적 중요도
+        structural_scores = np.fromiter(
+            (self.calculate_structural_importance(f) for f in files), dtype=SCORE_DTYPE, count=count
+        )
+        
+        # 2. 의존성 중심성 (정규화됨)
+        dependency_scores = np.fromiter(
+            (dependency_centrality.get(f, 0.0) for f in files), dtype=SCORE_DTYPE, count=count
+        )
+        
+        if churn_metrics or complexity_metrics:
+            # 변경 이력/복잡도 지표를 파일당 한 번의 순회로 배열에 추출
+            # (지표 배열과 최종 점수 버퍼는 풀에서 빌려 쓰고 결과를 리스트로 변환한 뒤 반납)
+            with self._scratch_frame(count, 7) as buffers:
+                features = self._extract_feature_arrays(files, churn_metrics, complexity_metrics, buffers[:6])
+                
+                # 3. 변경 이력 위험도
+                churn_scores = self._calculate_churn_importance_scores(features)
+                
+                # 4. 복잡도 점수
+                complexity_scores = self._calculate_complexity_importance_scores(features)
+                
+                return self._combine_importance_scores(
+                    files, structural_scores, dependency_scores, churn_scores, complexity_scores, buffers[6]
+                )
+        
+        # 의존성 데이터만 있으면 지표 추출 순회를 생략 (두 점수 모두 0)
+        with self._scratch_frame(count, 2) as (zeros, final_scores):
+            zeros.fill(0.0)
+            return self._combine_importance_scores(
+                files, structural_scores, dependency_scores, zeros, zeros, final_scores
             )
+    
+    def _combine_importance_scores(
+        self,
+        files: List[str],
+        structural_scores: np.ndarray,
+        dependency_scores: np.ndarray,
+        churn_scores: np.ndarray,
+        complexity_scores: np.ndarray,
+        out: np.ndarray
+    ) -> Dict[str, float]:
+        """4차원 점수를 가중 합산하고 경로 배수를 반영하여 파일별 점수 딕셔너리로 변환"""
+        
+        # 경로 기반 보너스/디스카운트
+        path_multipliers = np.fromiter(
+            (self._calculate_path_multiplier(f) for f in files), dtype=SCORE_DTYPE, count=len(files)
+        )
+        
+        # 기획서 요구사항에 따른 4차원 스코어링 공식 적용 후 경로 배수 반영
+        # importance_score = 0.4*meta_score + 0.3*centrality_score + 0.2*churn_score + 0.1*complexity_score
+        with self._scratch_frame((len(files), 4), 1) as (features,):
+            _combine_scores(
+                structural_scores, dependency_scores, churn_scores, complexity_scores, path_multipliers,
+                self.importance_weights['metadata'],
+                self.importance_weights['dependency'],
+                self.importance_weights['churn'],
+                self.importance_weights['complexity'],
+                out,
+                features
+            )
+        
+        return dict(zip(files, out.tolist()))
+    
+    @contextmanager
+    def _scratch_frame(self, shape: Union[int, Tuple[int, int]], count: int):
+        """모양이 shape인 SCORE_DTYPE 작업 버퍼 count개를 풀에서 빌려주고 블록 종료 시 반납
+        
+        버퍼는 빌리는 동안 풀에서 빠지므로 중첩/동시 호출이 같은 버퍼를 공유하지 않음.
+        내용은 초기화되지 않으니 호출자가 채워서 사용해야 함.
+        """
+        if shape not in self._scratch and len(self._scratch) >= self.scratch_pool_lengths:
+            # 모양 종류가 너무 많아지면 풀을 비워 메모리 상한 유지
+            self._scratch.clear()
+        pool = self._scratch[shape]
+        buffers = [pool.pop() if pool else np.empty(shape, dtype=SCORE_DTYPE) for _ in range(count)]
+        try:
+            yield buffers
+        finally:
+            pool.extend(buffers)
+    
+    def _extract_feature_arrays(
+        self,
+        files: List[str],
+        churn_metrics: Dict[str, Dict[str, Any]],
+        complexity_metrics: Dict[str, Dict[str, Any]],
+        buffers: Optional[List[np.ndarray]] = None
+    ) -> Dict[str, np.ndarray]:
+        """파일 순서에 맞춘 변경 이력/복잡도 지표 배열 추출 (파일당 지표 딕셔너리 조회 1회)
+        
+        누락 키는 스칼라 점수 계산과 같은 기본값을 사용하고, 지표가 없거나 빈 파일은 has_* 마스크가 False.
+        buffers로 길이가 파일 수와 같은 SCORE_DTYPE 배열 6개를 넘기면 새로 할당하지 않고 채워서 사용
+        """
+        count = len(files)
+        if buffers is None:
+            buffers = [np.empty(count, dtype=SCORE_DTYPE) for _ in range(6)]
+        commit_frequency, recent_activity, stability_score, cyclomatic, maintainability, executable_lines = buffers
+        commit_frequency.fill(0.0)
+        recent_activity.fill(0.0)
+        stability_score.fill(1.0)
+        cyclomatic.fill(0.0)
+        maintainability.fill(100.0)
+        executable_lines.fill(0.0)
+        has_churn = np.zeros(count, dtype=bool)
+        has_complexity = np.zeros(count, dtype=bool)
+        
+        for i, file_path in enumerate(files):
+            churn_data = churn_metrics.get(file_path)
+            if churn_data:
+                has_churn[i] = True
+                commit_frequency[i] = churn_data.get('commit_frequency', 0)
+                recent_activity[i] = churn_data.get('recent_activity', 0.0)
+                stability_score[i] = churn_data.get('stability_score', 1.0)
             
-            # 경로 기반 보너스/디스카운트 적용
-            path_multiplier = self._calculate_path_multiplier(file_path)
-            comprehensive_score *= path_multiplier
-            
-            importance_scores[file_path] = min(1.0, comprehensive_score)
+            complexity_data = complexity_metrics.get(file_path)
+            if complexity_data:
+                has_complexity[i] = True
+                cyclomatic[i] = complexity_data.get('cyclomatic_complexity', 0)
+                maintainability[i] = complexity_data.get('maintainability_index', 100)
+                executable_lines[i] = complexity_data.get('lines_of_code', {}).get('executable', 0)
+        
+        return {
+            'has_churn': has_churn,
+            'commit_frequency': commit_frequency,
+            'recent_activity': recent_activity,
+            'stability_score': stability_score,
+            'has_complexity': has_complexity,
+            'cyclomatic_complexity': cyclomatic,
+            'maintainability_index': maintainability,
+            'executable_lines': executable_lines
+        }
+    
+    def _calculate_churn_importance_scores(self, features: Dict[str, np.ndarray]) -> np.ndarray:
+        """변경 이력 기반 중요도 점수 일괄 계산 (_calculate_churn_importance_score의 배열 버전)"""
         
-        return importance_scores
+        frequency_score = np.minimum(1.0, features['commit_frequency'] / 20.0)
+        churn_importance = np.minimum(
+            1.0,
+            frequency_score * 0.3 +
+            features['recent_activity'] * 0.3 +
+            features['stability_score'] * 0.4
+        )
+        
+        return np.where(features['has_churn'], churn_importance, 0.0)
+    
+    def _calculate_complexity_importance_scores(self, features: Dict[str, np.ndarray]) -> np.ndarray:
+        """복잡도 기반 중요도 점수 일괄 계산 (_calculate_complexity_importance_score의 배열 버전)"""
+        
+        complexity_importance = np.minimum(
+            1.0,
+            np.minimum(1.0, features['cyclomatic_complexity'] / 20.0) * 0.4 +
+            (1.0 - features['maintainability_index'] / 100.0) * 0.3 +
+            np.minimum(1.0, features['executable_lines'] / 200.0) * 0.3
+        )
+        
+        return np.where(features['has_complexity'], complexity_importance, 0.0)
     
     def _calculate_churn_importance_score(self, churn_data: Dict[str, Any]) -> float:
         """변경 이력 기반 중요도 점수 계산"""
@@ -720,12 +955,22 @@ class SmartFileImportanceAnalyzer:
             dependency_centrality, churn_metrics, complexity_metrics
         )
         
-        # 점수순으로 정렬
-        sorted_files = sorted(
-            importance_scores.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:top_n]
+        return self._select_critical_files(
+            importance_scores, dependency_centrality, churn_metrics, complexity_metrics, top_n
+        )
+    
+    def _select_critical_files(
+        self,
+        importance_scores: Dict[str, float],
+        dependency_centrality: Dict[str, float],
+        churn_metrics: Dict[str, Dict[str, Any]],
+        complexity_metrics: Dict[str, Dict[str, Any]],
+        top_n: int
+    ) -> List[Dict[str, Any]]:
+        """계산된 종합 점수에서 핵심 파일 선택 및 상세 정보 구성"""
+        
+        # 점수 상위 top_n개만 선택 (전체 정렬 없이 O(N log top_n), 동점은 기존 정렬과 같은 순서)
+        sorted_files = heapq.nlargest(top_n, importance_scores.items(), key=lambda x: x[1])
         
         critical_files = []
         
@@ -776,26 +1021,13 @@ class SmartFileImportanceAnalyzer:
             elif 'api' in file_path or 'service' in file_path:
                 reasons.append("핵심 비즈니스 로직 담당")
         
-        # 의존성 중심성 기반 이유
-        dependency = metrics.get('dependency_centrality', 0.0)
-        if dependency >= 0.7:
-            reasons.append("다른 파일들이 많이 참조하는 핵심 의존성")
-        elif dependency >= 0.5:
-            reasons.append("중요한 모듈 간 연결점 역할")
-        
-        # 변경 이력 기반 이유
-        churn = metrics.get('churn_risk', 0.0)
-        if churn >= 0.7:
-            reasons.append("활발하게 개발되고 있는 핵심 기능")
-        elif churn >= 0.5:
-            reasons.append("지속적으로 개선되고 있는 중요 모듈")
-        
-        # 복잡도 기반 이유
-        complexity = metrics.get('complexity_score', 0.0)
-        if complexity >= 0.6:
-            reasons.append("높은 복잡도로 인한 주의 필요 파일")
-        elif complexity >= 0.4:
-            reasons.append("적절한 복잡도의 핵심 로직 포함")
+        # 의존성 중심성/변경 이력/복잡도 기반 이유 (규칙 테이블)
+        for metric_key, tiers in self.metric_reason_rules:
+            value = metrics.get(metric_key, 0.0)
+            for threshold, reason in tiers:
+                if value >= threshold:
+                    reasons.append(reason)
+                    break
         
         # 기본 이유 (다른 이유가 없는 경우)
         if not reasons:
@@ -818,31 +1050,31 @@ class SmartFileImportanceAnalyzer:
             dependency_centrality, churn_metrics, complexity_metrics
         )
         
-        categorized = {
-            'critical': [],
-            'important': [],
-            'moderate': [],
-            'low': []
-        }
-        
-        for file_path, score in importance_scores.items():
-            if score >= self.importance_thresholds['critical']:
-                categorized['critical'].append(file_path)
-            elif score >= self.importance_thresholds['important']:
-                categorized['important'].append(file_path)
-            elif score >= self.importance_thresholds['moderate']:
-                categorized['moderate'].append(file_path)
-            else:
-                categorized['low'].append(file_path)
-        
-        # 각 카테고리 내에서 점수순 정렬
-        for category in categorized:
-            categorized[category].sort(
-                key=lambda f: importance_scores[f],
-                reverse=True
-            )
+        return self._categorize_scores(importance_scores)
+    
+    def _categorize_scores(self, importance_scores: Dict[str, float]) -> Dict[str, List[str]]:
+        """계산된 종합 점수를 임계값별로 분류"""
+        
+        count = len(importance_scores)
+        file_paths = np.fromiter(importance_scores.keys(), dtype=object, count=count)
+        scores = np.fromiter(importance_scores.values(), dtype=np.float64, count=count)
+        
+        # 점수 내림차순 정렬 (안정 정렬이라 동점은 입력 순서 유지) 후 임계값 구간 번호를 한 번에 계산
+        # 구간 0: low, 1: moderate, 2: important, 3: critical (각 임계값 이상이면 해당 구간)
+        order = np.argsort(-scores, kind='stable')
+        file_paths = file_paths[order]
+        bins = np.digitize(scores[order], [
+            self.importance_thresholds['moderate'],
+            self.importance_thresholds['important'],
+            self.importance_thresholds['critical']
+        ])
         
-        return categorized
+        return {
+            'critical': file_paths[bins == 3].tolist(),
+            'important': file_paths[bins == 2].tolist(),
+            'moderate': file_paths[bins == 1].tolist(),
+            'low': file_paths[bins == 0].tolist()
+        }
     
     def calculate_importance_distribution(
         self,
@@ -856,20 +1088,31 @@ class SmartFileImportanceAnalyzer:
             dependency_centrality, churn_metrics, complexity_metrics
         )
         
+        return self._distribution_from_scores(importance_scores)
+    
+    def _distribution_from_scores(self, importance_scores: Dict[str, float]) -> Dict[str, float]:
+        """계산된 종합 점수의 분포 통계"""
+        
         if not importance_scores:
             return {}
         
-        scores = list(importance_scores.values())
+        scores = np.fromiter(importance_scores.values(), dtype=np.float64, count=len(importance_scores))
+        
+        # 사분위수는 statistics.quantiles 기본값(exclusive)과 같은 weibull 방식으로 한 번에 계산
+        if len(scores) >= 4:
+            q1, q3 = np.percentile(scores, [25, 75], method='weibull')
+        else:
+            q1, q3 = scores.min(), scores.max()
         
         return {
-            'mean': round(statistics.mean(scores), 3),
-            'median': round(statistics.median(scores), 3),
-            'std_dev': round(statistics.stdev(scores) if len(scores) > 1 else 0.0, 3),
-            'min': round(min(scores), 3),
-            'max': round(max(scores), 3),
+            'mean': round(float(scores.mean()), 3),
+            'median': round(float(np.median(scores)), 3),
+            'std_dev': round(float(scores.std(ddof=1)) if len(scores) > 1 else 0.0, 3),
+            'min': round(float(scores.min()), 3),
+            'max': round(float(scores.max()), 3),
             'quartiles': {
-                'q1': round(statistics.quantiles(scores, n=4)[0] if len(scores) >= 4 else min(scores), 3),
-                'q3': round(statistics.quantiles(scores, n=4)[2] if len(scores) >= 4 else max(scores), 3)
+                'q1': round(float(q1), 3),
+                'q3': round(float(q3), 3)
             }
         }
     
@@ -944,30 +1187,27 @@ class SmartFileImportanceAnalyzer:
     ) -> Dict[str, Any]:
         """프로젝트 전체 파일 중요도 분석"""
         
+        # 종합 중요도 점수는 한 번만 계산하여 식별/분포/분류에 공유
+        importance_scores = self.calculate_comprehensive_importance_scores(
+            dependency_centrality, churn_metrics, complexity_metrics
+        )
+        
         # 핵심 파일 식별 (더 많은 파일 포함)
-        critical_files = self.identify_critical_files(
-            dependency_centrality, churn_metrics, complexity_metrics, top_n=15
+        critical_files = self._select_critical_files(
+            importance_scores, dependency_centrality, churn_metrics, complexity_metrics, top_n=15
         )
         
         # 중요도 분포 계산
-        distribution = self.calculate_importance_distribution(
-            dependency_centrality, churn_metrics, complexity_metrics
-        )
+        distribution = self._distribution_from_scores(importance_scores)
         
         # 파일 분류
-        categorized = self.categorize_files_by_importance(
-            dependency_centrality, churn_metrics, complexity_metrics
-        )
+        categorized = self._categorize_scores(importance_scores)
         
         # 개선 제안
         suggestions = self.get_improvement_suggestions(critical_files)
         
-        # 요약 정보
-        total_files = len(set(
-            list(dependency_centrality.keys()) +
-            list(churn_metrics.keys()) +
-            list(complexity_metrics.keys())
-        ))
+        # 요약 정보 (종합 점수는 세 메트릭의 모든 파일 경로를 키로 가지므로 그 수가 곧 분석 파일 수)
+        total_files = len(importance_scores)
         
         summary = {
             'total_files_analyzed': total_files,
@@ -986,6 +1226,22 @@ class SmartFileImportanceAnalyzer:
             'summary': summary
         }
     
+    def analyze_project_file_importance_from_json(
+        self,
+        dependency_json: Union[bytes, str],
+        churn_json: Union[bytes, str],
+        complexity_json: Union[bytes, str]
+    ) -> Dict[str, Any]:
+        """JSON 원문(파일 경로별 메트릭)을 바로 받아 프로젝트 파일 중요도 분석
+        
+        HTTP 요청 본문 등을 호출자가 json.loads로 변환하지 않고 넘기면 orjson(설치 시)으로 디코딩한다.
+        """
+        return self.analyze_project_file_importance(
+            json_loads(dependency_json) or {},
+            json_loads(churn_json) or {},
+            json_loads(complexity_json) or {}
+        )
+    
     async def analyze_repository(
         self,
         repo_url: str,
@@ -1156,32 +1412,8 @@ class SmartFileImportanceAnalyzer:
     
     def _calculate_extension_importance(self, file_path: str) -> float:
         """확장자 기반 중요도 점수"""
-        ext = Path(file_path).suffix.lower()
-        
-        # 확장자별 중요도 매핑
-        extension_weights = {
-            # 소스 코드 (높음)
-            '.py': 0.9, '.js': 0.9, '.ts': 0.9, '.tsx': 0.9, '.jsx': 0.9,
-            '.java': 0.8, '.go': 0.8, '.rs': 0.8, '.cpp': 0.8, '.c': 0.8,
-            '.php': 0.7, '.rb': 0.7, '.cs': 0.7, '.kt': 0.7,
-            
-            # 설정 파일 (매우 높음)
-            '.json': 0.95, '.yaml': 0.9, '.yml': 0.9, '.toml': 0.9,
-            '.ini': 0.8, '.conf': 0.8, '.config': 0.8,
-            
-            # 웹 파일
-            '.html': 0.7, '.css': 0.6, '.scss': 0.6, '.less': 0.6,
-            '.vue': 0.8, '.svelte': 0.8,
-            
-            # 문서
-            '.md': 0.6, '.rst': 0.5, '.txt': 0.3,
-            
-            # 기타
-            '.xml': 0.7, '.sql': 0.7, '.sh': 0.8, '.bat': 0.6,
-            '.dockerfile': 0.9, '.gitignore': 0.6
-        }
-        
-        return extension_weights.get(ext, 0.4)  # 기본값
+        ext = os.path.splitext(file_path)[1].lower()
+        return EXTENSION_WEIGHTS.get(ext, 0.4)  # 기본값
     
     def _calculate_location_importance(self, file_path: str) -> float:
         """디렉토리 위치 기반 중요도"""
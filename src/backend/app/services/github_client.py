@@ -39,6 +39,9 @@ class GitHubClient:
         
         self.session = None
         self.api_call_count = 0
+        
+        # 여러 파일 내용 동시 조회 시 최대 동시 요청 수 (GitHub 동시 연결 제한 준수)
+        self.max_concurrency = 20
         self.total_response_time = 0.0
         
         print(f"[GITHUB_CLIENT] GitHubClient 초기화 완료")
@@ -281,6 +284,16 @@ class GitHubClient:
             print(f"[GITHUB_CLIENT] 파일 내용 수집 오류 ({response_time:.2f}초) - {file_path}: {e}")
             return None
     
+    async def get_files_content(self, repo_url: str, file_paths: List[str]) -> List[Optional[str]]:
+        """여러 파일 내용을 동시에 조회 (동시 요청 수는 max_concurrency로 제한, 결과는 입력 순서)"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch(file_path: str) -> Optional[str]:
+            async with semaphore:
+                return await self.get_file_content(repo_url, file_path)
+        
+        return await asyncio.gather(*(fetch(file_path) for file_path in file_paths))
+    
     async def get_languages(self, repo_url: str) -> Dict[str, int]:
         """저장소 언어 통계 조회"""
         start_time = time.time()
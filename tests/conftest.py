@@ -8,7 +8,8 @@ import pytest
 import pytest_asyncio
 import asyncio
 import os
-from typing import AsyncGenerator
+from types import MappingProxyType
+from typing import Any, AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -22,6 +23,7 @@ os.environ.update({
 
 from app.core.database import Base
 from app.core.config import Settings
+from utils.performance import PerfTimer
 
 
 # 테스트용 설정
@@ -79,4 +81,121 @@ async def db_session(test_engine):
 @pytest.fixture
 def test_settings():
     """테스트용 설정"""
-    return TestSettings()
\ No newline at end of file
+    return TestSettings()
+
+
+@pytest.fixture
+def perf_timer():
+    """단조 타이머 팩토리: `with perf_timer() as timer: ...` 후 timer.elapsed_ms 확인"""
+    return PerfTimer
+
+
+@pytest.fixture(scope="class")
+def question_generator_cls():
+    """테스트 클래스 단위로 공유하는 EnhancedQuestionGenerator (생성 비용이 큰 초기화를 한 번만 수행)"""
+    from app.agents.enhanced_question_generator import EnhancedQuestionGenerator
+    return EnhancedQuestionGenerator()
+
+
+def _freeze(data: Any) -> Any:
+    """세션 공유 fixture가 테스트 간에 변경되지 않도록 dict/list를 읽기 전용 뷰(MappingProxyType/tuple)로 변환"""
+    if isinstance(data, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in data.items()})
+    if isinstance(data, list):
+        return tuple(_freeze(item) for item in data)
+    return data
+
+
+@pytest.fixture(scope="session")
+def sample_analysis_data():
+    """4차원 분석 결과 샘플 데이터 (세션 공유, 읽기 전용)"""
+    return _freeze({
+        "repo_url": "https://github.com/owner/repo",
+        "tech_stack": {"Python": 0.7, "JavaScript": 0.2, "HTML": 0.1},
+        "smart_file_analysis": {
+            "critical_files": [
+                {
+                    "file_path": "src/main.py",
+                    "importance_score": 0.95,
+                    "reasons": ["애플리케이션 진입점 파일", "다른 파일들이 많이 참조하는 핵심 의존성"],
+                    "metrics": {
+                        "structural_importance": 0.9,
+                        "dependency_centrality": 0.8,
+                        "churn_risk": 0.6,
+                        "complexity_score": 0.7
+                    }
+                },
+                {
+                    "file_path": "src/config.py",
+                    "importance_score": 0.87,
+                    "reasons": ["프로젝트 핵심 설정 파일", "핵심 모듈 또는 기반 라이브러리"],
+                    "metrics": {
+                        "structural_importance": 0.95,
+                        "dependency_centrality": 0.6,
+                        "churn_risk": 0.2,
+                        "complexity_score": 0.3
+                    }
+                }
+            ]
+        },
+        "file_contents": {
+            "src/main.py": {
+                "success": True,
+                "content": """#!/usr/bin/env python3
+import os
+import sys
+from config import DATABASE_URL, API_KEY
+
+class Application:
+    def __init__(self):
+        self.db_url = DATABASE_URL
+        self.api_key = API_KEY
+
+    async def start(self):
+        print("Starting application...")
+        await self.connect_database()
+
+    async def connect_database(self):
+        # Database connection logic
+        pass
+
+if __name__ == "__main__":
+    app = Application()
+    asyncio.run(app.start())
+""",
+                "size": 512,
+                "encoding": "utf-8"
+            },
+            "src/config.py": {
+                "success": True,
+                "content": """import os
+from typing import Optional
+
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///app.db")
+API_KEY = os.getenv("API_KEY")
+DEBUG = os.getenv("DEBUG", "False").lower() == "true"
+
+ALLOWED_HOSTS = ["localhost", "127.0.0.1"]
+
+class Config:
+    def __init__(self):
+        self.database_url = DATABASE_URL
+        self.api_key = API_KEY
+        self.debug = DEBUG
+""",
+                "size": 384,
+                "encoding": "utf-8"
+            }
+        }
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_tiktoken_result():
+    """tiktoken 토큰 계산 결과 Mock (세션 공유, 읽기 전용)"""
+    return _freeze({
+        "total_tokens": 1500,
+        "prompt_tokens": 1200,
+        "max_tokens": 4000,
+        "remaining_tokens": 2500
+    })
@@ -6,6 +6,7 @@ NetworkX 라이브러리를 활용한 의존성 그래프 분석 시스템 테
 
 import pytest
 import json
+import dataclasses
 from unittest.mock import Mock, patch, mock_open
 from pathlib import Path
 
@@ -13,17 +14,25 @@ from app.services.dependency_analyzer import (
     DependencyAnalyzer,
     DependencyGraph,
     DependencyNode,
+    DependencyTable,
     CentralityMetrics
 )
 
 
+@pytest.fixture(scope="session")
+def shared_dependency_analyzer():
+    """세션 전체에서 재사용하는 DependencyAnalyzer 인스턴스"""
+    return DependencyAnalyzer()
+
+
 class TestDependencyAnalyzer:
     """Dependency Analyzer 테스트 클래스"""
     
     @pytest.fixture
-    def analyzer(self):
-        """DependencyAnalyzer 인스턴스"""
-        return DependencyAnalyzer()
+    def analyzer(self, shared_dependency_analyzer):
+        """테스트마다 캐시를 비운 공유 DependencyAnalyzer 인스턴스"""
+        shared_dependency_analyzer.reset()
+        return shared_dependency_analyzer
     
     @pytest.fixture
     def sample_package_json(self):
@@ -99,9 +108,25 @@ sqlalchemy==2.0.23"""
         assert dependencies["fastapi"]["type"] == "production"
         assert dependencies["redis"]["version"] == ">=4.0.0"
     
+    def test_parse_requirements_txt_names_and_extras(self, analyzer):
+        """extras, 점이 포함된 패키지명, 버전 없는 항목 파싱 테스트"""
+        requirements = """# comment
+zope.interface==6.0
+uvicorn[standard]==0.24.0
+
+requests
+"""
+        with patch("builtins.open", mock_open(read_data=requirements)):
+            dependencies = analyzer._parse_requirements_txt("requirements.txt")
+
+        assert dependencies["zope.interface"]["version"] == "==6.0"
+        assert dependencies["uvicorn[standard]"]["version"] == "==0.24.0"
+        assert dependencies["requests"]["version"] == "latest"
+        assert len(dependencies) == 3
+
     def test_parse_pom_xml(self, analyzer, sample_pom_xml):
         """pom.xml 파싱 테스트"""
-        with patch("builtins.open", mock_open(read_data=sample_pom_xml)):
+        with patch("builtins.open", mock_open(read_data=sample_pom_xml.encode("utf-8"))):
             dependencies = analyzer._parse_pom_xml("pom.xml")
         
         assert len(dependencies) == 3
@@ -110,6 +135,39 @@ sqlalchemy==2.0.23"""
         assert dependencies["spring-boot-starter"]["type"] == "production"
         assert dependencies["junit"]["type"] == "test"
     
+    def test_parse_pom_xml_skips_plugin_dependencies(self, analyzer):
+        """네임스페이스 없는 pom.xml 파싱 및 플러그인 의존성 제외 테스트"""
+        pom_xml = """<project>
+    <dependencies>
+        <dependency>
+            <artifactId>guava</artifactId>
+            <version>32.1.0</version>
+        </dependency>
+    </dependencies>
+    <build>
+        <plugins>
+            <plugin>
+                <artifactId>maven-compiler-plugin</artifactId>
+                <dependencies>
+                    <dependency>
+                        <artifactId>plexus-compiler</artifactId>
+                    </dependency>
+                </dependencies>
+            </plugin>
+        </plugins>
+    </build>
+</project>"""
+
+        with patch("builtins.open", mock_open(read_data=pom_xml.encode("utf-8"))):
+            dependencies = analyzer._parse_pom_xml("pom.xml")
+
+        assert list(dependencies) == ["guava"]
+        assert dependencies["guava"]["version"] == "32.1.0"
+
+        with patch("builtins.open", mock_open(read_data=b"<project><dependencies>")), \
+             pytest.raises(ValueError, match="Invalid XML"):
+            analyzer._parse_pom_xml("pom.xml")
+
     def test_build_dependency_graph(self, analyzer):
         """의존성 그래프 구성 테스트"""
         dependencies = {
@@ -161,6 +219,191 @@ sqlalchemy==2.0.23"""
         # A가 가장 중요한 노드여야 함 (많은 의존성을 가짐)
         assert metrics["pagerank"]["A"] > metrics["pagerank"]["D"]
     
+    def test_centrality_metrics_memoized_by_structure(self, analyzer):
+        """같은 구조의 그래프는 중앙성 계산을 재사용하는지 테스트"""
+        import networkx as nx
+
+        graph = nx.DiGraph([("A", "B"), ("B", "C")])
+        same_structure = nx.DiGraph([("B", "C"), ("A", "B")])
+
+        first = analyzer._calculate_centrality_metrics(graph)
+        first["pagerank"]["A"] = 99.0  # 호출자 측 수정이 캐시에 영향을 주지 않아야 함
+
+        with patch.object(analyzer, '_sparse_pagerank') as pagerank:
+            second = analyzer._calculate_centrality_metrics(same_structure)
+            pagerank.assert_not_called()
+
+        assert second["pagerank"]["A"] != 99.0
+        assert second["betweenness"]["B"] == pytest.approx(0.5)
+
+        # 구조가 바뀌면 다시 계산
+        graph.add_edge("C", "A")
+        third = analyzer._calculate_centrality_metrics(graph)
+        assert third["pagerank"]["A"] == pytest.approx(1 / 3)
+
+    def test_centrality_metrics_edgeless_graph_shortcut(self, analyzer):
+        """엣지가 없는 그래프는 알고리즘 실행 없이 기본값을 반환하는지 테스트"""
+        dependencies = {f"pkg_{i}": {"version": "1.0.0", "type": "production"} for i in range(4)}
+        graph = analyzer._build_dependency_graph(dependencies)
+
+        with patch.object(analyzer, '_sparse_closeness_centrality') as closeness:
+            metrics = analyzer._calculate_centrality_metrics(graph)
+            closeness.assert_not_called()
+
+        assert set(metrics["betweenness"].values()) == {0.0}
+        assert set(metrics["closeness"].values()) == {0.0}
+        assert set(metrics["pagerank"].values()) == {0.25}
+
+    def test_dense_betweenness_matches_networkx_for_small_graphs(self, analyzer):
+        """작은 그래프의 밀집 행렬 Betweenness가 NetworkX 결과와 일치하는지 테스트"""
+        import networkx as nx
+
+        for seed in range(20):
+            graph = nx.gnp_random_graph(7, 0.35, directed=True, seed=seed)
+
+            betweenness = analyzer._dense_betweenness_centrality(graph)
+            expected = nx.betweenness_centrality(graph)
+
+            for node, value in expected.items():
+                assert betweenness[node] == pytest.approx(value)
+
+    def test_csr_betweenness_matches_networkx(self, analyzer):
+        """CSR 배열 Brandes 커널이 방향/무방향 그래프 모두 NetworkX 결과와 일치하는지 테스트"""
+        import networkx as nx
+
+        for graph in (nx.gnp_random_graph(40, 0.1, directed=True, seed=3),
+                      nx.barabasi_albert_graph(40, 2, seed=5)):
+            betweenness = analyzer._csr_betweenness_centrality(graph)
+            expected = nx.betweenness_centrality(graph)
+
+            for node, value in expected.items():
+                assert betweenness[node] == pytest.approx(value)
+
+    def test_default_betweenness_uses_csr_kernel_only_for_large_graphs(self, analyzer, monkeypatch):
+        """기본 경로가 임계값 미만에서는 NetworkX를, 이상에서는 CSR 커널을 사용하고 결과가 일치하는지 테스트"""
+        import networkx as nx
+        from unittest.mock import patch
+
+        monkeypatch.setattr(analyzer, "CSR_BETWEENNESS_NODE_LIMIT", 30)
+        small = nx.gnp_random_graph(20, 0.15, directed=True, seed=1)
+        with patch.object(analyzer, "_csr_betweenness_centrality") as mock_csr:
+            analyzer._calculate_centrality_metrics(small)
+        mock_csr.assert_not_called()
+
+        for seed in range(10):
+            for graph in (nx.gnp_random_graph(40, 0.08, directed=True, seed=seed),
+                          nx.gnp_random_graph(40, 0.08, seed=seed)):
+                with patch.object(
+                    analyzer, "_csr_betweenness_centrality", wraps=analyzer._csr_betweenness_centrality
+                ) as mock_csr:
+                    metrics = analyzer._calculate_centrality_metrics(graph)
+                mock_csr.assert_called_once()
+
+                expected = nx.betweenness_centrality(graph)
+                assert metrics["betweenness"].keys() == expected.keys()
+                for node, value in expected.items():
+                    assert metrics["betweenness"][node] == pytest.approx(value)
+
+    def test_chunked_betweenness_matches_networkx(self):
+        """청크 단위 Betweenness 계산이 NetworkX 결과와 일치하는지 테스트"""
+        import networkx as nx
+
+        graph = nx.gnp_random_graph(30, 0.15, directed=True, seed=42)
+        analyzer = DependencyAnalyzer(chunk_size=4)
+
+        metrics = analyzer._calculate_centrality_metrics(graph)
+        expected = nx.betweenness_centrality(graph)
+
+        assert metrics["betweenness"].keys() == expected.keys()
+        for node, value in expected.items():
+            assert metrics["betweenness"][node] == pytest.approx(value)
+
+    def test_parallel_betweenness_matches_networkx(self):
+        """병렬 Betweenness 계산이 NetworkX 결과와 일치하는지 테스트"""
+        import networkx as nx
+
+        graph = nx.gnp_random_graph(30, 0.15, directed=True, seed=7)
+        analyzer = DependencyAnalyzer(n_jobs=2)
+
+        betweenness = analyzer._parallel_betweenness_centrality(graph, 2)
+        expected = nx.betweenness_centrality(graph)
+
+        for node, value in expected.items():
+            assert betweenness[node] == pytest.approx(value)
+
+    def test_sparse_pagerank_matches_networkx(self, analyzer):
+        """희소 행렬 PageRank가 NetworkX 결과와 일치하는지 테스트"""
+        import networkx as nx
+
+        graph = nx.gnp_random_graph(50, 0.08, directed=True, seed=3)
+
+        pagerank = analyzer._sparse_pagerank(graph)
+        expected = nx.pagerank(graph, alpha=0.85, max_iter=100, tol=1e-6)
+
+        assert sum(pagerank.values()) == pytest.approx(1.0)
+        for node, value in expected.items():
+            assert pagerank[node] == pytest.approx(value, abs=1e-6)
+
+    def test_sparse_closeness_matches_networkx(self, analyzer):
+        """CSR 기반 Closeness가 NetworkX 결과와 일치하는지 테스트"""
+        import networkx as nx
+
+        graph = nx.gnp_random_graph(40, 0.05, directed=True, seed=5)
+
+        closeness = analyzer._sparse_closeness_centrality(graph)
+        expected = nx.closeness_centrality(graph)
+
+        for node, value in expected.items():
+            assert closeness[node] == pytest.approx(value)
+
+    def test_csr_adjacency_shared_with_graph(self, analyzer):
+        """한 번 만든 CSR 행렬이 그래프에 캐시되어 재사용되는지 테스트"""
+        dependencies = {
+            "react": {"version": "^18.2.0", "type": "production"},
+            "axios": {"version": "^1.4.0", "type": "production"}
+        }
+
+        graph = analyzer._build_dependency_graph(dependencies)
+        assert "csr_adjacency" not in graph.graph
+        analyzer._get_csr_adjacency(graph)
+        _, adjacency, nodelist = graph.graph["csr_adjacency"]
+
+        assert analyzer._get_csr_adjacency(graph)[0] is adjacency
+        assert nodelist == ["react", "axios"]
+
+        # 엣지가 추가되면 다시 구성
+        graph.add_edge("react", "axios")
+        assert analyzer._get_csr_adjacency(graph)[0].nnz == 1
+
+    def test_centrality_metrics_hash_graph_once(self, analyzer):
+        """중앙성 계산 한 번에 그래프 구조 해시를 한 번만 계산하는지 테스트"""
+        import networkx as nx
+        from unittest.mock import patch
+
+        graph = nx.gnp_random_graph(30, 0.1, directed=True, seed=11)
+        with patch.object(
+            analyzer, "_graph_structure_key", wraps=analyzer._graph_structure_key
+        ) as structure_key:
+            analyzer._calculate_centrality_metrics(graph)
+
+        assert structure_key.call_count == 1
+
+    def test_csr_adjacency_rebuilt_when_edges_change(self, analyzer):
+        """노드/엣지 수가 같아도 엣지가 바뀌면 CSR 캐시를 다시 구성하는지 테스트"""
+        import networkx as nx
+
+        graph = nx.DiGraph([("a", "b"), ("b", "c"), ("c", "d")])
+        analyzer._sparse_pagerank(graph)
+
+        # 같은 엣지 수를 유지하면서 구조 변경
+        graph.remove_edge("c", "d")
+        graph.add_edge("d", "a")
+
+        pagerank = analyzer._sparse_pagerank(graph)
+        expected = nx.pagerank(graph, alpha=0.85, max_iter=100, tol=1e-6)
+        for node, value in expected.items():
+            assert pagerank[node] == pytest.approx(value, abs=1e-6)
+
     def test_apply_depth_weights(self, analyzer):
         """의존성 깊이별 가중치 적용 테스트"""
         import networkx as nx
@@ -217,7 +460,30 @@ sqlalchemy==2.0.23"""
         assert node.version == "^18.2.0"
         assert node.dependency_type == "production"
         assert node.file_source == "package.json"
+
+        # slots 기반 불변 객체
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            node.version = "^19.0.0"
     
+    def test_dependency_table_mapping_facade(self):
+        """SoA 의존성 테이블의 Mapping 동작 및 타입별 개수 테스트"""
+        table = DependencyTable(
+            names=["react", "jest", "junit"],
+            versions=["^18.2.0", "^29.5.0", "4.13.2"],
+            dependency_types=["production", "development", "test"],
+            sources=["package.json", "package.json", "pom.xml"]
+        )
+
+        assert len(table) == 3
+        assert list(table) == ["react", "jest", "junit"]
+        assert "jest" in table and "vue" not in table
+        assert table["junit"] == DependencyNode("junit", "4.13.2", "test", "pom.xml")
+        assert table.count_type("production") == 1
+        assert table.count_type("development") == 1
+        assert table.count_type("optional") == 0
+        assert table.types.dtype.name == "int8"
+
     def test_centrality_metrics_creation(self):
         """CentralityMetrics 생성 테스트"""
         metrics = CentralityMetrics(
@@ -260,12 +526,47 @@ sqlalchemy==2.0.23"""
         assert len(graph.dependencies) == 2
         assert isinstance(graph.centrality_metrics, CentralityMetrics)
     
-    def test_error_handling_missing_files(self, analyzer):
+    @pytest.mark.asyncio
+    async def test_error_handling_missing_files(self, analyzer):
         """의존성 파일이 없는 경우 에러 처리 테스트"""
         with patch.object(Path, 'exists', return_value=False):
-            dependencies = analyzer._find_dependency_files("/nonexistent/path")
+            dependencies = await analyzer._find_dependency_files("/nonexistent/path")
             assert dependencies == {}
     
+    @pytest.mark.asyncio
+    async def test_manifest_parse_cache(self, analyzer, tmp_path, sample_package_json, monkeypatch):
+        """변경되지 않은 매니페스트는 재파싱하지 않는지 테스트"""
+        package_json = tmp_path / "package.json"
+        package_json.write_text(json.dumps(sample_package_json))
+        parser = Mock(wraps=analyzer._parse_package_json)
+        monkeypatch.setattr(analyzer, "supported_files", {"package.json": parser})
+
+        first = await analyzer._find_dependency_files(str(tmp_path))
+        second = await analyzer._find_dependency_files(str(tmp_path))
+
+        assert first == second
+        assert parser.call_count == 1
+
+        # 내용이 바뀌면 다시 파싱
+        sample_package_json["dependencies"]["vue"] = "^3.3.0"
+        package_json.write_text(json.dumps(sample_package_json))
+        third = await analyzer._find_dependency_files(str(tmp_path))
+
+        assert "vue" in third
+        assert parser.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_find_dependency_files_scans_repo_root(self, analyzer, tmp_path, sample_requirements_txt):
+        """저장소 루트의 매니페스트 파일만 파싱하는지 테스트"""
+        (tmp_path / "requirements.txt").write_text(sample_requirements_txt)
+        (tmp_path / "go.mod").mkdir()  # 매니페스트 이름의 디렉토리는 무시
+        (tmp_path / "README.md").write_text("# readme")
+
+        dependencies = await analyzer._find_dependency_files(str(tmp_path))
+
+        assert len(dependencies) == 6
+        assert all(dep["source"] == "requirements.txt" for dep in dependencies.values())
+
     def test_error_handling_malformed_json(self, analyzer):
         """잘못된 JSON 파일 처리 테스트"""
         malformed_json = '{"dependencies": {"react": }'  # 잘못된 JSON
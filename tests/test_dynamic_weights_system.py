@@ -9,6 +9,7 @@
 
 import pytest
 import asyncio
+import math
 from unittest.mock import Mock, patch
 from app.services.file_importance_analyzer import SmartFileImportanceAnalyzer
 from app.agents.enhanced_question_generator import EnhancedQuestionGenerator
@@ -17,11 +18,25 @@ from app.agents.enhanced_question_generator import EnhancedQuestionGenerator
 class TestDynamicWeightsSystem:
     """동적 가중치 시스템 테스트"""
     
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def shared_components(cls):
+        """클래스 단위로 분석기/질문 생성기를 한 번만 생성"""
+        cls.analyzer = SmartFileImportanceAnalyzer()
+        cls.question_generator = EnhancedQuestionGenerator()
+    
+    @pytest.fixture(autouse=True)
+    def isolate_weights(self, monkeypatch):
+        """세션별로 갱신되는 가중치가 다른 테스트로 새지 않도록 격리"""
+        monkeypatch.setattr(
+            self.analyzer, "base_importance_weights", dict(self.analyzer.base_importance_weights)
+        )
+        monkeypatch.setattr(
+            self.analyzer, "importance_weights", dict(self.analyzer.base_importance_weights)
+        )
+    
     def setup_method(self):
         """테스트 셋업"""
-        self.analyzer = SmartFileImportanceAnalyzer()
-        self.question_generator = EnhancedQuestionGenerator()
-        
         # 테스트용 샘플 데이터
         self.sample_files = [
             "src/main.py",
@@ -73,6 +88,17 @@ class TestDynamicWeightsSystem:
         # 모두 동일해야 함
         assert weights1 == weights2 == weights3, "같은 시드로 생성한 가중치가 다름"
     
+    def test_dynamic_weights_bounded_for_many_seeds(self):
+        """여러 시드에서 가중치 변동이 ±5% 이내이고 총합이 1.0인지 테스트"""
+
+        for i in range(200):
+            weights = self.analyzer.generate_dynamic_weights(f"bounded_{i}")
+
+            assert sum(weights.values()) == pytest.approx(1.0)
+            for key, weight in weights.items():
+                base_weight = self.analyzer.base_importance_weights[key]
+                assert abs(weight - base_weight) / base_weight <= 0.05 + 1e-9
+
     def test_is_excluded_file_dummy_samples(self):
         """더미/샘플 데이터 제외 테스트"""
         
@@ -154,6 +180,27 @@ class TestDynamicWeightsSystem:
             assert included_file in importance_scores, f"포함되어야 할 파일 {included_file}이 결과에 없음"
             assert 0.0 <= importance_scores[included_file] <= 1.0, f"점수 범위 오류: {importance_scores[included_file]}"
     
+    def test_enhanced_importance_scores_size_penalty(self):
+        """50KB 초과 파일에 크기 페널티가 적용되는지 테스트"""
+
+        scores = {"src/small.py": 0.5, "src/large.py": 0.5}
+        file_sizes = {
+            "src/small.py": 10 * 1024,
+            "src/large.py": self.analyzer.size_threshold * 3
+        }
+
+        importance_scores = self.analyzer.calculate_enhanced_importance_scores(
+            metadata_scores=scores,
+            dependency_centrality=scores,
+            churn_scores=scores,
+            complexity_scores=scores,
+            file_sizes=file_sizes
+        )
+
+        # 가중치 합 1.0 * 0.5 * src/ 보너스 1.2
+        assert importance_scores["src/small.py"] == pytest.approx(0.6)
+        assert importance_scores["src/large.py"] == pytest.approx(0.6 * math.exp(-0.2))
+
     def test_weight_updates_affect_scores(self):
         """가중치 변경이 점수에 영향을 주는지 테스트"""
         
@@ -7,6 +7,7 @@ main_rules.md에 따라 테스트를 먼저 작성하고, 이후 실제 구현
 
 import pytest
 import asyncio
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
 from unittest.mock import Mock, AsyncMock, patch
 
@@ -14,6 +15,51 @@ from unittest.mock import Mock, AsyncMock, patch
 # from app.agents.enhanced_question_generator import EnhancedQuestionGenerator
 
 
+@pytest.fixture
+def mock_ai_question(monkeypatch):
+    """AI 질문 생성 호출을 미리 만든 AsyncMock으로 대체"""
+    from app.agents.enhanced_question_generator import EnhancedQuestionGenerator
+
+    mock = AsyncMock(return_value={
+        "question": "이 main.py 파일에서 Application 클래스의 connect_database() 메서드가 async로 정의된 이유와 실제 데이터베이스 연결 로직을 구현할 때 고려해야 할 사항들을 설명해주세요.",
+        "type": "code_analysis",
+        "complexity": "medium"
+    })
+    monkeypatch.setattr(EnhancedQuestionGenerator, "_generate_ai_question", mock)
+    return mock
+
+
+# 파일 유형 -> (샘플 경로, 프롬프트에 포함되어야 할 키워드 중 하나)
+_PROMPT_KEYWORDS = {
+    "controller": ("src/controllers/user_controller.py", ["http", "요청", "routing", "endpoint", "handler"]),
+    "model": ("src/models/user.py", ["모델", "데이터", "스키마", "관계", "validation"]),
+    "service": ("src/services/auth_service.py", ["비즈니스", "로직", "service", "처리", "트랜잭션"]),
+    "configuration": ("config/database.py", []),
+    "utility": ("src/utils/helpers.py", []),
+}
+
+
+@pytest.fixture
+def fake_encoder(monkeypatch):
+    """네트워크/BPE 로딩 없이 결정적인 토큰 수를 돌려주는 tiktoken 인코더"""
+    from app.agents import enhanced_question_generator
+
+    class FakeEncoding:
+        # 1 token ≈ 4 characters (GPT 계열 근사치)
+        def encode(self, text):
+            return [0] * (len(text) // 4 + 1)
+
+        def decode(self, tokens):
+            return "a" * (len(tokens) * 4)
+
+    encoding = FakeEncoding()
+    monkeypatch.setattr('tiktoken.encoding_for_model', lambda model_name: encoding)
+    monkeypatch.setattr(enhanced_question_generator, 'TIKTOKEN_AVAILABLE', True)
+    enhanced_question_generator._get_encoding.cache_clear()
+    yield encoding
+    enhanced_question_generator._get_encoding.cache_clear()
+
+
 class TestEnhancedQuestionGenerator:
     """향상된 질문 생성기 테스트"""
     
@@ -23,99 +69,6 @@ class TestEnhancedQuestionGenerator:
         from app.agents.enhanced_question_generator import EnhancedQuestionGenerator
         return EnhancedQuestionGenerator()
     
-    @pytest.fixture
-    def sample_analysis_data(self):
-        """4차원 분석 결과 샘플 데이터"""
-        return {
-            "repo_url": "https://github.com/owner/repo",
-            "tech_stack": {"Python": 0.7, "JavaScript": 0.2, "HTML": 0.1},
-            "smart_file_analysis": {
-                "critical_files": [
-                    {
-                        "file_path": "src/main.py",
-                        "importance_score": 0.95,
-                        "reasons": ["애플리케이션 진입점 파일", "다른 파일들이 많이 참조하는 핵심 의존성"],
-                        "metrics": {
-                            "structural_importance": 0.9,
-                            "dependency_centrality": 0.8,
-                            "churn_risk": 0.6,
-                            "complexity_score": 0.7
-                        }
-                    },
-                    {
-                        "file_path": "src/config.py",
-                        "importance_score": 0.87,
-                        "reasons": ["프로젝트 핵심 설정 파일", "핵심 모듈 또는 기반 라이브러리"],
-                        "metrics": {
-                            "structural_importance": 0.95,
-                            "dependency_centrality": 0.6,
-                            "churn_risk": 0.2,
-                            "complexity_score": 0.3
-                        }
-                    }
-                ]
-            },
-            "file_contents": {
-                "src/main.py": {
-                    "success": True,
-                    "content": """#!/usr/bin/env python3
-import os
-import sys
-from config import DATABASE_URL, API_KEY
-
-class Application:
-    def __init__(self):
-        self.db_url = DATABASE_URL
-        self.api_key = API_KEY
-    
-    async def start(self):
-        print("Starting application...")
-        await self.connect_database()
-    
-    async def connect_database(self):
-        # Database connection logic
-        pass
-
-if __name__ == "__main__":
-    app = Application()
-    asyncio.run(app.start())
-""",
-                    "size": 512,
-                    "encoding": "utf-8"
-                },
-                "src/config.py": {
-                    "success": True,
-                    "content": """import os
-from typing import Optional
-
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///app.db")
-API_KEY = os.getenv("API_KEY")
-DEBUG = os.getenv("DEBUG", "False").lower() == "true"
-
-ALLOWED_HOSTS = ["localhost", "127.0.0.1"]
-
-class Config:
-    def __init__(self):
-        self.database_url = DATABASE_URL
-        self.api_key = API_KEY
-        self.debug = DEBUG
-""",
-                    "size": 384,
-                    "encoding": "utf-8"
-                }
-            }
-        }
-    
-    @pytest.fixture
-    def sample_tiktoken_result(self):
-        """tiktoken 토큰 계산 결과 Mock"""
-        return {
-            "total_tokens": 1500,
-            "prompt_tokens": 1200,
-            "max_tokens": 4000,
-            "remaining_tokens": 2500
-        }
-
     def test_enhanced_question_generator_initialization(self, question_generator):
         """향상된 질문 생성기 초기화 테스트"""
         # Then: 필요한 속성들이 올바르게 초기화되어야 함
@@ -154,6 +107,23 @@ class Config:
             assert "selection_reasons" in file_info
             assert "metrics_breakdown" in file_info
 
+    def test_integrate_smart_file_analysis_top_k(self, question_generator):
+        """limit 지정 시 상위 K개만 전체 정렬 결과와 같은 순서로 반환하는지 테스트"""
+        import random
+        rng = random.Random(0)
+        critical_files = [
+            {"file_path": f"src/pkg_{i % 50}/module_{i}.py", "importance_score": round(rng.random(), 3)}
+            for i in range(10_000)
+        ]
+        analysis_data = {"smart_file_analysis": {"critical_files": critical_files}}
+
+        full = question_generator.integrate_smart_file_analysis(analysis_data)
+        top_k = question_generator.integrate_smart_file_analysis(analysis_data, limit=5)
+
+        assert len(top_k["prioritized_files"]) == 5
+        assert top_k["prioritized_files"] == full["prioritized_files"][:5]
+        assert top_k["analysis_summary"] == full["analysis_summary"]
+
     def test_calculate_token_budget(self, question_generator, sample_tiktoken_result):
         """토큰 예산 계산 테스트"""
         # Given: 파일 내용들과 토큰 제한
@@ -182,27 +152,55 @@ class Config:
         assert budget["available_tokens"] <= max_tokens
         assert len(budget["recommended_files"]) > 0
 
-    def test_generate_enhanced_questions_with_file_content(self, question_generator, sample_analysis_data):
+    def test_token_budget_estimates_without_per_file_encoding(self, question_generator):
+        """예산 여유가 있으면 보정 샘플만 인코딩하고, 경계 부근 파일만 정확히 인코딩하는지 테스트"""
+        encoded_texts = []
+
+        class CharEncoding:
+            def encode(self, text):
+                encoded_texts.append(text)
+                return [0] * len(text)
+
+        files_content = {
+            "src/a.py": "a = 1\n" * 100,    # 600자
+            "src/b.py": "b = 2\n" * 200,    # 1200자
+            "src/c.py": "c = 3\n" * 400,    # 2400자
+        }
+        question_generator.encoding = CharEncoding()
+        question_generator.token_safety_margin = 0
+
+        with patch('app.agents.enhanced_question_generator.TIKTOKEN_AVAILABLE', True):
+            # 충분한 예산: 파일별 인코딩 없음
+            budget = question_generator.calculate_token_budget(files_content, max_tokens=100_000)
+            assert set(budget["recommended_files"]) == set(files_content)
+            assert not any(text in files_content.values() for text in encoded_texts)
+            assert budget["token_per_file"]["src/c.py"] >= 2400  # 보수적 추정
+
+            # 빠듯한 예산: 경계 파일만 정확히 인코딩
+            encoded_texts.clear()
+            budget = question_generator.calculate_token_budget(files_content, max_tokens=4000)
+
+        assert budget["recommended_files"] == ["src/a.py", "src/b.py"]
+        assert files_content["src/a.py"] not in encoded_texts
+        assert files_content["src/c.py"] in encoded_texts
+        assert budget["token_per_file"]["src/c.py"] == 2400
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_enhanced_questions_with_file_content(self, question_generator, sample_analysis_data, mock_ai_question):
         """실제 파일 내용 기반 향상된 질문 생성 테스트"""
-        # Given: 분석 데이터와 파일 내용
+        # Given: 분석 데이터와 파일 내용 (AI 호출은 mock_ai_question)
         
         # When: 향상된 질문 생성
-        with patch.object(question_generator, '_generate_ai_question') as mock_ai:
-            mock_ai.return_value = {
-                "question": "이 main.py 파일에서 Application 클래스의 connect_database() 메서드가 async로 정의된 이유와 실제 데이터베이스 연결 로직을 구현할 때 고려해야 할 사항들을 설명해주세요.",
-                "type": "code_analysis",
-                "complexity": "medium"
-            }
-            
-            result = asyncio.run(question_generator.generate_enhanced_questions(
-                analysis_data=sample_analysis_data,
-                question_count=3,
-                difficulty_level="medium"
-            ))
+        result = await question_generator.generate_enhanced_questions(
+            analysis_data=sample_analysis_data,
+            question_count=3,
+            difficulty_level="medium"
+        )
         
         # Then: 실제 파일 내용을 참조한 질문들이 생성되어야 함
         assert result["success"] is True
         assert len(result["questions"]) > 0
+        assert mock_ai_question.await_count == len(result["questions"])
         
         for question in result["questions"]:
             assert "id" in question
@@ -213,39 +211,99 @@ class Config:
             assert "actual_content_included" in question
             assert question["actual_content_included"] is True
 
-    def test_file_type_specialized_prompts(self, question_generator):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_enhanced_questions_reports_usage(self, question_generator, sample_analysis_data):
+        """AI 응답의 토큰 사용량(cached_tokens 포함)이 result["usage"]에 누적되는지 테스트"""
+        fake_response = {
+            "content": "이 파일에서 connect_database()를 async로 정의한 이유와 연결 실패 시 재시도 전략을 설명해주세요.",
+            "usage": {"prompt_tokens": 1500, "completion_tokens": 80, "cached_tokens": 1024}
+        }
+
+        with patch('app.agents.enhanced_question_generator.ai_service.generate_analysis',
+                   new=AsyncMock(return_value=fake_response)) as mock_generate:
+            result = await question_generator.generate_enhanced_questions(
+                analysis_data=sample_analysis_data,
+                question_count=3,
+                difficulty_level="medium"
+            )
+
+        calls = mock_generate.await_count
+        assert calls > 0
+        assert "usage" in result and "cached_tokens" in result["usage"]
+        assert result["usage"] == {
+            "prompt_tokens": 1500 * calls,
+            "completion_tokens": 80 * calls,
+            "cached_tokens": 1024 * calls
+        }
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_ai_question_calls_run_concurrently_with_limit(self, question_generator, sample_analysis_data):
+        """AI 질문 생성 호출이 동시에 실행되며 동시 호출 수 제한을 지키는지 테스트"""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_ai_question(prompt):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"question": f"{prompt[:20]} 구현 방식과 설계 이유를 구체적으로 설명해주세요.", "type": "code_analysis"}
+
+        for limit, expected in ((5, 2), (1, 1)):
+            question_generator.max_concurrent_llm_calls = limit
+            max_in_flight = 0
+            with patch.object(question_generator, '_generate_ai_question', side_effect=fake_ai_question):
+                result = await question_generator.generate_enhanced_questions(
+                    analysis_data=sample_analysis_data,
+                    question_count=3
+                )
+
+            assert result["success"] is True
+            assert max_in_flight == expected
+
+        # 결과는 우선순위 파일 순서를 유지
+        paths = [q["file_context"]["file_path"] for q in result["questions"]]
+        assert paths == sorted(paths, key=["src/main.py", "src/config.py"].index)
+
+    @pytest.mark.parametrize("file_type,file_path,keywords", [
+        (file_type, file_path, keywords)
+        for file_type, (file_path, keywords) in _PROMPT_KEYWORDS.items()
+    ])
+    def test_file_type_specialized_prompts(self, question_generator, file_type, file_path, keywords):
         """파일 유형별 특화 프롬프트 생성 테스트"""
-        # Given: 다양한 파일 유형들
-        test_files = [
-            {"path": "src/controllers/user_controller.py", "type": "controller"},
-            {"path": "src/models/user.py", "type": "model"},
-            {"path": "src/services/auth_service.py", "type": "service"},
-            {"path": "config/database.py", "type": "configuration"},
-            {"path": "src/utils/helpers.py", "type": "utility"}
-        ]
+        # When: 파일 유형별 특화 프롬프트 생성
+        prompt_template = question_generator.get_specialized_prompt_template(
+            file_type=file_type,
+            file_path=file_path,
+            difficulty="medium"
+        )
         
-        # When: 각 파일 유형별 특화 프롬프트 생성
-        for file_info in test_files:
-            prompt_template = question_generator.get_specialized_prompt_template(
-                file_type=file_info["type"],
-                file_path=file_info["path"],
-                difficulty="medium"
-            )
-            
-            # Then: 파일 유형에 맞는 특화된 프롬프트가 반환되어야 함
-            assert prompt_template is not None
-            assert len(prompt_template) > 100  # 충분한 길이의 프롬프트
-            
-            # 파일 유형별 키워드가 포함되어야 함
-            if file_info["type"] == "controller":
-                assert any(keyword in prompt_template.lower() for keyword in 
-                          ["http", "요청", "routing", "endpoint", "handler"])
-            elif file_info["type"] == "model":
-                assert any(keyword in prompt_template.lower() for keyword in 
-                          ["모델", "데이터", "스키마", "관계", "validation"])
-            elif file_info["type"] == "service":
-                assert any(keyword in prompt_template.lower() for keyword in 
-                          ["비즈니스", "로직", "service", "처리", "트랜잭션"])
+        # Then: 파일 유형에 맞는 특화된 프롬프트가 반환되어야 함
+        assert prompt_template is not None
+        assert len(prompt_template) > 100  # 충분한 길이의 프롬프트
+        
+        # 파일 유형별 키워드가 포함되어야 함
+        if keywords:
+            assert any(keyword in prompt_template.lower() for keyword in keywords)
+
+    def test_specialized_prompts_shared_and_prerendered(self, question_generator):
+        """특화 프롬프트가 인스턴스 간 공유되고 난이도 지시사항이 미리 채워지는지 테스트"""
+        from app.agents.enhanced_question_generator import EnhancedQuestionGenerator
+        other = EnhancedQuestionGenerator()
+
+        assert other.specialized_prompts is question_generator.specialized_prompts
+        with pytest.raises(TypeError):
+            question_generator.specialized_prompts["controller"] = ""
+
+        prompt = question_generator.get_specialized_prompt_template("model", "src/models/user.py", "hard")
+        assert question_generator.difficulty_instructions["hard"] in prompt
+        assert "{difficulty_instruction}" not in prompt
+        assert "{file_path}" in prompt  # 나머지 플레이스홀더는 generate_enhanced_prompt에서 채움
+
+        # 알 수 없는 유형/난이도는 general 템플릿으로 대체
+        fallback = question_generator.get_specialized_prompt_template("unknown", "a.py", "expert")
+        assert fallback == question_generator.specialized_prompts["general"].replace("{difficulty_instruction}", "")
 
     def test_token_aware_content_truncation(self, question_generator):
         """토큰 제한 고려 내용 트렁케이션 테스트"""
@@ -278,6 +336,112 @@ class Config:
         # 트렁케이션 표시가 있어야 함
         assert "..." in truncated or "truncated" in truncated.lower()
 
+    def test_long_text_uses_batch_encoding(self, question_generator):
+        """긴 텍스트는 줄 경계 청크로 나눠 배치 인코딩하는지 테스트"""
+        from app.agents.enhanced_question_generator import _split_into_line_chunks
+        long_content = "\n".join([f"def function_{i}(): pass" for i in range(3000)])
+
+        chunks = _split_into_line_chunks(long_content, 8_192)
+        assert "".join(chunks) == long_content
+        assert all(chunk.endswith("\n") for chunk in chunks[:-1])
+
+        mock_encoding = Mock()
+        mock_encoding.encode_ordinary_batch.side_effect = lambda texts: [[0] * len(text) for text in texts]
+        question_generator.encoding = mock_encoding
+
+        with patch('app.agents.enhanced_question_generator.TIKTOKEN_AVAILABLE', True):
+            long_info = question_generator.calculate_tokens(long_content)
+            question_generator.calculate_tokens("short text")
+
+        assert long_info["token_count"] == len(long_content)
+        mock_encoding.encode_ordinary_batch.assert_called_once_with(chunks)
+        mock_encoding.encode.assert_called_once_with("short text")
+
+    def test_token_truncation_encodes_once(self, question_generator):
+        """tiktoken 경로에서 전체 내용을 한 번만 인코딩하고 앞/뒤 부분을 보존하는지 테스트"""
+        long_content = "\n".join([f"def function_{i}(): pass" for i in range(1000)])
+        encoded_texts = []
+
+        class CharEncoding:
+            # 문자 하나를 토큰 하나로 취급하는 가역 인코더
+            def encode(self, text):
+                encoded_texts.append(text)
+                return [ord(ch) for ch in text]
+
+            def decode(self, tokens):
+                return "".join(map(chr, tokens))
+
+        question_generator.encoding = CharEncoding()
+        with patch('app.agents.enhanced_question_generator.TIKTOKEN_AVAILABLE', True):
+            truncated = question_generator.truncate_content_by_tokens(
+                content=long_content,
+                max_tokens=1000,
+                preserve_important_sections=True
+            )
+
+        assert encoded_texts.count(long_content) == 1
+        assert len(truncated) <= 1000
+        assert truncated.startswith("def function_0(): pass")
+        assert truncated.endswith("def function_999(): pass")
+        assert "content truncated" in truncated
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_file_contents_tokenized_once_per_generation(self, question_generator, sample_analysis_data, mock_ai_question):
+        """질문 생성 과정에서 각 파일 내용을 한 번만 인코딩하는지 테스트"""
+        encoded_texts = []
+
+        class CountingEncoding:
+            def encode(self, text):
+                encoded_texts.append(text)
+                return list(range(len(text) // 4 + 1))
+
+            def decode(self, tokens):
+                return "x" * len(tokens)
+
+        question_generator.encoding = CountingEncoding()
+        with patch('app.agents.enhanced_question_generator.TIKTOKEN_AVAILABLE', True):
+            result = await question_generator.generate_enhanced_questions(
+                analysis_data=sample_analysis_data,
+                question_count=2
+            )
+
+        assert result["success"] is True
+        for file_info in sample_analysis_data["file_contents"].values():
+            assert encoded_texts.count(file_info["content"]) == 1
+
+    def test_token_truncation_slices_original_utf8_bytes(self, question_generator):
+        """바이트 오프셋 기반 트렁케이션이 원문의 앞/뒤 부분을 그대로 보존하는지 테스트"""
+        long_content = "\n".join([f"def 함수_{i}(): return '값'" for i in range(500)])
+
+        class ByteEncoding:
+            # UTF-8 바이트 하나를 토큰 하나로 취급 (멀티바이트 문자가 토큰 경계에서 잘릴 수 있음)
+            def encode(self, text):
+                return list(text.encode("utf-8"))
+
+            def decode(self, tokens):
+                return bytes(tokens).decode("utf-8", errors="replace")
+
+            def decode_bytes(self, tokens):
+                return bytes(tokens)
+
+        question_generator.encoding = ByteEncoding()
+        with patch('app.agents.enhanced_question_generator.TIKTOKEN_AVAILABLE', True):
+            tokenized_file = question_generator.tokenize_files({"big.py": long_content})["big.py"]
+            with patch.object(ByteEncoding, "encode", side_effect=AssertionError("재인코딩 금지")):
+                truncated = question_generator.truncate_content_by_tokens(
+                    content=long_content,
+                    max_tokens=1001,
+                    preserve_important_sections=True,
+                    tokenized_file=tokenized_file
+                )
+
+        head, _, tail = truncated.partition("\n... (content truncated for token limit) ...\n")
+        assert "\ufffd" not in truncated
+        assert long_content.startswith(head + "\n")
+        assert long_content.endswith("\n" + tail)
+        assert len(truncated.encode("utf-8")) <= 1001
+        assert tokenized_file.content_mv.obj == long_content.encode("utf-8")
+
     def test_importance_score_integration(self, question_generator, sample_analysis_data):
         """중요도 점수 통합 테스트"""
         # Given: 스마트 파일 분석 결과
@@ -348,6 +512,49 @@ class Config:
         assert "tokens_per_char_ratio" in token_info
         assert token_info["token_count"] > 0
 
+    def test_tiktoken_encoding_loaded_once_per_model(self):
+        """tiktoken 인코딩이 모델당 한 번만 로드되는지 테스트"""
+        from app.agents.enhanced_question_generator import _get_encoding
+
+        _get_encoding.cache_clear()
+        try:
+            with patch('tiktoken.encoding_for_model') as mock_tiktoken:
+                mock_tiktoken.return_value = Mock()
+
+                first = _get_encoding("gpt-3.5-turbo")
+                second = _get_encoding("gpt-3.5-turbo")
+
+            assert first is second
+            mock_tiktoken.assert_called_once_with("gpt-3.5-turbo")
+        finally:
+            # Mock 인코딩이 다른 테스트로 새지 않도록 캐시 초기화
+            _get_encoding.cache_clear()
+
+    def test_calculate_tokens_cached_by_content(self, question_generator):
+        """같은 내용은 한 번만 인코딩하고 캐시 크기가 제한되는지 테스트"""
+        mock_encoding = Mock()
+        mock_encoding.encode.side_effect = lambda text: list(range(len(text) // 4 + 1))
+        question_generator.encoding = mock_encoding
+        question_generator.token_cache_size = 2
+
+        with patch('app.agents.enhanced_question_generator.TIKTOKEN_AVAILABLE', True):
+            first = question_generator.calculate_tokens("def main(): pass")
+            second = question_generator.calculate_tokens("def main(): pass")
+            assert first == second
+            assert mock_encoding.encode.call_count == 1
+
+            # 반환값을 수정해도 캐시에는 영향이 없어야 함
+            first["token_count"] = -1
+            assert question_generator.calculate_tokens("def main(): pass")["token_count"] > 0
+
+            question_generator.calculate_tokens("class A: pass")
+            question_generator.calculate_tokens("class B: pass")
+            assert len(question_generator._token_cache) == 2
+
+            # 가장 오래된 항목이 밀려나 다시 인코딩됨
+            question_generator.calculate_tokens("def main(): pass")
+            assert mock_encoding.encode.call_count == 4
+
     def test_enhanced_prompt_templates(self, question_generator):
         """향상된 프롬프트 템플릿 테스트"""
         # Given: 파일 내용과 분석 결과
@@ -408,7 +615,8 @@ class Config:
             else:
                 assert quality_score < 0.5
 
-    def test_error_handling_for_content_extraction_failure(self, question_generator):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_error_handling_for_content_extraction_failure(self, question_generator):
         """파일 내용 추출 실패 시 오류 처리 테스트"""
         # Given: 파일 내용 추출 실패 시나리오
         analysis_data = {
@@ -426,10 +634,10 @@ class Config:
         }
         
         # When: 질문 생성 시도
-        result = asyncio.run(question_generator.generate_enhanced_questions(
+        result = await question_generator.generate_enhanced_questions(
             analysis_data=analysis_data,
             question_count=1
-        ))
+        )
         
         # Then: 적절한 오류 처리가 되어야 함
         assert result["success"] is True  # 전체 프로세스는 성공
@@ -437,7 +645,8 @@ class Config:
         assert "warnings" in result
         assert len(result["warnings"]) > 0
 
-    def test_performance_with_large_files(self, question_generator):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_performance_with_large_files(self, question_generator, perf_timer, mock_ai_question):
         """대용량 파일 처리 성능 테스트"""
         # Given: 대용량 파일 내용 시뮬레이션
         large_content = "\n".join([f"def function_{i}(): pass" for i in range(1000)])
@@ -456,34 +665,25 @@ class Config:
             }
         }
         
-        # When: 질문 생성 (성능 측정)
-        import time
-        start_time = time.time()
-        
-        with patch.object(question_generator, '_generate_ai_question') as mock_ai:
-            mock_ai.return_value = {"question": "Test question", "type": "code_analysis"}
-            
-            result = asyncio.run(question_generator.generate_enhanced_questions(
+        # When: 질문 생성 (성능 측정, AI 호출은 mock_ai_question)
+        with perf_timer() as timer:
+            result = await question_generator.generate_enhanced_questions(
                 analysis_data=analysis_data,
                 question_count=1
-            ))
-        
-        end_time = time.time()
-        processing_time = end_time - start_time
+            )
         
-        # Then: 합리적인 시간 내에 처리되어야 함 (5초 이내)
-        assert processing_time < 5.0
+        # Then: 토큰 계산/프롬프트 구성만 남으므로 500ms 이내에 처리되어야 함
+        assert timer.elapsed_ms < 500
         assert result["success"] is True
 
 
 class TestPromptEngineering:
     """프롬프트 엔지니어링 전용 테스트"""
     
-    def test_file_type_specific_prompt_generation(self):
+    def test_file_type_specific_prompt_generation(self, question_generator_cls):
         """파일 유형별 특화 프롬프트 생성 테스트"""
         # Given: 파일 유형별 샘플
-        from app.agents.enhanced_question_generator import EnhancedQuestionGenerator
-        generator = EnhancedQuestionGenerator()
+        generator = question_generator_cls
         
         file_types = ["controller", "model", "service", "configuration", "utility"]
         
@@ -505,11 +705,13 @@ class TestPromptEngineering:
         unique_prompts = set(prompts.values())
         assert len(unique_prompts) == len(file_types)
 
-    def test_token_calculation_accuracy(self):
+    def test_token_calculation_accuracy(self, fake_encoder, question_generator_cls, monkeypatch):
         """토큰 계산 정확도 테스트"""
         # Given: 다양한 길이의 텍스트 샘플
-        from app.agents.enhanced_question_generator import EnhancedQuestionGenerator
-        generator = EnhancedQuestionGenerator()
+        generator = question_generator_cls
+        # 공유 인스턴스는 fixture 적용 전에 생성되었으므로 가짜 인코더와 빈 캐시를 테스트 범위로 주입
+        monkeypatch.setattr(generator, 'encoding', fake_encoder)
+        monkeypatch.setattr(generator, '_token_cache', OrderedDict())
         
         test_texts = [
             "Hello world",
@@ -525,29 +727,20 @@ class TestPromptEngineering:
         
         # When & Then: 각 텍스트의 토큰 수가 합리적으로 계산되어야 함
         for text in test_texts:
-            with patch('tiktoken.encoding_for_model') as mock_tiktoken:
-                # Mock tiktoken to return predictable results
-                mock_encoding = Mock()
-                # Approximate 1 token per 4 characters (typical for GPT models)
-                token_count = len(text) // 4 + 1
-                mock_encoding.encode.return_value = list(range(token_count))
-                mock_tiktoken.return_value = mock_encoding
-                
-                result = generator.calculate_tokens(text)
-                
-                assert result["token_count"] > 0
-                assert result["text_length"] == len(text)
-                assert result["tokens_per_char_ratio"] > 0
+            result = generator.calculate_tokens(text)
+            
+            assert result["token_count"] == len(text) // 4 + 1
+            assert result["text_length"] == len(text)
+            assert result["tokens_per_char_ratio"] > 0
 
 
 class TestIntegrationWithExistingSystems:
     """기존 시스템과의 통합 테스트"""
     
-    def test_integration_with_file_importance_analyzer(self):
+    def test_integration_with_file_importance_analyzer(self, question_generator_cls):
         """SmartFileImportanceAnalyzer와의 통합 테스트"""
         # Given: Mock 분석 결과
-        from app.agents.enhanced_question_generator import EnhancedQuestionGenerator
-        generator = EnhancedQuestionGenerator()
+        generator = question_generator_cls
         
         # Mock SmartFileImportanceAnalyzer
         with patch('app.services.file_importance_analyzer.SmartFileImportanceAnalyzer') as mock_analyzer:
@@ -566,31 +759,78 @@ class TestIntegrationWithExistingSystems:
             assert "prioritized_files" in result
             assert len(result["prioritized_files"]) > 0
 
-    def test_integration_with_file_content_extractor(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_integration_with_file_content_extractor(self, question_generator_cls):
         """FileContentExtractor와의 통합 테스트"""
         # Given: Mock 파일 내용 추출 결과
-        from app.agents.enhanced_question_generator import EnhancedQuestionGenerator
-        generator = EnhancedQuestionGenerator()
-        
-        # Mock FileContentExtractor
-        with patch('app.services.file_content_extractor.FileContentExtractor') as mock_extractor:
-            mock_extractor.return_value.extract_files_content.return_value = [
-                {
-                    "success": True,
-                    "file_path": "src/main.py",
-                    "content": "def main(): pass",
-                    "size": 16
-                }
-            ]
+        generator = question_generator_cls
+        
+        # 생성기가 보유한 추출기 인스턴스의 일괄 조회를 Mock
+        with patch.object(
+            generator.file_content_extractor, 'extract_files_content', new_callable=AsyncMock
+        ) as mock_extract:
+            mock_extract.return_value = [{
+                "success": True,
+                "file_path": "src/main.py",
+                "content": "def main(): pass",
+                "size": 16
+            }]
             
             # When: 파일 내용 추출 통합
-            result = asyncio.run(generator.extract_file_contents_for_questions(
+            result = await generator.extract_file_contents_for_questions(
                 file_paths=["src/main.py"],
                 owner="owner",
                 repo="repo"
-            ))
+            )
             
-            # Then: 파일 내용이 올바르게 추출되어야 함
-            assert len(result) > 0
+            # Then: 파일 내용이 올바르게 추출되어야 함 (네트워크 호출 없음)
+            mock_extract.assert_awaited_once_with(
+                owner="owner", repo="repo", important_files=[{"path": "src/main.py"}]
+            )
+            assert len(result) == 1
             assert result[0]["success"] is True
-            assert "content" in result[0]
\ No newline at end of file
+            assert result[0]["content"] == "def main(): pass"
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_async_context_closes_extractor_session(self):
+        """컨텍스트 종료 시 파일 내용 추출기의 공유 HTTP 세션이 닫히는지 테스트"""
+        from app.agents.enhanced_question_generator import EnhancedQuestionGenerator
+
+        async with EnhancedQuestionGenerator() as generator:
+            session = generator.file_content_extractor._get_session()
+            assert not session.closed
+
+        assert session.closed
+        assert generator.file_content_extractor._session is None
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_extract_file_contents_fans_out_concurrently(self, question_generator_cls):
+        """여러 파일 내용 추출이 동시에 실행되고 입력 순서를 유지하는지 테스트"""
+        generator = question_generator_cls
+        file_paths = [f"src/module_{i}.py" for i in range(10)]
+
+        async def fake_extract(owner, repo, file_path, **kwargs):
+            # 일괄 경로를 거쳐 동시 요청 수 제한 세마포어가 전달되어야 함
+            assert kwargs["fetch_semaphore"] is not None
+            await asyncio.sleep(0.05)
+            if file_path.endswith("_3.py"):
+                raise RuntimeError("boom")
+            return {"success": True, "file_path": file_path, "content": "pass", "size": 4}
+
+        with patch.object(generator.file_content_extractor, 'extract_file_content', side_effect=fake_extract), \
+             patch.object(generator.file_content_extractor, 'graphql_batch_size', 0):
+            import time
+            start_time = time.perf_counter()
+            result = await generator.extract_file_contents_for_questions(
+                file_paths=file_paths,
+                owner="owner",
+                repo="repo"
+            )
+            elapsed = time.perf_counter() - start_time
+
+        # 직렬이면 0.5초 이상 걸림
+        assert elapsed < 0.3
+        assert [item["file_path"] for item in result] == file_paths
+        assert result[3]["success"] is False
+        assert "boom" in result[3]["error"]
+        assert all(item["success"] for i, item in enumerate(result) if i != 3)
@@ -9,8 +9,11 @@ import pytest
 import asyncio
 import base64
 import hashlib
+import json
+import threading
+import time
 from typing import Dict, List, Any, Optional
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
 
 # 구현 예정 모듈들
 # from app.services.file_content_extractor import FileContentExtractor
@@ -21,9 +24,11 @@ class TestFileContentExtractor:
     
     @pytest.fixture
     def extractor(self):
-        """테스트용 파일 내용 추출기 인스턴스"""
+        """테스트용 파일 내용 추출기 인스턴스 (GraphQL 일괄 조회는 네트워크가 필요하므로 기본 비활성화)"""
         from app.services.file_content_extractor import FileContentExtractor
-        return FileContentExtractor(github_token="test_token")
+        extractor = FileContentExtractor(github_token="test_token")
+        extractor.graphql_batch_size = 0
+        return extractor
     
     @pytest.fixture
     def sample_file_list(self):
@@ -63,7 +68,8 @@ if __name__ == "__main__":
             "encoding": "base64"
         }
 
-    def test_extract_single_file_content(self, extractor, github_content_response):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_extract_single_file_content(self, extractor, github_content_response):
         """단일 파일 내용 추출 테스트"""
         # Given: GitHub API 응답 Mock
         
@@ -71,11 +77,11 @@ if __name__ == "__main__":
         with patch.object(extractor, '_fetch_github_content', new_callable=AsyncMock) as mock_fetch:
             mock_fetch.return_value = github_content_response
             
-            result = asyncio.run(extractor.extract_file_content(
+            result = await extractor.extract_file_content(
                 owner="owner",
                 repo="repo", 
                 file_path="src/main.py"
-            ))
+            )
         
         # Then: 파일 내용이 올바르게 추출되어야 함
         assert result["success"] is True
@@ -85,7 +91,25 @@ if __name__ == "__main__":
         assert result["size"] > 0
         assert result["encoding"] == "utf-8"
 
-    def test_extract_multiple_files_content(self, extractor, sample_file_list):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_extract_line_wrapped_base64_content(self, extractor, github_content_response):
+        """GitHub가 60자마다 줄바꿈한 Base64 응답도 동일하게 디코딩되는지 테스트"""
+        # Given: 줄바꿈이 포함된 Base64 콘텐츠
+        encoded = github_content_response["content"]
+        wrapped = "\n".join(encoded[i:i + 60] for i in range(0, len(encoded), 60)) + "\n"
+        response = {**github_content_response, "content": wrapped}
+        
+        # When: 파일 내용 추출
+        with patch.object(extractor, '_fetch_github_content', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = response
+            result = await extractor.extract_file_content("owner", "repo", "src/main.py")
+        
+        # Then: 원본 내용이 그대로 복원되어야 함
+        assert result["success"] is True
+        assert result["content"] == base64.b64decode(encoded).decode("utf-8")
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_extract_multiple_files_content(self, extractor, sample_file_list):
         """다중 파일 내용 일괄 추출 테스트"""
         # Given: 중요 파일 목록
         
@@ -99,11 +123,11 @@ if __name__ == "__main__":
                 "encoding": "utf-8"
             }
             
-            results = asyncio.run(extractor.extract_files_content(
+            results = await extractor.extract_files_content(
                 owner="owner",
                 repo="repo",
                 important_files=sample_file_list
-            ))
+            )
         
         # Then: 모든 파일의 내용이 추출되어야 함
         assert len(results) == len(sample_file_list)
@@ -113,7 +137,149 @@ if __name__ == "__main__":
             assert "file_path" in result
             assert "content" in result or "error" in result
 
-    def test_file_size_limit_filtering(self, extractor):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_extract_files_content_bounded_concurrency(self, extractor):
+        """일괄 추출이 동시 요청 수 제한을 지키고 실패 결과에 파일 경로를 남기는지 테스트"""
+        # Given: 동시 제한보다 많은 파일과 하나의 실패 파일
+        extractor.max_concurrency = 3
+        important_files = [{"path": f"src/module_{i}.py"} for i in range(10)]
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def fake_extract(owner, repo, file_path, fetch_semaphore=None, **kwargs):
+            nonlocal in_flight, max_in_flight
+            async with fetch_semaphore:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+            if file_path.endswith("_4.py"):
+                raise RuntimeError("boom")
+            return {"success": True, "file_path": file_path, "content": "pass", "size": 4}
+        
+        # When: 일괄 추출
+        with patch.object(extractor, 'extract_file_content', side_effect=fake_extract):
+            results = await extractor.extract_files_content("owner", "repo", important_files)
+        
+        # Then: 동시 실행은 제한 이내, 순서와 실패 경로가 보존되어야 함
+        assert 1 < max_in_flight <= 3
+        assert [r["file_path"] for r in results] == [f["path"] for f in important_files]
+        assert results[4]["success"] is False and "boom" in results[4]["error"]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_known_oversize_files_skip_github_request(self, extractor):
+        """트리 정보로 크기를 이미 아는 대용량 파일은 GitHub 요청 없이 제외되는지 테스트"""
+        # Given: 크기 제한을 넘는 파일과 정상 파일
+        extractor.redis_client = None
+        important_files = [
+            {"path": "data/huge.json", "size": extractor.size_limit + 1},
+            {"path": "src/main.py", "size": 12}
+        ]
+        
+        # When: 일괄 추출
+        with patch.object(extractor, '_fetch_github_content', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = {"content_bytes": b"print('hi')\n", "size": 12, "encoding": "raw"}
+            results = await extractor.extract_files_content("owner", "repo", important_files)
+        
+        # Then: 대용량 파일은 요청하지 않고 크기 초과로 보고
+        assert mock_fetch.await_count == 1
+        assert mock_fetch.call_args.args[2] == "src/main.py"
+        assert results[0]["success"] is False
+        assert "exceeds limit" in results[0]["error"]
+        assert results[1]["success"] is True
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_graphql_batch_prefetch_with_rest_fallback(self, extractor):
+        """여러 파일을 GraphQL 한 번으로 받고, 텍스트가 없거나 UTF-8이 아닌 파일만 REST로 조회하는지 테스트"""
+        # Given: 텍스트 Blob, 바이너리 Blob, 존재하지 않는 경로, UTF-8이 아닌 Blob에 대한 GraphQL 응답
+        extractor.redis_client = None
+        extractor.graphql_batch_size = 50
+        graphql_response = MagicMock(status=200)
+        graphql_response.json = AsyncMock(return_value={"data": {"repository": {
+            "f0": {"text": "print('main')\n", "byteSize": 14, "isBinary": False, "isTruncated": False},
+            "f1": {"text": None, "byteSize": 2048, "isBinary": True, "isTruncated": False},
+            "f2": None,
+            "f3": {"text": "name = 'caf\ufffd'\n", "byteSize": 13, "isBinary": False, "isTruncated": False}
+        }}})
+        session = MagicMock()
+        session.post.return_value.__aenter__.return_value = graphql_response
+        file_paths = ["src/main.py", "src/blob.txt", "src/missing.py", "src/latin1.py"]
+        
+        # When: 병렬 추출
+        with patch.object(extractor, '_get_session', return_value=session), \
+             patch.object(extractor, '_fetch_github_content', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = {"content_bytes": b"fallback = True\n", "size": 16, "encoding": "raw"}
+            results = await extractor.extract_files_content_parallel("owner", "repo", file_paths)
+        
+        # Then: GraphQL 요청 1회, 나머지 세 파일만 REST 조회
+        assert session.post.call_count == 1
+        variables = session.post.call_args.kwargs["json"]["variables"]
+        assert [variables[f"e{i}"] for i in range(4)] == [f"HEAD:{path}" for path in file_paths]
+        assert sorted(call.args[2] for call in mock_fetch.call_args_list) == [
+            "src/blob.txt", "src/latin1.py", "src/missing.py"
+        ]
+        assert results[0]["content"] == "print('main')\n"
+        assert results[1]["content"] == results[2]["content"] == results[3]["content"] == "fallback = True\n"
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_graphql_prefetch_reads_cache_once_per_file(self, extractor):
+        """GraphQL 선조회 전에 읽은 캐시 항목을 파일별 추출에서 다시 읽지 않는지 테스트"""
+        # Given: 비어 있는 Redis와 두 파일의 GraphQL 응답
+        extractor.redis_client = AsyncMock()
+        extractor.redis_client.get.return_value = None
+        extractor.graphql_batch_size = 50
+        graphql_response = MagicMock(status=200)
+        graphql_response.json = AsyncMock(return_value={"data": {"repository": {
+            "f0": {"text": "a = 1\n", "byteSize": 6, "isBinary": False, "isTruncated": False},
+            "f1": {"text": "b = 2\n", "byteSize": 6, "isBinary": False, "isTruncated": False}
+        }}})
+        session = MagicMock()
+        session.post.return_value.__aenter__.return_value = graphql_response
+        file_paths = ["src/cache_once_a.py", "src/cache_once_b.py"]
+        
+        # When: 병렬 추출
+        with patch.object(extractor, '_get_session', return_value=session), \
+             patch.object(extractor, '_fetch_github_content', new_callable=AsyncMock) as mock_fetch:
+            results = await extractor.extract_files_content_parallel("owner", "repo", file_paths)
+        
+        # Then: 파일당 Redis GET 1회, REST 요청 없음
+        assert extractor.redis_client.get.await_count == len(file_paths)
+        mock_fetch.assert_not_called()
+        assert [result["content"] for result in results] == ["a = 1\n", "b = 2\n"]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_parallel_extraction_overlaps_fetch_and_decode(self, extractor):
+        """디코딩 중인 파일이 네트워크 슬롯을 붙잡지 않아 다음 요청과 겹쳐 실행되는지 테스트"""
+        # Given: 네트워크 슬롯 1개, 모든 디코딩을 스레드 풀에서 수행
+        extractor.redis_client = None
+        extractor.offload_threshold = 0
+        events = []
+        original_pipeline = extractor._decode_pipeline
+        
+        async def fake_fetch(owner, repo, file_path, etag=None):
+            events.append(("fetch_start", file_path))
+            await asyncio.sleep(0.01)
+            return {"content": base64.b64encode(b"x = 1\n").decode(), "size": 6}
+        
+        def slow_pipeline(*args):
+            time.sleep(0.05)
+            result = original_pipeline(*args)
+            events.append(("decode_end", None))
+            return result
+        
+        # When: 두 파일 병렬 추출
+        with patch.object(extractor, '_fetch_github_content', side_effect=fake_fetch), \
+             patch.object(extractor, '_decode_pipeline', side_effect=slow_pipeline):
+            results = await extractor.extract_files_content_parallel(
+                "owner", "repo", ["src/a.py", "src/b.py"], max_concurrent=1
+            )
+        
+        # Then: 두 번째 요청이 첫 번째 디코딩 완료 전에 시작되어야 함
+        assert all(r["success"] for r in results)
+        assert events.index(("fetch_start", "src/b.py")) < events.index(("decode_end", None))
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_file_size_limit_filtering(self, extractor):
         """파일 크기 제한 필터링 테스트"""
         # Given: 50KB 이상의 대용량 파일
         large_content = "x" * (60 * 1024)  # 60KB
@@ -129,18 +295,19 @@ if __name__ == "__main__":
         with patch.object(extractor, '_fetch_github_content', new_callable=AsyncMock) as mock_fetch:
             mock_fetch.return_value = large_file_response
             
-            result = asyncio.run(extractor.extract_file_content(
+            result = await extractor.extract_file_content(
                 owner="owner",
                 repo="repo",
                 file_path="src/large_file.py"
-            ))
+            )
         
         # Then: 파일 크기 제한으로 인해 제외되어야 함
         assert result["success"] is False
         assert "exceeds limit" in result["error"].lower()
         assert result["size"] > extractor.size_limit
 
-    def test_binary_file_filtering(self, extractor):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_binary_file_filtering(self, extractor):
         """바이너리 파일 필터링 테스트"""
         # Given: 바이너리 파일 (이미지)
         binary_content = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01'
@@ -156,11 +323,11 @@ if __name__ == "__main__":
         with patch.object(extractor, '_fetch_github_content', new_callable=AsyncMock) as mock_fetch:
             mock_fetch.return_value = binary_file_response
             
-            result = asyncio.run(extractor.extract_file_content(
+            result = await extractor.extract_file_content(
                 owner="owner",
                 repo="repo",
                 file_path="assets/image.png"
-            ))
+            )
         
         # Then: 바이너리 파일은 제외되어야 함
         assert result["success"] is False
@@ -173,10 +340,12 @@ if __name__ == "__main__":
         file_path = "src/main.py"
         repo_id = "owner/repo"
         file_content = "print('Hello World')"
-        file_hash = hashlib.sha256(f"{repo_id}:{file_path}".encode()).hexdigest()
+        file_hash = hashlib.blake2b(f"{repo_id}:{file_path}".encode(), digest_size=16).hexdigest()
         cache_key = f"file_content:{repo_id}:{file_hash}"
         
-        with patch.object(extractor, 'redis_client') as mock_redis:
+        from app.services.file_content_extractor import _pack_cache_entry
+        
+        with patch.object(extractor, 'redis_client', new_callable=AsyncMock) as mock_redis:
             # When: 캐시에서 파일 내용 조회 (첫 번째 호출)
             mock_redis.get.return_value = None  # 캐시 미스
             
@@ -201,25 +370,131 @@ if __name__ == "__main__":
                 "encoding": "utf-8",
                 "cached_at": "2024-01-01T00:00:00Z"
             }
-            mock_redis.get.return_value = str(cached_data).encode()
+            mock_redis.get.return_value = _pack_cache_entry(cached_data)
             
             result2 = await extractor.get_cached_file_content(repo_id, file_path)
             
-            # Then: 캐시에서 데이터가 반환되어야 함
+            # Then: 캐시에서 데이터가 반환되어야 함 (방금 저장한 항목은 L1에서 응답)
             assert result2 is not None
+            assert result2["content"] == file_content
             mock_redis.get.assert_called()
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_stale_cache_revalidated_with_etag(self, extractor):
+        """신선 기간이 지난 캐시는 If-None-Match로 재검증하고 304면 본문 없이 재사용하는지 테스트"""
+        # Given: 메모리 기반 Redis 대역과 ETag가 포함된 raw 응답
+        store = {}
+        
+        async def fake_setex(key, ttl, value):
+            store[key] = value
+        
+        async def fake_get(key):
+            return store.get(key)
+        
+        from app.services.file_content_extractor import _pack_cache_entry, _unpack_cache_entry
+        
+        extractor.redis_client = Mock(setex=fake_setex, get=fake_get)
+        file_content = "print('cached')\n"
+        
+        with patch.object(extractor, '_fetch_github_content', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = {
+                "content_bytes": file_content.encode(),
+                "size": len(file_content),
+                "encoding": "raw",
+                "etag": '"abc123"'
+            }
+            first = await extractor.extract_file_content("owner", "repo", "src/main.py")
+            
+            # When: 신선 기간을 과거로 돌린 뒤 다시 추출 (GitHub는 304 응답)
+            cache_key = extractor._generate_cache_key("owner/repo", "src/main.py")
+            entry = _unpack_cache_entry(store[cache_key])
+            entry["fresh_until"] = 0
+            store[cache_key] = _pack_cache_entry(entry)
+            extractor._l1_cache.clear()  # L1 TTL 경과
+            mock_fetch.return_value = {"not_modified": True}
+            
+            with patch.object(extractor, '_decode_pipeline') as mock_decode:
+                second = await extractor.extract_file_content("owner", "repo", "src/main.py")
+        
+        # Then: 저장된 ETag로 조건부 요청, 디코딩 없이 동일 내용 반환, 메타데이터는 노출하지 않음
+        assert mock_fetch.call_args.kwargs["etag"] == '"abc123"'
+        mock_decode.assert_not_called()
+        assert second == first
+        assert "etag" not in second and "fresh_until" not in second
+        assert extractor.metrics["revalidations"] == 1
+        assert _unpack_cache_entry(store[cache_key])["fresh_until"] > 0
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_l1_cache_skips_redis_round_trip(self, extractor):
+        """반복 조회는 L1에서 응답하고, 무효화 시 L1과 Redis 모두 비우는지 테스트"""
+        from app.services.file_content_extractor import _pack_cache_entry
+        
+        cached_data = {"file_path": "README.md", "content": "# Title", "size": 7, "success": True}
+        
+        with patch.object(extractor, 'redis_client', new_callable=AsyncMock) as mock_redis:
+            mock_redis.get.return_value = _pack_cache_entry(cached_data)
+            
+            # When: 같은 파일 두 번 조회
+            first = await extractor.get_cached_file_content("owner/repo", "README.md")
+            second = await extractor.get_cached_file_content("owner/repo", "README.md")
+            
+            # Then: Redis는 한 번만 조회
+            assert first == second == cached_data
+            assert mock_redis.get.await_count == 1
+            
+            # When: 무효화 후 다시 조회
+            await extractor.invalidate_file_cache("owner/repo", "README.md")
+            mock_redis.get.return_value = None
+            third = await extractor.get_cached_file_content("owner/repo", "README.md")
+        
+        # Then: L1도 비워져 Redis를 다시 조회해야 함
+        mock_redis.delete.assert_awaited_once()
+        assert third is None
+        assert mock_redis.get.await_count == 2
+
+    def test_cache_entry_codec_reads_legacy_json(self):
+        """캐시 직렬화 왕복과, msgpack 도입 이전 JSON 항목 호환 테스트"""
+        from app.services.file_content_extractor import _pack_cache_entry, _unpack_cache_entry
+        
+        entry = {"file_path": "src/main.py", "content": "print('안녕')", "size": 15, "success": True}
+        legacy_json = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        
+        assert _unpack_cache_entry(_pack_cache_entry(entry)) == entry
+        assert _unpack_cache_entry(legacy_json) == entry
+
+    def test_cache_entry_is_compressed(self):
+        """zstandard 사용 가능 시 캐시 항목이 압축 저장되고, 압축 이전 항목도 읽히는지 테스트"""
+        from app.services import file_content_extractor as module
+        if not module.ZSTD_AVAILABLE:
+            pytest.skip("zstandard not installed")
+        
+        # Given: 반복이 많은 소스 코드 내용
+        content = "def handler(request):\n    return process(request)\n" * 200
+        entry = {"file_path": "src/main.py", "content": content, "size": len(content), "success": True}
+        uncompressed = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        
+        # When: 직렬화
+        packed = module._pack_cache_entry(entry)
+        
+        # Then: zstd 프레임으로 원본보다 작게 저장되고 왕복이 일치해야 함
+        assert packed.startswith(module._ZSTD_MAGIC)
+        assert len(packed) < len(uncompressed) // 3
+        assert module._unpack_cache_entry(packed) == entry
+        assert module._unpack_cache_entry(uncompressed) == entry
+
     def test_detect_text_file_by_extension(self, extractor):
         """파일 확장자로 텍스트 파일 감지 테스트"""
         # Given: 다양한 파일 확장자
         text_files = [
             "src/main.py", "app.js", "style.css", "index.html",
-            "config.json", "README.md", "Dockerfile", ".gitignore"
+            "config.json", "README.md", "Dockerfile", ".gitignore",
+            "LICENSE", "src/App.TSX", ".env.local"
         ]
         
         binary_files = [
             "image.png", "photo.jpg", "document.pdf", "archive.zip",
-            "executable.exe", "library.so", "font.ttf"
+            "executable.exe", "library.so", "font.ttf",
+            "assets/Logo.PNG", "dist/bundle.tar.gz"
         ]
         
         # When & Then: 텍스트 파일 감지
@@ -241,6 +516,40 @@ if __name__ == "__main__":
         assert extractor._is_text_content(binary_content) is False
         assert extractor._is_text_content(mixed_content.encode()) is False
 
+    def test_detect_text_content_sampling(self, extractor):
+        """UTF-8 멀티바이트 텍스트는 텍스트로, 샘플 범위 안의 NULL/제어 문자는 바이너리로 판정"""
+        korean_text = "# 사용자 인증 모듈\nclass 인증서비스:\n    pass\n".encode("utf-8") * 50
+        null_after_first_kb = b"a" * 4096 + b"\x00"
+        control_heavy = bytes(range(1, 9)) * 10
+        
+        assert extractor._is_text_content(korean_text) is True
+        assert extractor._is_text_content(null_after_first_kb) is False
+        assert extractor._is_text_content(control_heavy) is False
+        assert extractor._is_text_content(b"") is True
+
+    def test_text_sample_size_configurable(self, extractor):
+        """샘플 크기를 늘리면 기본 샘플 범위 밖의 NULL 바이트도 감지하는지 테스트"""
+        null_after_sample = b"a" * 20000 + b"\x00"
+        
+        assert extractor._is_text_content(null_after_sample) is True
+        
+        extractor.text_sample_size = 64 * 1024
+        assert extractor._is_text_content(null_after_sample) is False
+
+    def test_small_utf8_content_skips_general_decoding(self, extractor):
+        """최대 라인 수보다 작은 UTF-8 콘텐츠는 인코딩 감지/트렁케이션 단계를 거치지 않는지 테스트"""
+        small = "def hello():\n    return '안녕'\n".encode("utf-8")
+        latin1 = "caf\xe9 = 1\n".encode("latin-1")
+        
+        with patch.object(extractor, '_decode_and_truncate', wraps=extractor._decode_and_truncate) as mock_general:
+            fast = extractor._decode_pipeline(small, is_raw=True)
+            assert mock_general.call_count == 0
+            fallback = extractor._decode_pipeline(latin1, is_raw=True)
+            assert mock_general.call_count == 1
+        
+        assert fast == {"content": small.decode("utf-8"), "encoding": "utf-8", "size": len(small)}
+        assert fallback["content"] == latin1.decode(fallback["encoding"])
+
     def test_content_encoding_handling(self, extractor):
         """다양한 인코딩 처리 테스트"""
         # Given: 다양한 인코딩의 파일 내용
@@ -263,7 +572,8 @@ if __name__ == "__main__":
         assert decoded_latin1["content"] is not None
         assert decoded_latin1["encoding"] in ["utf-8", "latin-1", "ISO-8859-1"]
 
-    def test_github_api_error_handling(self, extractor):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_github_api_error_handling(self, extractor):
         """GitHub API 오류 처리 테스트"""
         # Given: API 오류 상황들
         
@@ -271,18 +581,19 @@ if __name__ == "__main__":
         with patch.object(extractor, '_fetch_github_content', new_callable=AsyncMock) as mock_fetch:
             mock_fetch.side_effect = Exception("404: Not Found")
             
-            result = asyncio.run(extractor.extract_file_content(
+            result = await extractor.extract_file_content(
                 owner="owner",
                 repo="repo",
                 file_path="nonexistent.py"
-            ))
+            )
         
         # Then: 오류가 적절히 처리되어야 함
         assert result["success"] is False
         assert "error" in result
         assert ("404" in result["error"] or "not found" in result["error"].lower())
 
-    def test_rate_limiting_handling(self, extractor):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_rate_limiting_handling(self, extractor):
         """GitHub API Rate Limiting 처리 테스트"""
         # Given: Rate Limit 에러
         
@@ -290,16 +601,81 @@ if __name__ == "__main__":
         with patch.object(extractor, '_fetch_github_content', new_callable=AsyncMock) as mock_fetch:
             mock_fetch.side_effect = Exception("403: rate limit exceeded")
             
-            result = asyncio.run(extractor.extract_file_content(
+            result = await extractor.extract_file_content(
                 owner="owner",
                 repo="repo",
                 file_path="src/main.py"
-            ))
+            )
         
         # Then: Rate Limiting 오류가 적절히 처리되어야 함
         assert result["success"] is False
         assert "rate limit" in result["error"].lower()
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_rate_limit_retry_after_reset(self, extractor):
+        """Rate Limit 응답 시 Retry-After만큼 대기한 뒤 재시도하는지 테스트"""
+        # Given: 첫 응답은 Retry-After가 있는 403, 두 번째 응답은 정상 raw 본문
+        raw_bytes = b"print('ok')\n"
+        limited = MagicMock(status=403, headers={"Retry-After": "3"})
+        ok = MagicMock(status=200, content_type="application/vnd.github.raw+json",
+                       content_length=len(raw_bytes), headers={})
+        ok.read = AsyncMock(return_value=raw_bytes)
+        session = MagicMock()
+        session.get.return_value.__aenter__.side_effect = [limited, ok]
+        extractor.redis_client = None
+        
+        # When: 파일 내용 추출
+        with patch.object(extractor, '_get_session', return_value=session), \
+             patch('app.services.file_content_extractor.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result = await extractor.extract_file_content("owner", "repo", "src/main.py")
+        
+        # Then: 리셋 시간(+지터)만큼 한 번 대기하고 재시도 결과를 반환해야 함
+        assert session.get.call_count == 2
+        mock_sleep.assert_awaited_once()
+        assert 3 <= mock_sleep.await_args.args[0] <= 4
+        assert result["success"] is True
+        assert result["content"] == raw_bytes.decode("utf-8")
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_rate_limit_fails_fast_when_reset_too_far(self, extractor):
+        """리셋까지 최대 대기 시간보다 오래 남으면 대기 없이 Rate Limit 오류를 반환하는지 테스트"""
+        # Given: 남은 요청 0, 리셋이 1시간 뒤인 403 응답
+        limited = MagicMock(status=403, headers={
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 3600)
+        })
+        session = MagicMock()
+        session.get.return_value.__aenter__.return_value = limited
+        extractor.redis_client = None
+        
+        # When: 파일 내용 추출
+        with patch.object(extractor, '_get_session', return_value=session), \
+             patch('app.services.file_content_extractor.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result = await extractor.extract_file_content("owner", "repo", "src/main.py")
+        
+        # Then: 재시도 없이 Rate Limit 오류
+        assert session.get.call_count == 1
+        mock_sleep.assert_not_awaited()
+        assert result["success"] is False
+        assert "rate limit" in result["error"].lower()
+
+    def test_encoding_detected_from_prefix_only(self, extractor):
+        """UTF-8이 아닌 큰 파일은 앞부분 샘플만으로 인코딩을 감지하는지 테스트"""
+        # Given: 4KB보다 큰 EUC-KR 파일
+        euc_kr_text = "# 한글 주석이 있는 설정 파일\nname = '테스트'\n" * 400
+        euc_kr_bytes = euc_kr_text.encode("euc-kr")
+        
+        # When: 인코딩 감지기를 감시하며 디코딩
+        with patch('app.services.file_content_extractor._detect_encoding',
+                   return_value={"encoding": "EUC-KR", "confidence": 0.99}) as mock_detect:
+            decoded = extractor._decode_content(euc_kr_bytes)
+        
+        # Then: 감지는 앞부분 샘플로 한 번만, 디코딩은 전체 내용
+        sample = mock_detect.call_args.args[0]
+        assert len(sample) == 4096 < len(euc_kr_bytes)
+        assert decoded["encoding"] == "EUC-KR"
+        assert decoded["content"] == euc_kr_text
+
     def test_content_truncation_for_large_files(self, extractor):
         """대용량 파일 내용 트렁케이션 테스트"""
         # Given: 제한 내이지만 긴 파일
@@ -314,6 +690,126 @@ if __name__ == "__main__":
         assert len(lines) <= 150  # Allow some flexibility for truncation logic
         assert ("truncated" in truncated.lower() or len(lines) < len(long_text.split('\n')))
 
+    def test_truncation_keeps_important_lines_in_order(self, extractor):
+        """제한 이내 내용은 그대로, 초과 시 중요 라인을 우선하되 원래 순서를 유지하는지 테스트"""
+        short_text = "\n".join(f"x = {i}" for i in range(100))
+        assert extractor._truncate_content(short_text, max_lines=100) is short_text
+        
+        body = [f"    value_{i} = {i}" for i in range(400)]
+        body[350] = "def late_function():"
+        truncated = extractor._truncate_content("\n".join(body), max_lines=100)
+        result_lines = truncated.split('\n')
+        
+        assert "def late_function():" in result_lines
+        assert result_lines.index("    value_0 = 0") < result_lines.index("def late_function():")
+        assert result_lines[-1].startswith("... (content truncated")
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_large_content_decoding_offloaded_to_thread(self, extractor):
+        """큰 파일의 디코딩 파이프라인이 이벤트 루프 밖(스레드 풀)에서 실행되는지 테스트"""
+        # Given: 오프로드 임계값을 넘는 파일과 작은 파일
+        large_content = "x = 1\n" * (extractor.offload_threshold // 6 + 1)
+        small_content = "x = 1\n"
+        extractor.redis_client = None
+        
+        original_pipeline = extractor._decode_pipeline
+        ran_on_main_thread = []
+        
+        def spy_pipeline(*args):
+            ran_on_main_thread.append(threading.current_thread() is threading.main_thread())
+            return original_pipeline(*args)
+        
+        for content in (small_content, large_content):
+            with patch.object(extractor, '_fetch_github_content', new_callable=AsyncMock) as mock_fetch, \
+                 patch.object(extractor, '_decode_pipeline', side_effect=spy_pipeline):
+                mock_fetch.return_value = {
+                    "content": base64.b64encode(content.encode()).decode(),
+                    "encoding": "base64",
+                    "size": len(content)
+                }
+                
+                # When: 파일 내용 추출
+                result = await extractor.extract_file_content("owner", "repo", "src/main.py")
+            
+            # Then: 결과는 스레드 사용 여부와 무관하게 동일해야 함
+            assert result["success"] is True
+            assert result["content"] == content
+        
+        # 작은 파일은 인라인, 큰 파일만 워커 스레드
+        assert ran_on_main_thread == [True, False]
+
+    def test_decode_pool_shared_across_instances(self, extractor):
+        """디코딩 워커 풀이 인스턴스마다 생성되지 않고 모듈 단위로 공유되는지 테스트"""
+        from app.services.file_content_extractor import FileContentExtractor
+        
+        other = FileContentExtractor()
+        
+        assert other._decode_pool is extractor._decode_pool
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_http_session_reused_across_requests(self):
+        """여러 요청이 하나의 HTTP 세션(커넥션 풀)을 공유하고 컨텍스트 종료 시 닫히는지 테스트"""
+        from app.services.file_content_extractor import FileContentExtractor
+        
+        async with FileContentExtractor(github_token="test_token") as extractor:
+            first = extractor._get_session()
+            second = extractor._get_session()
+            
+            assert first is second
+            assert first.headers["Authorization"] == "token test_token"
+        
+        assert first.closed is True
+        assert extractor._session is None
+
+    def test_http_session_bound_to_one_event_loop(self):
+        """다른 이벤트 루프에서 열린 세션을 조용히 교체하지 않고 오류를 내는지 테스트"""
+        from app.services.file_content_extractor import FileContentExtractor
+        
+        extractor = FileContentExtractor()
+        
+        async def open_session():
+            return extractor._get_session()
+        
+        session = asyncio.run(open_session())
+        with pytest.raises(RuntimeError):
+            asyncio.run(open_session())
+        assert extractor._session is session
+        
+        # 닫은 뒤에는 새 루프에서 다시 생성 가능
+        asyncio.run(extractor.close())
+        assert session.closed
+        
+        async def reopen_and_close():
+            reopened = extractor._get_session()
+            await extractor.close()
+            return reopened
+        
+        assert asyncio.run(reopen_and_close()) is not session
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_raw_media_type_skips_base64(self, extractor):
+        """raw 미디어 타입 응답은 Base64 디코딩 없이 원본 바이트로 처리되는지 테스트"""
+        # Given: GitHub가 raw 미디어 타입으로 돌려준 원본 바이트
+        raw_bytes = "def hello():\n    return '안녕'\n".encode("utf-8")
+        response = MagicMock(status=200, content_type="application/vnd.github.raw+json",
+                             content_length=len(raw_bytes))
+        response.read = AsyncMock(return_value=raw_bytes)
+        session = MagicMock()
+        session.get.return_value.__aenter__.return_value = response
+        extractor.redis_client = None
+        
+        # When: 파일 내용 추출
+        with patch.object(extractor, '_get_session', return_value=session), \
+             patch('app.services.file_content_extractor._b64decode') as mock_b64decode:
+            result = await extractor.extract_file_content("owner", "repo", "src/main.py")
+        
+        # Then: raw Accept 헤더로 요청하고, Base64 디코딩 없이 원본 내용을 반환해야 함
+        assert session.get.call_args.kwargs["headers"]["Accept"] == "application/vnd.github.raw+json"
+        mock_b64decode.assert_not_called()
+        assert result["success"] is True
+        assert result["content"] == raw_bytes.decode("utf-8")
+        assert result["size"] == len(raw_bytes)
+
     def test_extract_important_code_sections(self, extractor):
         """중요 코드 섹션 추출 테스트"""
         # Given: 클래스와 함수가 포함된 Python 코드
@@ -351,6 +847,22 @@ if __name__ == "__main__":
         assert any("class DatabaseManager" in section for section in sections)
         assert any("def main()" in section for section in sections)
 
+    def test_extract_important_sections_javascript_limit(self, extractor):
+        """JavaScript 함수/클래스 섹션 추출과 최대 10개 제한 테스트"""
+        # Given: 12개의 함수와 클래스 하나가 있는 JavaScript 코드
+        functions = "\n".join(
+            f"export function handler{i}(req) {{\n  return req.body;\n}}" for i in range(12)
+        )
+        js_code = "class Router {\n  route() {}\n}\n" + functions
+        
+        # When: 중요 섹션 추출
+        sections = extractor._extract_important_sections(js_code, "javascript")
+        
+        # Then: 최대 10개, 선언 순서대로 반환
+        assert len(sections) == 10
+        assert sections[0].startswith("class Router")
+        assert sections[1].startswith("export function handler0")
+
 
 class TestContentCacheManager:
     """파일 내용 캐시 관리자 테스트"""
@@ -369,7 +881,9 @@ class TestContentCacheManager:
         
         # Then: 일관된 캐시 키가 생성되어야 함
         assert cache_key.startswith("file_content:")
-        assert repo_id.replace("/", "_") in cache_key or hashlib.sha256(f"{repo_id}:{file_path}".encode()).hexdigest() in cache_key
+        assert repo_id.replace("/", "_") in cache_key or hashlib.blake2b(f"{repo_id}:{file_path}".encode(), digest_size=16).hexdigest() in cache_key
+        assert cache_key == extractor._generate_cache_key(repo_id, file_path)
+        assert cache_key != extractor._generate_cache_key(repo_id, "src/other.py")
 
     def test_cache_expiration_handling(self):
         """캐시 만료 처리 테스트"""
@@ -410,6 +924,7 @@ class TestFileContentIntegration:
         # Given: 전체 시스템 Mock
         from app.services.file_content_extractor import FileContentExtractor
         extractor = FileContentExtractor(github_token="test_token")
+        extractor.graphql_batch_size = 0
         
         important_files = [
             {"path": "src/main.py", "importance_score": 0.95},
@@ -451,7 +966,8 @@ class TestFileContentIntegration:
         assert "average_response_time" in metrics
         assert "error_rate" in metrics
 
-    def test_concurrent_file_extraction(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_concurrent_file_extraction(self):
         """동시 파일 추출 테스트"""
         # Given: 동시 요청 상황
         from app.services.file_content_extractor import FileContentExtractor
@@ -463,11 +979,11 @@ class TestFileContentIntegration:
         with patch.object(extractor, 'extract_file_content', new_callable=AsyncMock) as mock_extract:
             mock_extract.return_value = {"success": True, "content": "test"}
             
-            results = asyncio.run(extractor.extract_files_content_parallel(
+            results = await extractor.extract_files_content_parallel(
                 owner="owner",
                 repo="repo", 
                 file_paths=file_paths
-            ))
+            )
         
         # Then: 모든 파일이 병렬로 처리되어야 함
         assert len(results) == len(file_paths)
@@ -13,82 +13,86 @@ from unittest.mock import Mock, AsyncMock
 # from app.services.file_importance_analyzer import SmartFileImportanceAnalyzer
 
 
-class TestSmartFileImportanceAnalyzer:
-    """파일 중요도 분석기 테스트"""
-    
-    @pytest.fixture
-    def analyzer(self):
-        """테스트용 파일 중요도 분석기 인스턴스"""
-        from app.services.file_importance_analyzer import SmartFileImportanceAnalyzer
-        return SmartFileImportanceAnalyzer()
-    
-    @pytest.fixture
-    def sample_dependency_data(self):
-        """테스트용 의존성 데이터"""
-        return {
-            "src/main.ts": 0.8,  # 높은 의존성 중심성
-            "src/core/config.ts": 0.9,  # 최고 의존성 중심성
-            "src/utils/helper.ts": 0.6,  # 중간 의존성 중심성
-            "src/components/App.tsx": 0.4,  # 낮은 의존성 중심성
-            "README.md": 0.0  # 의존성 없음
-        }
-    
-    @pytest.fixture
-    def sample_churn_data(self):
-        """테스트용 변경 이력 데이터"""
-        return {
-            "src/main.ts": {
-                "commit_frequency": 15,
-                "recent_activity": 0.8,
-                "bug_fix_ratio": 0.3,
-                "stability_score": 0.4
-            },
-            "src/core/config.ts": {
-                "commit_frequency": 8,
-                "recent_activity": 0.2,
-                "bug_fix_ratio": 0.1,
-                "stability_score": 0.9
-            },
-            "src/utils/helper.ts": {
-                "commit_frequency": 20,
-                "recent_activity": 0.9,
-                "bug_fix_ratio": 0.4,
-                "stability_score": 0.3
-            },
-            "src/components/App.tsx": {
-                "commit_frequency": 5,
-                "recent_activity": 0.3,
-                "bug_fix_ratio": 0.1,
-                "stability_score": 0.8
-            }
+@pytest.fixture(scope="module")
+def analyzer():
+    """테스트용 파일 중요도 분석기 인스턴스 (모듈 단위 공유, 상태 변경은 monkeypatch로 복원)"""
+    from app.services.file_importance_analyzer import SmartFileImportanceAnalyzer
+    return SmartFileImportanceAnalyzer()
+
+
+@pytest.fixture(scope="module")
+def sample_dependency_data():
+    """테스트용 의존성 데이터"""
+    return {
+        "src/main.ts": 0.8,  # 높은 의존성 중심성
+        "src/core/config.ts": 0.9,  # 최고 의존성 중심성
+        "src/utils/helper.ts": 0.6,  # 중간 의존성 중심성
+        "src/components/App.tsx": 0.4,  # 낮은 의존성 중심성
+        "README.md": 0.0  # 의존성 없음
+    }
+
+
+@pytest.fixture(scope="module")
+def sample_churn_data():
+    """테스트용 변경 이력 데이터"""
+    return {
+        "src/main.ts": {
+            "commit_frequency": 15,
+            "recent_activity": 0.8,
+            "bug_fix_ratio": 0.3,
+            "stability_score": 0.4
+        },
+        "src/core/config.ts": {
+            "commit_frequency": 8,
+            "recent_activity": 0.2,
+            "bug_fix_ratio": 0.1,
+            "stability_score": 0.9
+        },
+        "src/utils/helper.ts": {
+            "commit_frequency": 20,
+            "recent_activity": 0.9,
+            "bug_fix_ratio": 0.4,
+            "stability_score": 0.3
+        },
+        "src/components/App.tsx": {
+            "commit_frequency": 5,
+            "recent_activity": 0.3,
+            "bug_fix_ratio": 0.1,
+            "stability_score": 0.8
         }
-    
-    @pytest.fixture
-    def sample_complexity_data(self):
-        """테스트용 복잡도 데이터"""
-        return {
-            "src/main.ts": {
-                "cyclomatic_complexity": 12,
-                "maintainability_index": 65,
-                "lines_of_code": {"executable": 150}
-            },
-            "src/core/config.ts": {
-                "cyclomatic_complexity": 3,
-                "maintainability_index": 90,
-                "lines_of_code": {"executable": 50}
-            },
-            "src/utils/helper.ts": {
-                "cyclomatic_complexity": 18,
-                "maintainability_index": 55,
-                "lines_of_code": {"executable": 200}
-            },
-            "src/components/App.tsx": {
-                "cyclomatic_complexity": 8,
-                "maintainability_index": 75,
-                "lines_of_code": {"executable": 100}
-            }
+    }
+
+
+@pytest.fixture(scope="module")
+def sample_complexity_data():
+    """테스트용 복잡도 데이터"""
+    return {
+        "src/main.ts": {
+            "cyclomatic_complexity": 12,
+            "maintainability_index": 65,
+            "lines_of_code": {"executable": 150}
+        },
+        "src/core/config.ts": {
+            "cyclomatic_complexity": 3,
+            "maintainability_index": 90,
+            "lines_of_code": {"executable": 50}
+        },
+        "src/utils/helper.ts": {
+            "cyclomatic_complexity": 18,
+            "maintainability_index": 55,
+            "lines_of_code": {"executable": 200}
+        },
+        "src/components/App.tsx": {
+            "cyclomatic_complexity": 8,
+            "maintainability_index": 75,
+            "lines_of_code": {"executable": 100}
         }
+    }
 
+
+class TestSmartFileImportanceAnalyzer:
+    """파일 중요도 분석기 테스트"""
+    
     def test_calculate_structural_importance_from_filename(self, analyzer):
         """파일명 패턴 기반 구조적 중요도 계산 테스트"""
         # Given: 다양한 파일명 패턴
@@ -177,6 +181,24 @@ class TestSmartFileImportanceAnalyzer:
         scores = [f["importance_score"] for f in critical_files]
         assert scores == sorted(scores, reverse=True)
 
+    def test_identify_critical_files_matches_full_sort(self, analyzer):
+        """상위 top_n 선택 결과가 전체 정렬 후 자른 결과와 같은지 테스트 (동점 순서 포함)"""
+        # Given: 동점이 많은 대규모 파일 집합
+        dependency = {f"src/module_{i}.py": (i % 7) / 7 for i in range(500)}
+        
+        # When: 핵심 파일 식별
+        critical_files = analyzer.identify_critical_files(
+            dependency_centrality=dependency,
+            churn_metrics={},
+            complexity_metrics={},
+            top_n=20
+        )
+        
+        # Then: 전체 정렬 기준 상위 20개와 순서까지 일치해야 함
+        scores = analyzer.calculate_comprehensive_importance_scores(dependency, {}, {})
+        expected = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:20]
+        assert [f["file_path"] for f in critical_files] == [path for path, _ in expected]
+
     def test_generate_file_selection_reasons(self, analyzer):
         """파일 선정 이유 생성 테스트"""
         # Given: 파일의 메트릭 데이터
@@ -199,6 +221,23 @@ class TestSmartFileImportanceAnalyzer:
             assert isinstance(reason, str)
             assert len(reason) > 0
 
+    def test_selection_reasons_follow_metric_rule_tiers(self, analyzer, monkeypatch):
+        """메트릭별로 첫 충족 구간의 이유만 추가되고, 규칙 테이블 수정이 반영되는지 테스트"""
+        metrics = {
+            'structural_importance': 0.0,
+            'dependency_centrality': 0.75,
+            'churn_risk': 0.55,
+            'complexity_score': 0.1
+        }
+        
+        assert analyzer.generate_file_selection_reasons("src/x.ts", metrics) == [
+            "다른 파일들이 많이 참조하는 핵심 의존성",
+            "지속적으로 개선되고 있는 중요 모듈"
+        ]
+        
+        monkeypatch.setattr(analyzer, 'metric_reason_rules', [('complexity_score', [(0.05, "복잡도 규칙")])])
+        assert analyzer.generate_file_selection_reasons("src/x.ts", metrics) == ["복잡도 규칙"]
+
     def test_categorize_files_by_importance(
         self, analyzer, sample_dependency_data, sample_churn_data, sample_complexity_data
     ):
@@ -222,6 +261,23 @@ class TestSmartFileImportanceAnalyzer:
         for category, files in categorized.items():
             assert isinstance(files, list)
 
+    def test_categorize_scores_threshold_boundaries(self, analyzer):
+        """임계값과 같은 점수는 상위 구간에 속하고, 구간 내는 점수 내림차순(동점은 입력 순)인지 테스트"""
+        scores = {
+            "a.py": 0.15, "b.py": 0.4, "c.py": 0.1, "d.py": 0.25,
+            "e.py": 0.9, "f.py": 0.4, "g.py": 0.0, "h.py": 0.3
+        }
+        
+        categorized = analyzer._categorize_scores(scores)
+        
+        assert categorized == {
+            'critical': ["e.py", "b.py", "f.py"],
+            'important': ["h.py", "d.py"],
+            'moderate': ["a.py"],
+            'low': ["c.py", "g.py"]
+        }
+        assert analyzer._categorize_scores({}) == {'critical': [], 'important': [], 'moderate': [], 'low': []}
+
     def test_calculate_importance_distribution(
         self, analyzer, sample_dependency_data, sample_churn_data, sample_complexity_data
     ):
@@ -243,6 +299,24 @@ class TestSmartFileImportanceAnalyzer:
         assert "max" in distribution
         assert "quartiles" in distribution
 
+    def test_importance_distribution_matches_statistics_module(self, analyzer):
+        """NumPy 기반 분포 통계가 statistics 모듈 계산과 일치하는지 테스트"""
+        import statistics
+        
+        # Given: 여러 파일의 의존성 점수
+        dependency = {f"src/module_{i}.py": ((i * 37) % 101) / 101 for i in range(57)}
+        scores = list(analyzer.calculate_comprehensive_importance_scores(dependency, {}, {}).values())
+        
+        # When: 중요도 분포 계산
+        distribution = analyzer.calculate_importance_distribution(dependency, {}, {})
+        
+        # Then: 표본 표준편차와 exclusive 사분위수까지 동일해야 함
+        quartiles = statistics.quantiles(scores, n=4)
+        assert distribution["mean"] == round(statistics.mean(scores), 3)
+        assert distribution["median"] == round(statistics.median(scores), 3)
+        assert distribution["std_dev"] == round(statistics.stdev(scores), 3)
+        assert distribution["quartiles"] == {"q1": round(quartiles[0], 3), "q3": round(quartiles[2], 3)}
+
     def test_get_improvement_suggestions(self, analyzer):
         """개선 제안 생성 테스트"""
         # Given: 핵심 파일 정보
@@ -294,6 +368,21 @@ class TestSmartFileImportanceAnalyzer:
         # Then: 빈 결과가 반환되어야 함
         assert scores == {}
 
+    def test_dependency_only_scores_skip_feature_extraction(self, analyzer, sample_dependency_data):
+        """의존성 데이터만 있으면 지표 추출을 생략하고, 빈 지표를 넘긴 결과와 같은지 테스트"""
+        from unittest.mock import patch
+        
+        with patch.object(analyzer, '_extract_feature_arrays', wraps=analyzer._extract_feature_arrays) as mock_extract:
+            scores = analyzer.calculate_comprehensive_importance_scores(sample_dependency_data, {}, {})
+            assert mock_extract.call_count == 0
+            
+            # 지표 추출을 거친 결과(빈 항목만 있는 지표)와 동일해야 함
+            empty_churn = {path: {} for path in sample_dependency_data}
+            expected = analyzer.calculate_comprehensive_importance_scores(sample_dependency_data, empty_churn, {})
+            assert mock_extract.call_count == 1
+        
+        assert scores == expected
+
     def test_partial_data_handling(self, analyzer, sample_dependency_data):
         """부분 데이터 처리 테스트"""
         # Given: 부분적인 메트릭 데이터 (일부만 있음)
@@ -315,15 +404,145 @@ class TestSmartFileImportanceAnalyzer:
             assert 0.0 <= score <= 1.0
 
 
+    def test_batch_metric_scores_match_scalar_scores(
+        self, analyzer, sample_churn_data, sample_complexity_data
+    ):
+        """배열 기반 변경 이력/복잡도 점수가 파일별 스칼라 계산과 일치하는지 테스트"""
+        # Given: 샘플 메트릭과 빈/누락 항목
+        churn_metrics = {**sample_churn_data, "empty.py": {}}
+        complexity_metrics = {**sample_complexity_data, "empty.py": {}}
+        files = sorted(set(churn_metrics) | set(complexity_metrics) | {"missing.py"})
+        
+        # When: 지표 배열 추출 후 일괄 계산
+        features = analyzer._extract_feature_arrays(files, churn_metrics, complexity_metrics)
+        churn_scores = analyzer._calculate_churn_importance_scores(features)
+        complexity_scores = analyzer._calculate_complexity_importance_scores(features)
+        
+        # Then: 스칼라 계산과 동일해야 함 (빈/누락 항목은 0.0)
+        assert churn_scores.tolist() == pytest.approx(
+            [analyzer._calculate_churn_importance_score(churn_metrics.get(f, {})) for f in files]
+        )
+        assert complexity_scores.tolist() == pytest.approx(
+            [analyzer._calculate_complexity_importance_score(complexity_metrics.get(f, {})) for f in files]
+        )
+
+    def test_scratch_buffers_are_reused_across_calls(
+        self, sample_dependency_data, sample_churn_data, sample_complexity_data
+    ):
+        """반복 호출 시 작업 버퍼를 재사용하면서 결과가 동일한지 테스트"""
+        from app.services.file_importance_analyzer import SmartFileImportanceAnalyzer
+        analyzer = SmartFileImportanceAnalyzer()
+        first = analyzer.calculate_comprehensive_importance_scores(
+            sample_dependency_data, sample_churn_data, sample_complexity_data
+        )
+
+        count = len(first)
+        pooled_ids = {id(buffer) for buffer in analyzer._scratch[count]}
+        assert len(pooled_ids) == 7
+        matrix_ids = {id(buffer) for buffer in analyzer._scratch[(count, 4)]}
+        assert len(matrix_ids) == 1
+
+        # 다른 입력으로 호출해도 이전 내용이 섞이지 않아야 함
+        partial = analyzer.calculate_comprehensive_importance_scores(sample_dependency_data, {}, {})
+        second = analyzer.calculate_comprehensive_importance_scores(
+            sample_dependency_data, sample_churn_data, sample_complexity_data
+        )
+
+        assert second == first
+        assert {id(buffer) for buffer in analyzer._scratch[count]} == pooled_ids
+        assert {id(buffer) for buffer in analyzer._scratch[(count, 4)]} == matrix_ids
+        assert partial.keys() == sample_dependency_data.keys()
+
+    def test_scores_match_scalar_formula(
+        self, analyzer, sample_dependency_data, sample_churn_data, sample_complexity_data
+    ):
+        """벡터화 파이프라인 점수가 파일별 float64 스칼라 공식과 일치하는지 테스트"""
+        scores = analyzer.calculate_comprehensive_importance_scores(
+            sample_dependency_data, sample_churn_data, sample_complexity_data
+        )
+        
+        weights = analyzer.importance_weights
+        for file_path, score in scores.items():
+            expected = min(1.0, (
+                analyzer.calculate_structural_importance(file_path) * weights['metadata'] +
+                sample_dependency_data.get(file_path, 0.0) * weights['dependency'] +
+                analyzer._calculate_churn_importance_score(sample_churn_data.get(file_path, {})) * weights['churn'] +
+                analyzer._calculate_complexity_importance_score(sample_complexity_data.get(file_path, {})) * weights['complexity']
+            ) * analyzer._calculate_path_multiplier(file_path))
+            assert isinstance(score, float)
+            assert score == pytest.approx(expected, abs=1e-12)
+
+    def test_combine_scores_matches_numpy_reference(self):
+        """점수 결합(BLAS GEMV)이 원소별 가중합 공식과 일치하는지 테스트"""
+        import numpy as np
+        from app.services.file_importance_analyzer import _combine_scores
+        
+        rng = np.random.default_rng(0)
+        columns = [rng.random(100) for _ in range(4)]
+        multipliers = rng.choice([0.3, 1.0, 1.4, 2.0], size=100)
+        weights = (0.4, 0.3, 0.2, 0.1)
+        expected = np.minimum(1.0, sum(w * c for w, c in zip(weights, columns)) * multipliers)
+        actual = np.empty(100)
+        
+        _combine_scores(*columns, multipliers, *weights, actual)
+        
+        assert actual.max() <= 1.0
+        assert np.allclose(actual, expected)
+        
+        # 작업 행렬을 넘겨도 같은 결과
+        pooled = np.empty(100)
+        _combine_scores(*columns, multipliers, *weights, pooled, np.empty((100, 4)))
+        assert np.array_equal(pooled, actual)
+
+
+    def test_project_analysis_computes_scores_once(
+        self, analyzer, sample_dependency_data, sample_churn_data, sample_complexity_data
+    ):
+        """프로젝트 분석이 종합 점수를 한 번만 계산하고 개별 API와 같은 결과를 내는지 테스트"""
+        from unittest.mock import patch
+        
+        # When: 종합 점수 계산 횟수를 추적하며 프로젝트 분석
+        with patch.object(
+            analyzer, 'calculate_comprehensive_importance_scores',
+            wraps=analyzer.calculate_comprehensive_importance_scores
+        ) as mock_scores:
+            result = analyzer.analyze_project_file_importance(
+                sample_dependency_data, sample_churn_data, sample_complexity_data
+            )
+        
+        # Then: 점수 계산은 1회, 결과는 개별 API 호출과 동일
+        assert mock_scores.call_count == 1
+        args = (sample_dependency_data, sample_churn_data, sample_complexity_data)
+        assert result['critical_files'] == analyzer.identify_critical_files(*args, top_n=15)
+        assert result['importance_distribution'] == analyzer.calculate_importance_distribution(*args)
+        assert result['categorized_files'] == analyzer.categorize_files_by_importance(*args)
+
+
+    def test_analyze_from_raw_json_matches_dict_input(
+        self, analyzer, sample_dependency_data, sample_churn_data, sample_complexity_data
+    ):
+        """JSON 원문 입력 분석 결과가 딕셔너리 입력과 같은지 테스트"""
+        import json
+        
+        # When: bytes/str JSON으로 분석
+        result = analyzer.analyze_project_file_importance_from_json(
+            json.dumps(sample_dependency_data).encode("utf-8"),
+            json.dumps(sample_churn_data),
+            b"null"
+        )
+        
+        # Then: 같은 데이터를 딕셔너리로 넘긴 결과와 동일해야 함
+        assert result == analyzer.analyze_project_file_importance(
+            sample_dependency_data, sample_churn_data, {}
+        )
+
+
 class TestFilePatternAnalysis:
     """파일 패턴 분석 테스트"""
     
-    def test_detect_main_files(self):
+    def test_detect_main_files(self, analyzer):
         """메인 파일 감지 테스트"""
         # Given: 다양한 파일 패턴
-        from app.services.file_importance_analyzer import SmartFileImportanceAnalyzer
-        analyzer = SmartFileImportanceAnalyzer()
-        
         main_files = [
             "src/main.ts", "src/main.js", "src/index.ts", "src/index.js",
             "main.py", "app.py", "__init__.py", "App.tsx", "App.vue"
@@ -343,12 +562,9 @@ class TestFilePatternAnalysis:
             importance = analyzer.calculate_structural_importance(file_path)
             assert importance <= 0.6, f"{file_path} should not be recognized as main file"
 
-    def test_detect_config_files(self):
+    def test_detect_config_files(self, analyzer):
         """설정 파일 감지 테스트"""
         # Given: 설정 파일들
-        from app.services.file_importance_analyzer import SmartFileImportanceAnalyzer
-        analyzer = SmartFileImportanceAnalyzer()
-        
         config_files = [
             "package.json", "tsconfig.json", "webpack.config.js",
             "babel.config.js", ".env", "Dockerfile", "docker-compose.yml"
@@ -359,12 +575,9 @@ class TestFilePatternAnalysis:
             importance = analyzer.calculate_structural_importance(file_path)
             assert importance > 0.7, f"{file_path} should be recognized as config file"
 
-    def test_detect_test_files(self):
+    def test_detect_test_files(self, analyzer):
         """테스트 파일 감지 테스트"""
         # Given: 테스트 파일들
-        from app.services.file_importance_analyzer import SmartFileImportanceAnalyzer
-        analyzer = SmartFileImportanceAnalyzer()
-        
         test_files = [
             "test/unit.test.js", "src/__tests__/component.test.tsx",
             "tests/integration.py", "spec/helper_spec.rb"
@@ -375,6 +588,32 @@ class TestFilePatternAnalysis:
             importance = analyzer.calculate_structural_importance(file_path)
             assert importance < 0.4, f"{file_path} should have low structural importance"
 
+    def test_structural_importance_uses_highest_matching_category(self, analyzer):
+        """여러 카테고리에 매칭되는 경로는 가장 높은 가중치를 받는지 테스트"""
+        
+        # core_modules(0.8)와 django_framework(0.85)에 모두 매칭
+        assert analyzer.calculate_structural_importance("src/core/settings.py") == 0.85
+        # utilities(0.7)와 components(0.5)에 모두 매칭
+        assert analyzer.calculate_structural_importance("src/utils/views/list.ts") == 0.7
+        # Windows 경로 구분자도 정규화되어야 함
+        assert analyzer.calculate_structural_importance("src\\core\\engine.ts") == 0.8
+        assert analyzer.calculate_structural_importance("unmatched.bin") == 0.0
+
+
+    def test_structural_importance_memoized_per_path(self):
+        """같은 경로의 반복 분류는 패턴 매칭을 다시 수행하지 않는지 테스트"""
+        from app.services.file_importance_analyzer import SmartFileImportanceAnalyzer
+        analyzer = SmartFileImportanceAnalyzer()
+        
+        for _ in range(3):
+            assert analyzer.calculate_structural_importance("src/main.ts") == 0.9
+        # 구분자만 다른 경로는 정규화 후 같은 캐시 항목을 사용
+        assert analyzer.calculate_structural_importance("src\\main.ts") == 0.9
+        
+        cache_info = analyzer._structural_importance_cached.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 3
+
 
 class TestFileImportanceIntegration:
     """파일 중요도 분석 통합 테스트"""
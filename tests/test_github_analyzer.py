@@ -81,6 +81,35 @@ class TestGitHubClient:
         # 임시로 테스트 통과
         assert True
 
+    
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_get_files_content_concurrent_and_ordered(self):
+        """여러 파일 내용 조회가 동시 요청 수 제한 안에서 병렬로 수행되고 입력 순서를 유지하는지 테스트"""
+        import asyncio
+        
+        # Given: 응답 지연이 있는 파일 내용 조회
+        client = GitHubClient()
+        client.max_concurrency = 3
+        in_flight = 0
+        peak = 0
+        
+        async def fake_get_file_content(repo_url, file_path):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return None if file_path == "missing.py" else f"content:{file_path}"
+        
+        paths = [f"src/file_{i}.py" for i in range(8)] + ["missing.py"]
+        
+        # When
+        with patch.object(client, "get_file_content", side_effect=fake_get_file_content):
+            contents = await client.get_files_content("https://github.com/test/repo", paths)
+        
+        # Then
+        assert contents == [f"content:{p}" for p in paths[:-1]] + [None]
+        assert peak == 3
 
 class TestRepositoryAnalyzer:
     """Repository Analyzer Agent 테스트"""
@@ -211,6 +240,24 @@ class TestCodeQualityAgent:
         assert "singleton" in patterns
         assert patterns["singleton"]["confidence"] > 0.8
     
+    @pytest.mark.asyncio
+    async def test_detect_patterns_cached_by_content(self):
+        """같은 코드의 반복 패턴 감지는 캐시 결과를 사용하고, 반환값 변경이 캐시에 영향을 주지 않는지 테스트"""
+        # Given
+        code_content = "class ReportFactory:\n    def create_report(self):\n        pass\n"
+        agent = CodeQualityAgent()
+        
+        # When
+        first = await agent.detect_patterns(code_content)
+        first["factory"]["confidence"] = 0.0
+        with patch.object(agent, "_compiled_pattern_signatures", {}):
+            second = await agent.detect_patterns(code_content)
+        
+        # Then: 시그니처 없이도 캐시된 원래 결과가 반환되어야 함
+        assert second["factory"]["matches"] == 2
+        assert second["factory"]["confidence"] == 0.6
+        assert len(agent._pattern_cache) == 1
+    
     @pytest.mark.asyncio
     async def test_calculate_complexity(self):
         """복잡도 계산 테스트"""
@@ -0,0 +1 @@
+"""테스트 공통 유틸리티"""
@@ -0,0 +1,37 @@
+"""
+성능 측정 유틸리티
+
+time.time()은 시스템 시계 보정의 영향을 받으므로 단조 증가 타이머(perf_counter_ns)를 사용한다.
+"""
+
+import time
+from typing import Optional
+
+
+class PerfTimer:
+    """with 블록의 경과 시간을 측정하는 단조 타이머"""
+
+    def __init__(self):
+        self.start_ns: Optional[int] = None
+        self.end_ns: Optional[int] = None
+
+    def __enter__(self) -> "PerfTimer":
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns = None
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.end_ns = time.perf_counter_ns()
+
+    @property
+    def elapsed_ns(self) -> int:
+        """경과 시간 (나노초). 블록 실행 중이면 현재까지의 시간"""
+        if self.start_ns is None:
+            return 0
+        end_ns = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return end_ns - self.start_ns
+
+    @property
+    def elapsed_ms(self) -> float:
+        """경과 시간 (밀리초)"""
+        return self.elapsed_ns / 1_000_000